@@ -6,12 +6,22 @@ Applies pending migrations in lexical order, verifies checksums to detect
 tampering, and tracks applied migrations in schema_migrations table.
 """
 
+import functools
 import hashlib
+import os
 import sqlite3
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+# Journal settings for the production database; callers with throwaway
+# databases (tests) can pass cheaper ones to apply_migrations.
+DEFAULT_PRAGMAS: Dict[str, str] = {"journal_mode": "WAL", "synchronous": "NORMAL"}
+
+_sha256 = hashlib.sha256
+# Files below this size are read and hashed in one call.
+_SMALL_FILE_BYTES = 64 * 1024
 
 
 def calculate_checksum(file_path: Path) -> str:
@@ -24,10 +34,21 @@ def calculate_checksum(file_path: Path) -> str:
     Returns:
         Hexadecimal SHA-256 checksum
     """
-    sha256 = hashlib.sha256()
-    with open(file_path, 'rb') as f:
-        sha256.update(f.read())
-    return sha256.hexdigest()
+    # Unchanged files (same mtime and size) are not re-read within a process.
+    stat = os.stat(file_path)
+    return _checksum_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=512)
+def _checksum_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Hash a file; mtime_ns and size only key the cache."""
+    with open(path, 'rb') as f:
+        # Typical migrations fit in one read, hashed in a single call.
+        if size < _SMALL_FILE_BYTES:
+            return _sha256(f.read()).hexdigest()
+        # file_digest streams larger files straight into the hash without
+        # building one bytes object for the whole file.
+        return hashlib.file_digest(f, 'sha256').hexdigest()
 
 
 def discover_migrations(migrations_dir: Path) -> List[Tuple[str, Path]]:
@@ -40,22 +61,51 @@ def discover_migrations(migrations_dir: Path) -> List[Tuple[str, Path]]:
     Returns:
         List of (migration_name, migration_path) tuples in lexical order
     """
-    migration_files = sorted(migrations_dir.glob("*.sql"))
+    # One scandir pass; only matching entries are wrapped in Path objects.
     # Exclude schema_migrations.sql if it exists (not a migration)
-    return [
-        (f.name, f)
-        for f in migration_files
-        if f.name != "schema_migrations.sql"
-    ]
+    with os.scandir(migrations_dir) as entries:
+        migrations = [
+            (entry.name, Path(entry.path))
+            for entry in entries
+            if entry.name.endswith(".sql")
+            and entry.name != "schema_migrations.sql"
+            and entry.is_file()
+        ]
+    migrations.sort()
+    return migrations
+
+
+def migrations_fingerprint(migrations: List[Tuple[str, Path]]) -> int:
+    """
+    Fingerprint a migration set by names and checksums.
+
+    Stored in PRAGMA user_version after a successful run, so the value is a
+    positive 31-bit integer (never 0, the user_version of a fresh database).
+
+    Args:
+        migrations: (migration_name, migration_path) tuples in apply order
+
+    Returns:
+        Fingerprint in the range [1, 2**31 - 1]
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for name, path in migrations:
+        digest.update(name.encode())
+        digest.update(calculate_checksum(path).encode())
+    return int.from_bytes(digest.digest(), "big") % 0x7FFFFFFF + 1
 
 
-def apply_migrations(db_path: Path, migrations_dir: Path) -> None:
+def apply_migrations(
+    db_path: Path, migrations_dir: Path, pragmas: Optional[Dict[str, str]] = None
+) -> None:
     """
     Apply pending migrations with checksum verification.
 
     Args:
         db_path: Path to SQLite database file
         migrations_dir: Directory containing migration files
+        pragmas: PRAGMA name -> value applied before migrating
+            (defaults to DEFAULT_PRAGMAS)
 
     Raises:
         RuntimeError: If migration checksum verification fails (tamper detection)
@@ -63,9 +113,24 @@ def apply_migrations(db_path: Path, migrations_dir: Path) -> None:
     # Ensure database directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Connect to database
-    conn = sqlite3.connect(str(db_path))
+    # Connect to database. In autocommit mode sqlite3 issues no implicit
+    # BEGIN/COMMIT (not even in executescript), so all pending migrations
+    # can share the one explicit transaction below.
+    conn = sqlite3.connect(str(db_path), autocommit=True)
     conn.execute("PRAGMA foreign_keys=ON")
+    for name, value in (DEFAULT_PRAGMAS if pragmas is None else pragmas).items():
+        conn.execute(f"PRAGMA {name}={value}")
+
+    # Discover all migrations
+    migrations = discover_migrations(migrations_dir)
+    fingerprint = migrations_fingerprint(migrations) if migrations else None
+
+    # Same migration set as the last successful run: nothing to apply, and
+    # matching checksums mean nothing was tampered with either.
+    if fingerprint is not None and conn.execute("PRAGMA user_version").fetchone()[0] == fingerprint:
+        print(f"✓ All {len(migrations)} migrations already applied")
+        conn.close()
+        return
 
     # Create schema_migrations table if not exists
     conn.execute("""
@@ -75,7 +140,6 @@ def apply_migrations(db_path: Path, migrations_dir: Path) -> None:
             applied_at INTEGER NOT NULL
         ) STRICT
     """)
-    conn.commit()
 
     # Get applied migrations
     applied = {
@@ -85,15 +149,12 @@ def apply_migrations(db_path: Path, migrations_dir: Path) -> None:
         )
     }
 
-    # Discover all migrations
-    migrations = discover_migrations(migrations_dir)
-
     if not migrations:
         print(f"No migrations found in {migrations_dir}")
         conn.close()
         return
 
-    applied_count = 0
+    pending = []
     skipped_count = 0
 
     for name, path in migrations:
@@ -112,24 +173,33 @@ def apply_migrations(db_path: Path, migrations_dir: Path) -> None:
             skipped_count += 1
             continue
 
-        # Apply new migration
-        print(f"→ Applying migration: {name}")
-        checksum = calculate_checksum(path)
+        pending.append((name, path))
 
-        try:
-            with conn:  # Transaction
+    if pending:
+        # One transaction (and one commit) for every pending migration
+        conn.execute("BEGIN IMMEDIATE")
+        for name, path in pending:
+            print(f"→ Applying migration: {name}")
+            checksum = calculate_checksum(path)
+
+            try:
                 conn.executescript(path.read_text())
                 conn.execute(
                     "INSERT INTO schema_migrations (migration_name, checksum, applied_at) VALUES (?, ?, ?)",
                     (name, checksum, int(datetime.now().timestamp()))
                 )
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                conn.close()
+                print(f"✗ Failed to apply {name}: {e}", file=sys.stderr)
+                raise
             print(f"✓ Applied {name}")
-            applied_count += 1
-        except Exception as e:
-            conn.close()
-            print(f"✗ Failed to apply {name}: {e}", file=sys.stderr)
-            raise
+        conn.execute(f"PRAGMA user_version = {fingerprint}")
+        conn.execute("COMMIT")
+    else:
+        conn.execute(f"PRAGMA user_version = {fingerprint}")
 
+    applied_count = len(pending)
     conn.close()
 
     # Summary
@@ -636,7 +636,7 @@ class BrokerRouter:
                     timeout_seconds=int(params.get("timeout_seconds", timeout)),
                 )
             if action == "list_snapshots":
-                snapshots = self.snapshot_manager.list_snapshots(params["repo_path"])
+                snapshots = await self.snapshot_manager.list_snapshots(params["repo_path"])
                 return {"snapshots": snapshots, "total_count": len(snapshots)}
             if action == "prune_snapshots":
                 if "retention_days" in params and params.get("retention_days") is not None:
@@ -1,13 +1,21 @@
 """Path validation against configured scope roots."""
 
 import os
+import re
 from pathlib import Path
 from typing import Any, List
 
+# Absolute system locations that are rejected before touching the filesystem,
+# matched against the path with separators already normalized to "/".
+_SYSTEM_PATH_RE = re.compile(r"^(?:/(?:etc|proc|sys|dev|boot)|[A-Za-z]:/(?i:windows))(?:/|$)")
+
 
 class ScopeValidator:
     """Validates file paths against configured scope roots."""
 
+    # Home directory, looked up once rather than on every validate_path call
+    _HOME = os.path.expanduser("~")
+
     def __init__(self, allowed_roots: List[str]):
         """
         Initialize scope validator.
@@ -16,13 +24,35 @@ class ScopeValidator:
             allowed_roots: List of allowed root directories (e.g., ["~/Projects", "~/Notes"])
         """
         # Normalize and resolve scope roots (expand ~, resolve symlinks)
-        self.allowed_roots = [self._normalize_path(root) for root in allowed_roots]
+        resolved_roots = [self._resolve(root) for root in allowed_roots]
+        self.allowed_roots = [Path(root) for root in resolved_roots]
+        # Canonical roots as strings, so validate_path is one set lookup plus
+        # one str.startswith over all "<root>/" prefixes.
+        self._root_set = frozenset(resolved_roots)
+        self._root_prefixes = tuple(os.path.join(root, "") for root in resolved_roots)
+        # The system-path prefilter is only safe while no root lives inside one
+        self._fast_deny = (
+            None if any(_SYSTEM_PATH_RE.match(root) for root in resolved_roots) else _SYSTEM_PATH_RE
+        )
+
+    def _resolve(self, path: str, base_dir: str | None = None) -> str:
+        """Normalize path separators, expand user home, and resolve to a canonical string.
+
+        Relative paths are resolved against base_dir, or the working directory if None.
+        """
+        normalized = path.replace("\\", "/")
+        if normalized == "~" or normalized.startswith("~/"):
+            expanded = self._HOME + normalized[1:]
+        else:
+            # "~user" forms still need a password database lookup
+            expanded = os.path.expanduser(normalized)
+        if base_dir is not None and not os.path.isabs(expanded):
+            expanded = os.path.join(base_dir, expanded)
+        return os.path.realpath(expanded)
 
     def _normalize_path(self, path: str) -> Path:
         """Normalize path separators, expand user home, and resolve safely."""
-        normalized = path.replace("\\", "/")
-        expanded = os.path.expanduser(normalized)
-        return Path(expanded).resolve(strict=False)
+        return Path(self._resolve(path))
 
     def _coerce_to_path_string(self, path: Any) -> str:
         """Convert supported path input to string."""
@@ -50,7 +80,7 @@ class ScopeValidator:
         except (TypeError, ValueError, RuntimeError):
             return None
 
-    def validate_path(self, path: Any) -> tuple[bool, str]:
+    def validate_path(self, path: Any, base_dir: str | None = None) -> tuple[bool, str]:
         """
         Validate that path is within allowed scope roots.
 
@@ -60,6 +90,8 @@ class ScopeValidator:
 
         Args:
             path: File path to validate
+            base_dir: Directory relative paths are resolved against
+                (defaults to the current working directory)
 
         Returns:
             Tuple of (is_valid, error_message)
@@ -75,18 +107,17 @@ class ScopeValidator:
         if not path_str:
             return False, "Path outside allowed scope: empty path"
 
+        if self._fast_deny is not None and self._fast_deny.match(path_str.replace("\\", "/")):
+            return False, f"Path outside allowed scope: {path_str}"
+
         try:
-            normalized = self._normalize_path(path_str)
-        except (ValueError, RuntimeError) as e:
+            normalized = self._resolve(path_str, base_dir)
+        except (ValueError, RuntimeError, OSError) as e:
             return False, f"Invalid path: {e}"
 
-        # Check if normalized path starts with any allowed root
-        for root in self.allowed_roots:
-            try:
-                normalized.relative_to(root)
-                return True, ""  # Path is within allowed scope
-            except ValueError:
-                continue  # Try next root
+        # Check if normalized path is an allowed root or lies beneath one
+        if normalized in self._root_set or normalized.startswith(self._root_prefixes):
+            return True, ""  # Path is within allowed scope
 
         # Path not within any allowed root
         return False, f"Path outside allowed scope: {path_str}"
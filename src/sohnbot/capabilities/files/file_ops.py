@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import os
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -11,6 +12,12 @@ from typing import Any
 
 EXCLUDED_DIRS = {".git", ".venv", "node_modules"}
 
+# Directory listings are cached by directory mtime. Listings whose mtime is
+# this recent are not cached, since coarse filesystem timestamps could hide a
+# change made within the same tick.
+DIR_CACHE_RACY_WINDOW_NS = 2_000_000_000
+DIR_CACHE_MAX_ENTRIES = 4096
+
 
 @dataclass
 class FileCapabilityError(Exception):
@@ -35,6 +42,8 @@ class FileOps:
 
     def __init__(self, excluded_dirs: set[str] | None = None):
         self.excluded_dirs = excluded_dirs or EXCLUDED_DIRS
+        # abs dir path -> (dir mtime_ns, subdir names, file names)
+        self._dir_cache: dict[str, tuple[int, list[str], list[str]]] = {}
 
     def list_files(self, path: str) -> dict[str, Any]:
         """Recursively list files with metadata, excluding traversal dirs."""
@@ -55,11 +64,16 @@ class FileOps:
             )
 
         files: list[dict[str, Any]] = []
-        for current_root, dirs, filenames in os.walk(root):
-            # Prune excluded directories from traversal.
-            dirs[:] = [d for d in dirs if d not in self.excluded_dirs]
+        # Top-down walk in the same order as os.walk (symlinked dirs not followed).
+        pending = [root]
+        while pending:
+            current_path = pending.pop()
+            try:
+                dirs, filenames = self._list_dir(current_path)
+            except OSError:
+                # Unreadable directory: skip it, as os.walk does.
+                continue
 
-            current_path = Path(current_root)
             for name in filenames:
                 file_path = current_path / name
                 stat_result = file_path.stat()
@@ -71,8 +85,41 @@ class FileOps:
                     }
                 )
 
+            # Prune excluded directories from traversal.
+            pending.extend(
+                current_path / d for d in reversed(dirs) if d not in self.excluded_dirs
+            )
+
         return {"files": files, "count": len(files)}
 
+    def _list_dir(self, directory: Path) -> tuple[list[str], list[str]]:
+        """Return (subdir names, file names) of a directory.
+
+        Listings are cached until the directory's mtime changes. File metadata
+        is never cached, so in-place edits are always reflected by the caller.
+        """
+        key = os.path.abspath(directory)
+        mtime_ns = os.stat(key).st_mtime_ns
+        cached = self._dir_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1], cached[2]
+
+        dirs: list[str] = []
+        filenames: list[str] = []
+        with os.scandir(key) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if not entry.is_symlink():
+                        dirs.append(entry.name)
+                else:
+                    filenames.append(entry.name)
+
+        if time.time_ns() - mtime_ns > DIR_CACHE_RACY_WINDOW_NS:
+            if len(self._dir_cache) >= DIR_CACHE_MAX_ENTRIES:
+                self._dir_cache.clear()
+            self._dir_cache[key] = (mtime_ns, dirs, filenames)
+        return dirs, filenames
+
     def read_file(self, path: str, max_size_mb: int = 10) -> dict[str, Any]:
         """Read UTF-8 text file contents with binary/size safeguards."""
         file_path = Path(path)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Sequence
 from pathlib import Path
 import re
 from typing import Any
@@ -10,12 +11,13 @@ from typing import Any
 from .snapshot_manager import GitCapabilityError
 
 
-async def _run_git_command(
-    cmd: list[str],
+async def _run_git_command_bytes(
+    cmd: Sequence[str],
     repo_path: str,
     timeout_seconds: int,
     timeout_code: str,
-) -> tuple[str, str]:
+) -> tuple[bytes, str]:
+    """Run a git command and return raw stdout with decoded, stripped stderr."""
     try:
         process = await asyncio.create_subprocess_exec(
             *cmd,
@@ -34,10 +36,8 @@ async def _run_git_command(
         ) from exc
 
     try:
-        stdout_b, stderr_b = await asyncio.wait_for(
-            process.communicate(),
-            timeout=timeout_seconds,
-        )
+        async with asyncio.timeout(timeout_seconds):
+            stdout_b, stderr_b = await process.communicate()
     except asyncio.TimeoutError as exc:
         process.kill()
         await process.wait()
@@ -48,7 +48,6 @@ async def _run_git_command(
             retryable=True,
         ) from exc
 
-    stdout = stdout_b.decode("utf-8", errors="replace")
     stderr = stderr_b.decode("utf-8", errors="replace").strip()
     if process.returncode != 0:
         lower = stderr.lower()
@@ -66,10 +65,48 @@ async def _run_git_command(
             retryable=False,
         )
 
-    return stdout, stderr
+    return stdout_b, stderr
+
+
+async def _run_git_command(
+    cmd: Sequence[str],
+    repo_path: str,
+    timeout_seconds: int,
+    timeout_code: str,
+) -> tuple[str, str]:
+    stdout_b, stderr = await _run_git_command_bytes(
+        cmd=cmd,
+        repo_path=repo_path,
+        timeout_seconds=timeout_seconds,
+        timeout_code=timeout_code,
+    )
+    return stdout_b.decode("utf-8", errors="replace"), stderr
+
+
+def _decode_path(raw: bytes) -> str:
+    return raw.strip().decode("utf-8", errors="replace")
+
+
+def _extract_path(line: bytes) -> bytes:
+    # Official porcelain v2 record paths are tab-delimited after metadata.
+    if b"\t" in line:
+        path_block = line.split(b"\t", 1)[1]
+        # Rename/copy records can include "old\tnew"; prefer destination path.
+        return path_block.rsplit(b"\t", 1)[-1]
+
+    # Space-separated records: "1 ..." has the path as 9th field, "2 ..." as 10th.
+    fields = 9 if line[:2] == b"1 " else 10
+    parts = line.split(b" ", fields - 1)
+    if len(parts) == fields:
+        return parts[-1]
+    return line.rsplit(b" ", 1)[-1]
+
 
+def _parse_porcelain_v2(output: bytes) -> dict[str, Any]:
+    """Parse ``git status --porcelain=v2 --branch`` output.
 
-def _parse_porcelain_v2(output: str) -> dict[str, Any]:
+    Works on raw bytes; only branch names and paths are decoded.
+    """
     branch = "HEAD"
     ahead = 0
     behind = 0
@@ -77,53 +114,29 @@ def _parse_porcelain_v2(output: str) -> dict[str, Any]:
     staged: list[str] = []
     untracked: list[str] = []
 
-    def _extract_path(line: str) -> str:
-        # Official porcelain v2 record paths are tab-delimited after metadata.
-        if "\t" in line:
-            path_block = line.split("\t", 1)[1]
-            # Rename/copy records can include "old\tnew"; prefer destination path.
-            if "\t" in path_block:
-                return path_block.split("\t")[-1].strip()
-            return path_block.strip()
-
-        # Fallback for non-tab fixtures: parse using field counts.
-        # Format "1 ..." has path as 9th token, "2 ..." has path as 10th token.
-        tokens = line.split()
-        if not tokens:
-            return ""
-        if tokens[0] == "1" and len(tokens) >= 9:
-            return tokens[8]
-        if tokens[0] == "2" and len(tokens) >= 10:
-            return tokens[9]
-        return tokens[-1]
-
-    for raw_line in output.splitlines():
-        line = raw_line.rstrip("\n")
-        if not line:
-            continue
-        if line.startswith("# branch.head "):
-            branch = line[len("# branch.head "):].strip()
-            continue
-        if line.startswith("# branch.ab "):
-            ab = line[len("# branch.ab "):].strip().split()
-            for part in ab:
-                if part.startswith("+"):
-                    ahead = int(part[1:])
-                elif part.startswith("-"):
-                    behind = int(part[1:])
-            continue
-        if line.startswith("? "):
-            untracked.append(line[2:].strip())
-            continue
-        if line.startswith("1 ") or line.startswith("2 "):
+    for line in output.splitlines():
+        tag = line[:2]
+        if tag == b"# ":
+            if line.startswith(b"# branch.head "):
+                branch = line[14:].strip().decode("utf-8", errors="replace")
+            elif line.startswith(b"# branch.ab "):
+                for part in line[12:].split():
+                    if part[:1] == b"+":
+                        ahead = int(part[1:])
+                    elif part[:1] == b"-":
+                        behind = int(part[1:])
+        elif tag == b"1 " or tag == b"2 ":
             # Porcelain v2 tokens: type + XY + metadata + path(s)
-            status = line.split(" ", 2)[1]
-            xy = status if len(status) >= 2 else ".."
-            path = _extract_path(line)
-            if xy[0] != "." and path not in staged:
+            xy = line[2:4]
+            if len(xy) < 2 or b" " in xy:
+                xy = b".."
+            path = _decode_path(_extract_path(line))
+            if xy[:1] != b"." and path not in staged:
                 staged.append(path)
-            if xy[1] != "." and path not in modified:
+            if xy[1:2] != b"." and path not in modified:
                 modified.append(path)
+        elif tag == b"? ":
+            untracked.append(_decode_path(line[2:]))
 
     return {
         "branch": branch,
@@ -137,8 +150,8 @@ def _parse_porcelain_v2(output: str) -> dict[str, Any]:
 
 async def git_status(repo_path: str, timeout_seconds: int = 10) -> dict[str, Any]:
     """Return machine-parsed git status for the repository."""
-    cmd = ["git", "-C", repo_path, "status", "--porcelain=v2", "--branch"]
-    stdout, _ = await _run_git_command(
+    cmd = ("git", "-C", repo_path, "status", "--porcelain=v2", "--branch")
+    stdout, _ = await _run_git_command_bytes(
         cmd=cmd,
         repo_path=repo_path,
         timeout_seconds=timeout_seconds,
@@ -241,7 +254,7 @@ async def git_checkout(
 
     try:
         await _run_git_command(
-            cmd=["git", "-C", repo_path, "switch", "--", branch_name],
+            cmd=("git", "-C", repo_path, "switch", "--", branch_name),
             repo_path=repo_path,
             timeout_seconds=timeout_seconds,
             timeout_code="checkout_timeout",
@@ -268,7 +281,7 @@ async def git_checkout(
         raise
 
     head_stdout, _ = await _run_git_command(
-        cmd=["git", "-C", repo_path, "rev-parse", "--short", "HEAD"],
+        cmd=("git", "-C", repo_path, "rev-parse", "--short", "HEAD"),
         repo_path=repo_path,
         timeout_seconds=5,
         timeout_code="checkout_timeout",
@@ -377,7 +390,7 @@ async def git_commit(
         for path in file_paths:
             normalized_path = _validate_commit_file_path(repo_path, path)
             await _run_git_command(
-                cmd=["git", "-C", repo_path, "add", "--", normalized_path],
+                cmd=("git", "-C", repo_path, "add", "--", normalized_path),
                 repo_path=repo_path,
                 timeout_seconds=10,
                 timeout_code="commit_timeout",
@@ -385,7 +398,7 @@ async def git_commit(
     else:
         # Safer default than add -A: stage tracked-file modifications/deletions only.
         await _run_git_command(
-            cmd=["git", "-C", repo_path, "add", "-u"],
+            cmd=("git", "-C", repo_path, "add", "-u"),
             repo_path=repo_path,
             timeout_seconds=10,
             timeout_code="commit_timeout",
@@ -393,7 +406,7 @@ async def git_commit(
 
     try:
         await _run_git_command(
-            cmd=["git", "-C", repo_path, "commit", "-m", message],
+            cmd=("git", "-C", repo_path, "commit", "-m", message),
             repo_path=repo_path,
             timeout_seconds=timeout_seconds,
             timeout_code="commit_timeout",
@@ -417,22 +430,19 @@ async def git_commit(
             raise
         raise
 
-    hash_stdout, _ = await _run_git_command(
-        cmd=["git", "-C", repo_path, "rev-parse", "--short", "HEAD"],
-        repo_path=repo_path,
-        timeout_seconds=5,
-        timeout_code="commit_timeout",
-    )
-    files_stdout, _ = await _run_git_command(
-        cmd=["git", "-C", repo_path, "diff-tree", "--no-commit-id", "--name-only", "-r", "HEAD"],
+    # One process for both the short hash and the changed file list:
+    # the first line is the hash, followed by a blank line and one path per line.
+    log_stdout, _ = await _run_git_command(
+        cmd=("git", "-C", repo_path, "log", "-1", "--format=%h", "--name-only", "HEAD"),
         repo_path=repo_path,
         timeout_seconds=5,
         timeout_code="commit_timeout",
     )
-    files_changed = len([line for line in files_stdout.splitlines() if line.strip()])
+    hash_line, _, files_block = log_stdout.partition("\n")
+    files_changed = len([line for line in files_block.splitlines() if line.strip()])
 
     return {
-        "commit_hash": hash_stdout.strip(),
+        "commit_hash": hash_line.strip(),
         "message": message,
         "files_changed": files_changed,
     }
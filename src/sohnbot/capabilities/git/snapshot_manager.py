@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import asyncio
+import functools
+import os
+import re
+import shutil
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# "<object id> refs/heads/snapshot/..." lines in packed-refs; peeled ("^")
+# and comment ("#") lines never match.
+_PACKED_SNAPSHOT_REF_RE = re.compile(
+    rb"^[0-9a-f]+ refs/heads/(snapshot/\S+)$", re.MULTILINE
+)
+
+# snapshot/edit-YYYY-MM-DD-HHMM, optionally followed by a "-suffix".
+_SNAPSHOT_TS_RE = re.compile(r"snapshot/edit-(\d{4})-(\d{2})-(\d{2})-(\d{2})(\d{2})(?:-|$)")
+
+# Fixed English month names, so listings do not depend on the process locale.
+_MONTH_ABBR = (
+    "", "Jan", "Feb", "Mar", "Apr", "May", "Jun",
+    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec",
+)
+
 
 @dataclass
 class GitCapabilityError(Exception):
@@ -31,9 +51,80 @@ class GitCapabilityError(Exception):
         }
 
 
+@functools.lru_cache(maxsize=1024)
+def _find_root_for_dir(dir_path: str) -> str:
+    """
+    Walk up from a resolved directory to the first one containing .git.
+
+    Results are cached per directory; misses raise LookupError, which
+    lru_cache does not cache, so a repository created later is still found.
+    """
+    current = Path(dir_path)
+    while True:
+        if (current / ".git").exists():
+            return str(current)
+        parent = current.parent
+        if parent == current:
+            # Reached filesystem root
+            raise LookupError(dir_path)
+        current = parent
+
+
+# Signature of asyncio.create_subprocess_exec, which SnapshotManager uses to
+# start git unless a runner is injected (tests pass a fake).
+SubprocessRunner = Callable[..., Awaitable[asyncio.subprocess.Process]]
+
+
+@functools.lru_cache(maxsize=8)
+def _which(name: str) -> str:
+    """
+    Absolute path of an executable on PATH; raises LookupError when missing.
+
+    Misses raise instead of returning, so lru_cache does not remember them.
+    """
+    path = shutil.which(name)
+    if path is None:
+        raise LookupError(name)
+    return path
+
+
 class SnapshotManager:
     """Creates git snapshot branches at HEAD before modification operations."""
 
+    def __init__(self, runner: SubprocessRunner | None = None) -> None:
+        # None resolves asyncio.create_subprocess_exec at call time.
+        self._runner = runner
+        # repo_path -> (ref storage stamp, snapshots) from the last listing.
+        self._list_cache: dict[str, tuple[tuple[int, ...], list[dict[str, Any]]]] = {}
+        # Serializes create_snapshot per repository.
+        self._repo_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        # repo_path -> unsuffixed branch name this manager created last.
+        self._last_snapshot_base: dict[str, str] = {}
+
+    async def _spawn(self, *cmd: str) -> asyncio.subprocess.Process:
+        """
+        Start cmd with stdin closed and piped stdout/stderr.
+
+        Without an injected runner the executable is resolved to an absolute
+        path first. subprocess only takes its posix_spawn fast path for such
+        paths; for a bare name it falls back to fork_exec and tries every
+        PATH entry on each call.
+        """
+        streams = {
+            "stdin": asyncio.subprocess.DEVNULL,
+            "stdout": asyncio.subprocess.PIPE,
+            "stderr": asyncio.subprocess.PIPE,
+        }
+        if self._runner is not None:
+            return await self._runner(*cmd, **streams)
+
+        try:
+            executable = _which(cmd[0])
+        except LookupError:
+            # Let the exec itself raise FileNotFoundError for the callers.
+            executable = cmd[0]
+        return await asyncio.create_subprocess_exec(executable, *cmd[1:], **streams)
+
     def find_repo_root(self, file_path: str) -> str:
         """
         Walk up from file_path to find the first directory containing .git/.
@@ -47,27 +138,21 @@ class SnapshotManager:
         Raises:
             GitCapabilityError: If no .git directory found
         """
-        current = Path(file_path).resolve()
+        current = os.path.realpath(file_path)
         # Start from parent if current is not a directory
         # (handles existing files, non-existent paths, and symlinks to files)
-        if not current.is_dir():
-            current = current.parent
-
-        while True:
-            if (current / ".git").exists():
-                return str(current)
-            parent = current.parent
-            if parent == current:
-                # Reached filesystem root
-                break
-            current = parent
-
-        raise GitCapabilityError(
-            code="not_a_git_repo",
-            message="No git repository found for the given path",
-            details={"path": file_path},
-            retryable=False,
-        )
+        if not os.path.isdir(current):
+            current = os.path.dirname(current)
+
+        try:
+            return _find_root_for_dir(current)
+        except LookupError:
+            raise GitCapabilityError(
+                code="not_a_git_repo",
+                message="No git repository found for the given path",
+                details={"path": file_path},
+                retryable=False,
+            ) from None
 
     async def create_snapshot(
         self,
@@ -80,6 +165,9 @@ class SnapshotManager:
 
         Branch naming: snapshot/edit-YYYY-MM-DD-HHMM
         On name collision (same minute): appends -{operation_id[:4]} suffix.
+        Calls for the same repository run one at a time, and a minute this
+        manager already used goes straight to the suffixed name instead of
+        spending a git call on the collision.
 
         Args:
             repo_path: Absolute path to the git repository root
@@ -92,20 +180,30 @@ class SnapshotManager:
         Raises:
             GitCapabilityError: On git failure, timeout, or missing git CLI
         """
-        branch_name = (
-            f"snapshot/edit-{datetime.now(timezone.utc).strftime('%Y-%m-%d-%H%M')}"
-        )
+        async with self._repo_locks[repo_path]:
+            base_name = (
+                f"snapshot/edit-{datetime.now(timezone.utc).strftime('%Y-%m-%d-%H%M')}"
+            )
+            suffixed_name = f"{base_name}-{operation_id[:4]}"
 
-        result = await self._run_git_branch(
-            repo_path, branch_name, timeout_seconds, required=False
-        )
+            if self._last_snapshot_base.get(repo_path) == base_name:
+                branch_name = suffixed_name
+                await self._run_git_branch(
+                    repo_path, branch_name, timeout_seconds, required=True
+                )
+            else:
+                branch_name = base_name
+                result = await self._run_git_branch(
+                    repo_path, branch_name, timeout_seconds, required=False
+                )
+                if result is None:
+                    # Name collision — append operation_id[:4] suffix and retry
+                    branch_name = suffixed_name
+                    await self._run_git_branch(
+                        repo_path, branch_name, timeout_seconds, required=True
+                    )
 
-        if result is None:
-            # Name collision — append operation_id[:4] suffix and retry
-            branch_name = f"{branch_name}-{operation_id[:4]}"
-            await self._run_git_branch(
-                repo_path, branch_name, timeout_seconds, required=True
-            )
+            self._last_snapshot_base[repo_path] = base_name
 
         logger.info(
             "snapshot_created",
@@ -114,6 +212,7 @@ class SnapshotManager:
             snapshot_ref=branch_name,
         )
 
+        self._list_cache.pop(repo_path, None)
         return branch_name
 
     async def _run_git_branch(
@@ -132,11 +231,7 @@ class SnapshotManager:
         cmd = ["git", "-C", repo_path, "branch", branch_name]
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            process = await self._spawn(*cmd)
         except FileNotFoundError as exc:
             raise GitCapabilityError(
                 code="git_not_found",
@@ -176,7 +271,7 @@ class SnapshotManager:
 
         return branch_name
 
-    def list_snapshots(self, repo_path: str) -> list[dict[str, Any]]:
+    async def list_snapshots(self, repo_path: str) -> list[dict[str, Any]]:
         """
         List all snapshot branches in the repository.
 
@@ -188,60 +283,32 @@ class SnapshotManager:
             Sorted by timestamp descending (newest first)
 
         Raises:
-            GitCapabilityError: If git command fails
-        """
-        import subprocess
-
-        cmd = ["git", "-C", repo_path, "branch", "--list", "snapshot/*"]
-
-        try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                check=False,
-                timeout=10,
-            )
-        except FileNotFoundError as exc:
-            raise GitCapabilityError(
-                code="git_not_found",
-                message="git CLI is required for snapshot operations",
-                details={"repo_path": repo_path},
-                retryable=False,
-            ) from exc
-        except subprocess.TimeoutExpired as exc:
-            raise GitCapabilityError(
-                code="list_snapshots_failed",
-                message="Git list snapshots command timed out",
-                details={"repo_path": repo_path},
-                retryable=True,
-            ) from exc
+            GitCapabilityError: If the repository's refs cannot be read
 
-        if result.returncode != 0:
-            raise GitCapabilityError(
-                code="list_snapshots_failed",
-                message="Failed to list snapshot branches",
-                details={
-                    "repo_path": repo_path,
-                    "stderr": result.stderr.decode("utf-8", errors="replace").strip(),
-                },
-                retryable=False,
+        Results are cached per repository until its ref storage changes, so
+        repeated listings neither re-read refs nor spawn git.
+        """
+        common_dir = self._resolve_common_dir(repo_path)
+        stamp = self._ref_storage_stamp(common_dir)
+        cached = self._list_cache.get(repo_path)
+        if cached is not None and cached[0] == stamp:
+            logger.info(
+                "snapshots_listed",
+                repo_path=repo_path,
+                snapshot_count=len(cached[1]),
+                cached=True,
             )
-
-        # Parse output: lines like "  snapshot/edit-YYYY-MM-DD-HHMM" or "  snapshot/edit-YYYY-MM-DD-HHMM-suffix"
-        output = result.stdout.decode("utf-8", errors="replace").strip()
-        if not output:
-            return []
+            return [dict(snap) for snap in cached[1]]
 
         snapshots = []
-        for line in output.split("\n"):
-            branch_name = line.strip()
-            if not branch_name:
-                continue
-
+        for branch_name in await self._read_snapshot_refs(repo_path, common_dir):
             # Parse timestamp from branch name: snapshot/edit-YYYY-MM-DD-HHMM(-suffix)?
             try:
                 dt = self._parse_snapshot_datetime(branch_name)
-                formatted = dt.strftime("%b %d, %Y %H:%M UTC")
+                formatted = (
+                    f"{_MONTH_ABBR[dt.month]} {dt.day:02d}, {dt.year} "
+                    f"{dt.hour:02d}:{dt.minute:02d} UTC"
+                )
                 snapshots.append({
                     "ref": branch_name,
                     "timestamp": formatted,
@@ -271,10 +338,162 @@ class SnapshotManager:
             "snapshots_listed",
             repo_path=repo_path,
             snapshot_count=len(snapshots),
+            cached=False,
         )
 
+        self._list_cache[repo_path] = (stamp, [dict(snap) for snap in snapshots])
         return snapshots
 
+    @staticmethod
+    def _ref_storage_stamp(common_dir: Path) -> tuple[int, ...]:
+        """
+        Modification times of the ref storage that changes with snapshot branches.
+
+        Adding or deleting a loose snapshot ref updates refs/heads/snapshot,
+        packing or deleting a packed one rewrites packed-refs, and reftable
+        updates rewrite reftable/tables.list. Missing paths count as 0.
+        """
+        stamp = []
+        for path in (
+            common_dir / "packed-refs",
+            common_dir / "refs" / "heads" / "snapshot",
+            common_dir / "reftable" / "tables.list",
+        ):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                stamp.append(0)
+        return tuple(stamp)
+
+    async def _read_snapshot_refs(self, repo_path: str, common_dir: Path) -> list[str]:
+        """
+        Read snapshot branch names straight from the repository's ref storage.
+
+        Loose refs under refs/heads/snapshot/ and entries in packed-refs are
+        merged without spawning git. Repositories using the reftable backend
+        fall back to an async `git for-each-ref`.
+        """
+        if (common_dir / "reftable").is_dir():
+            return await self._list_snapshot_refs_via_git(repo_path)
+
+        heads_dir = common_dir / "refs" / "heads"
+        names: set[str] = set()
+        try:
+            for dirpath, _, filenames in os.walk(heads_dir / "snapshot"):
+                prefix = Path(dirpath).relative_to(heads_dir).as_posix()
+                names.update(
+                    f"{prefix}/{filename}"
+                    for filename in filenames
+                    if not filename.endswith(".lock")
+                )
+            try:
+                packed = (common_dir / "packed-refs").read_bytes()
+            except FileNotFoundError:
+                packed = b""
+        except OSError as exc:
+            raise GitCapabilityError(
+                code="list_snapshots_failed",
+                message="Failed to list snapshot branches",
+                details={"repo_path": repo_path, "error": str(exc)},
+                retryable=False,
+            ) from exc
+
+        names.update(
+            match.decode("utf-8", errors="replace")
+            for match in _PACKED_SNAPSHOT_REF_RE.findall(packed)
+        )
+        return sorted(names)
+
+    @staticmethod
+    def _resolve_common_dir(repo_path: str) -> Path:
+        """
+        Locate the git directory holding the repository's branch refs.
+
+        Handles both a regular .git directory and the "gitdir: <path>" file
+        used by linked worktrees and submodules, whose refs/heads live in the
+        directory named by the gitdir's commondir file.
+        """
+        dot_git = Path(repo_path) / ".git"
+        try:
+            if dot_git.is_dir():
+                return dot_git
+            content = dot_git.read_text(encoding="utf-8").strip()
+        except OSError as exc:
+            raise GitCapabilityError(
+                code="list_snapshots_failed",
+                message="Failed to list snapshot branches",
+                details={"repo_path": repo_path, "error": "not a git repository"},
+                retryable=False,
+            ) from exc
+
+        if not content.startswith("gitdir:"):
+            raise GitCapabilityError(
+                code="list_snapshots_failed",
+                message="Failed to list snapshot branches",
+                details={"repo_path": repo_path, "error": "invalid .git file"},
+                retryable=False,
+            )
+        git_dir = Path(repo_path) / content[len("gitdir:"):].strip()
+        try:
+            common = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return git_dir
+        except OSError as exc:
+            raise GitCapabilityError(
+                code="list_snapshots_failed",
+                message="Failed to list snapshot branches",
+                details={"repo_path": repo_path, "error": str(exc)},
+                retryable=False,
+            ) from exc
+        return git_dir / common
+
+    async def _list_snapshot_refs_via_git(
+        self, repo_path: str, timeout_seconds: int = 10
+    ) -> list[str]:
+        """List snapshot branch names with `git for-each-ref` (reftable repos)."""
+        cmd = [
+            "git", "-C", repo_path, "for-each-ref",
+            "--format=%(refname:short)", "refs/heads/snapshot/",
+        ]
+
+        try:
+            process = await self._spawn(*cmd)
+        except FileNotFoundError as exc:
+            raise GitCapabilityError(
+                code="git_not_found",
+                message="git CLI is required for snapshot operations",
+                details={"repo_path": repo_path},
+                retryable=False,
+            ) from exc
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                process.communicate(), timeout=timeout_seconds
+            )
+        except asyncio.TimeoutError as exc:
+            process.kill()
+            await process.wait()
+            raise GitCapabilityError(
+                code="list_snapshots_failed",
+                message="Git list snapshots command timed out",
+                details={"repo_path": repo_path},
+                retryable=True,
+            ) from exc
+
+        if process.returncode != 0:
+            raise GitCapabilityError(
+                code="list_snapshots_failed",
+                message="Failed to list snapshot branches",
+                details={
+                    "repo_path": repo_path,
+                    "stderr": stderr.decode("utf-8", errors="replace").strip(),
+                },
+                retryable=False,
+            )
+
+        output = stdout.decode("utf-8", errors="replace")
+        return [line.strip() for line in output.splitlines() if line.strip()]
+
     async def prune_snapshots(
         self,
         repo_path: str,
@@ -358,6 +577,9 @@ class SnapshotManager:
                     stderr=stderr_text,
                 )
 
+        if pruned_refs:
+            self._list_cache.pop(repo_path, None)
+
         result = {
             "pruned_count": len(pruned_refs),
             "pruned_refs": pruned_refs,
@@ -373,18 +595,11 @@ class SnapshotManager:
         return result
 
     def _parse_snapshot_datetime(self, snapshot_ref: str) -> datetime:
-        parts = snapshot_ref.split("snapshot/edit-")[1]
-        timestamp_parts = parts.split("-")
-        if len(timestamp_parts) < 4:
+        match = _SNAPSHOT_TS_RE.search(snapshot_ref)
+        if match is None:
             raise ValueError("invalid snapshot timestamp format")
-        date_text = (
-            f"{timestamp_parts[0]}-"
-            f"{timestamp_parts[1]}-"
-            f"{timestamp_parts[2]}-"
-            f"{timestamp_parts[3]}"
-        )
-        parsed = datetime.strptime(date_text, "%Y-%m-%d-%H%M")
-        return parsed.replace(tzinfo=timezone.utc)
+        # The constructor range-checks the fields (e.g. month 13 -> ValueError)
+        return datetime(*map(int, match.groups()), tzinfo=timezone.utc)
 
     async def _run_git_async(
         self,
@@ -402,11 +617,7 @@ class SnapshotManager:
                 retryable=True,
             )
         try:
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            process = await self._spawn(*cmd)
         except FileNotFoundError as exc:
             raise GitCapabilityError(
                 code="git_not_found",
@@ -461,7 +672,10 @@ class SnapshotManager:
                 continue
             try:
                 dt = self._parse_snapshot_datetime(branch_name)
-                formatted = dt.strftime("%b %d, %Y %H:%M UTC")
+                formatted = (
+                    f"{_MONTH_ABBR[dt.month]} {dt.day:02d}, {dt.year} "
+                    f"{dt.hour:02d}:{dt.minute:02d} UTC"
+                )
                 snapshots.append({"ref": branch_name, "timestamp": formatted})
             except (IndexError, ValueError) as exc:
                 logger.warning(
@@ -509,11 +723,7 @@ class SnapshotManager:
         verify_cmd = ["git", "-C", repo_path, "rev-parse", "--verify", snapshot_ref]
 
         try:
-            process = await asyncio.create_subprocess_exec(
-                *verify_cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
+            process = await self._spawn(*verify_cmd)
         except FileNotFoundError as exc:
             raise GitCapabilityError(
                 code="git_not_found",
@@ -551,11 +761,7 @@ class SnapshotManager:
         # Step 2: Restore files from snapshot
         checkout_cmd = ["git", "-C", repo_path, "checkout", snapshot_ref, "--", "."]
 
-        process = await asyncio.create_subprocess_exec(
-            *checkout_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        process = await self._spawn(*checkout_cmd)
 
         try:
             _, stderr = await asyncio.wait_for(
@@ -587,11 +793,7 @@ class SnapshotManager:
         commit_message = f"Rollback to snapshot: {snapshot_ref} (operation: {operation_id[:8]})"
         commit_cmd = ["git", "-C", repo_path, "commit", "-a", "-m", commit_message]
 
-        process = await asyncio.create_subprocess_exec(
-            *commit_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        process = await self._spawn(*commit_cmd)
 
         try:
             _, stderr = await asyncio.wait_for(
@@ -620,11 +822,7 @@ class SnapshotManager:
                 )
                 # Get current HEAD commit
                 head_cmd = ["git", "-C", repo_path, "rev-parse", "--short", "HEAD"]
-                process = await asyncio.create_subprocess_exec(
-                    *head_cmd,
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE,
-                )
+                process = await self._spawn(*head_cmd)
                 stdout, _ = await asyncio.wait_for(
                     process.communicate(), timeout=timeout_seconds
                 )
@@ -648,30 +846,23 @@ class SnapshotManager:
                     retryable=False,
                 )
 
-        # Step 4: Get commit hash
-        hash_cmd = ["git", "-C", repo_path, "rev-parse", "--short", "HEAD"]
-        process = await asyncio.create_subprocess_exec(
-            *hash_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        stdout, _ = await asyncio.wait_for(
-            process.communicate(), timeout=timeout_seconds
-        )
-        commit_hash = stdout.decode("utf-8", errors="replace").strip()
-
-        # Step 5: Count files changed
-        diff_cmd = ["git", "-C", repo_path, "diff-tree", "--no-commit-id", "--name-only", "-r", "HEAD"]
-        process = await asyncio.create_subprocess_exec(
-            *diff_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
+        # Step 4: Get commit hash and changed files in one call
+        # (format line, blank line, then one path per line; same paths as
+        # `diff-tree --no-commit-id --name-only -r HEAD`)
+        log_cmd = [
+            "git", "-C", repo_path, "log", "-1", "--format=%h",
+            "--name-only", "--no-renames", "HEAD",
+        ]
+        process = await self._spawn(*log_cmd)
         stdout, _ = await asyncio.wait_for(
             process.communicate(), timeout=timeout_seconds
         )
-        files_output = stdout.decode("utf-8", errors="replace").strip()
-        files_restored = len(files_output.split("\n")) if files_output else 0
+        # "<hash>\n\n<file>\n<file>\n...": only the hash needs decoding, the
+        # files are counted by their newlines.
+        head, _, file_block = stdout.partition(b"\n")
+        commit_hash = head.decode("utf-8", errors="replace").strip()
+        file_block = file_block.strip(b"\n")
+        files_restored = file_block.count(b"\n") + 1 if file_block else 0
 
         logger.info(
             "rollback_complete",
@@ -31,7 +31,7 @@ class BrokerActivity:
     last_10_results: dict  # {"completed": 8, "failed": 1, "timeout": 1}
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SchedulerState:
     """Current scheduler state (placeholder until Epic 4)."""
 
@@ -41,7 +41,7 @@ class SchedulerState:
     active_jobs_count: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NotifierState:
     """Current notification outbox state."""
 
@@ -50,7 +50,7 @@ class NotifierState:
     oldest_pending_age_seconds: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ResourceUsage:
     """Current process resource consumption."""
 
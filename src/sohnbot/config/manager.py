@@ -72,6 +72,7 @@ class ConfigManager:
         dynamic_config: Dynamic configuration (hot-reloadable)
         _subscribers: Event subscribers for config updates
         _update_event: Asyncio event for signaling configuration changes
+        _toml_cache: Last flattened TOML, keyed by config file (mtime_ns, size)
     """
 
     def __init__(self, config_file: Optional[Path] = None, env_file: Optional[Path] = None):
@@ -85,6 +86,7 @@ class ConfigManager:
         self.dynamic_config: dict[str, Any] = {}
         self._subscribers: list[Callable[[str, Any], None]] = []
         self._update_event = asyncio.Event()
+        self._toml_cache: Optional[tuple[tuple[int, int], dict[str, Any]]] = None
 
         # Determine paths
         if config_file is None:
@@ -115,7 +117,79 @@ class ConfigManager:
             This allows the system to start with sensible defaults.
         """
         logger.info("loading_static_config", config_file=str(self.config_file))
+        return self._apply_static_config(self._read_toml())
 
+    def load_dynamic_config_defaults(self) -> dict[str, Any]:
+        """Load dynamic configuration defaults from TOML (seed values).
+
+        These values will be used to seed the SQLite database in Story 1.2.
+        Once database exists, it becomes the authoritative source.
+
+        Returns:
+            Dictionary of dynamic configuration key-value pairs
+        """
+        logger.info("loading_dynamic_config_defaults")
+        return self._apply_dynamic_config(self._read_toml())
+
+    def load_all(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Load static config and dynamic defaults from a single TOML parse.
+
+        Equivalent to calling load_static_config() then
+        load_dynamic_config_defaults(), but the config file is read once.
+
+        Returns:
+            Tuple of (static_config, dynamic_config)
+
+        Raises:
+            ValueError: If configuration validation fails
+        """
+        logger.info("loading_all_config", config_file=str(self.config_file))
+        flattened = self._read_toml()
+        static = self._apply_static_config(flattened)
+        dynamic = self._apply_dynamic_config(flattened)
+        return static, dynamic
+
+    def _read_toml(self) -> Optional[dict[str, Any]]:
+        """Read and flatten the TOML config file.
+
+        The flattened result is cached until the file's mtime or size changes,
+        so loading static and dynamic config separately parses the file once.
+
+        Returns:
+            Flattened TOML data, or None if the config file doesn't exist
+        """
+        try:
+            stat = self.config_file.stat()
+        except FileNotFoundError:
+            logger.warning("config_file_not_found",
+                          config_file=str(self.config_file),
+                          using_defaults=True)
+            return None
+
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        if self._toml_cache is not None and self._toml_cache[0] == cache_key:
+            return self._toml_cache[1]
+
+        toml_data = tomllib.loads(self.config_file.read_bytes().decode("utf-8"))
+
+        # Flatten nested TOML structure (scope.allowed_roots)
+        flattened = self._flatten_toml(toml_data)
+        self._toml_cache = (cache_key, flattened)
+        logger.info("toml_config_loaded", keys_count=len(flattened))
+        return flattened
+
+    def _apply_static_config(self, flattened: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """Build and validate static config from flattened TOML data.
+
+        Args:
+            flattened: Flattened TOML data (None if no config file)
+
+        Returns:
+            Dictionary of static configuration key-value pairs
+
+        Raises:
+            ValueError: If configuration validation fails
+        """
         # Load environment variables from .env file
         if self.env_file.exists():
             load_dotenv(self.env_file)
@@ -126,25 +200,12 @@ class ConfigManager:
         defaults = get_default_values()
         config = {key: defaults[key] for key in static_keys}
 
-        # Step 2: Load from TOML file
-        if self.config_file.exists():
-            with open(self.config_file, "rb") as f:
-                toml_data = tomllib.load(f)
-
-            # Flatten nested TOML structure (scope.allowed_roots)
-            flattened = self._flatten_toml(toml_data)
-
-            # Apply TOML values for static keys
+        # Step 2: Apply TOML values for static keys
+        if flattened is not None:
             for key in static_keys:
                 if key in flattened:
                     config[key] = flattened[key]
 
-            logger.info("toml_config_loaded", keys_count=len(flattened))
-        else:
-            logger.warning("config_file_not_found",
-                          config_file=str(self.config_file),
-                          using_defaults=True)
-
         # Step 3: Apply environment variable overrides
         # Environment variables use SOHNBOT_ prefix and underscores
         # Example: SOHNBOT_DATABASE_PATH overrides database.path
@@ -173,31 +234,25 @@ class ConfigManager:
         logger.info("static_config_loaded", keys_count=len(config))
         return config
 
-    def load_dynamic_config_defaults(self) -> dict[str, Any]:
-        """Load dynamic configuration defaults from TOML (seed values).
+    def _apply_dynamic_config(self, flattened: Optional[dict[str, Any]]) -> dict[str, Any]:
+        """Build and validate dynamic config defaults from flattened TOML data.
 
-        These values will be used to seed the SQLite database in Story 1.2.
-        Once database exists, it becomes the authoritative source.
+        Args:
+            flattened: Flattened TOML data (None if no config file)
 
         Returns:
             Dictionary of dynamic configuration key-value pairs
-        """
-        logger.info("loading_dynamic_config_defaults")
 
+        Raises:
+            ValueError: If configuration validation fails
+        """
         # Step 1: Start with code defaults for dynamic keys
         dynamic_keys = get_dynamic_keys()
         defaults = get_default_values()
         config = {key: defaults[key] for key in dynamic_keys}
 
-        # Step 2: Load from TOML file (seed values)
-        if self.config_file.exists():
-            with open(self.config_file, "rb") as f:
-                toml_data = tomllib.load(f)
-
-            # Flatten nested TOML structure
-            flattened = self._flatten_toml(toml_data)
-
-            # Apply TOML values for dynamic keys
+        # Step 2: Apply TOML values for dynamic keys (seed values)
+        if flattened is not None:
             for key in dynamic_keys:
                 if key in flattened:
                     config[key] = flattened[key]
@@ -245,15 +300,7 @@ class ConfigManager:
             KeyError: If key is not a dynamic config key
             ValueError: If value validation fails
         """
-        config_key_def = get_config_key(key)
-
-        if config_key_def.tier != "dynamic":
-            raise KeyError(f"Cannot hot-update static config key '{key}' - restart required")
-
-        # Validate new value
-        is_valid, error_msg = validate_config_value(key, value)
-        if not is_valid:
-            raise ValueError(f"Config validation failed for '{key}': {error_msg}")
+        value = self._validate_update(key, value)
 
         # Update in-memory cache
         old_value = self.dynamic_config.get(key)
@@ -274,29 +321,71 @@ class ConfigManager:
         # Notify subscribers
         await self._notify_subscribers(key, value)
 
+    def _validate_update(self, key: str, value: Any) -> Any:
+        """Check that a dynamic config update is allowed and valid.
+
+        Args:
+            key: Configuration key path
+            value: New value
+
+        Returns:
+            The validated value
+
+        Raises:
+            KeyError: If key is not a dynamic config key
+            ValueError: If value validation fails
+        """
+        config_key_def = get_config_key(key)
+
+        if config_key_def.tier != "dynamic":
+            raise KeyError(f"Cannot hot-update static config key '{key}' - restart required")
+
+        is_valid, error_msg = validate_config_value(key, value)
+        if not is_valid:
+            raise ValueError(f"Config validation failed for '{key}': {error_msg}")
+
+        return value
+
     async def _notify_subscribers(self, key: str, value: Any) -> None:
         """Notify all subscribers of configuration update.
 
+        Subscribers run concurrently; a failing subscriber is logged and does
+        not prevent the others from being notified.
+
         Args:
             key: Configuration key that was updated
             value: New value
         """
-        for subscriber in self._subscribers:
-            try:
-                # Call subscriber (can be sync or async)
-                result = subscriber(key, value)
-                if asyncio.iscoroutine(result):
-                    await result
-            except Exception as e:
-                logger.error("subscriber_notification_failed",
-                           key=key,
-                           subscriber=subscriber.__name__,
-                           error=str(e))
+        await asyncio.gather(
+            *(self._notify_subscriber(subscriber, key, value) for subscriber in self._subscribers)
+        )
 
         # Set event to signal update
         self._update_event.set()
         self._update_event.clear()
 
+    @staticmethod
+    async def _notify_subscriber(
+        subscriber: Callable[[str, Any], None], key: str, value: Any
+    ) -> None:
+        """Call a single subscriber, awaiting it if it is async.
+
+        Args:
+            subscriber: Subscriber callback
+            key: Configuration key that was updated
+            value: New value
+        """
+        try:
+            # Call subscriber (can be sync or async)
+            result = subscriber(key, value)
+            if asyncio.iscoroutine(result):
+                await result
+        except Exception as e:
+            logger.error("subscriber_notification_failed",
+                       key=key,
+                       subscriber=subscriber.__name__,
+                       error=str(e))
+
     def subscribe(self, callback: Callable[[str, Any], None]) -> None:
         """Subscribe to configuration update events.
 
@@ -350,7 +439,8 @@ class ConfigManager:
         _flatten(data)
         return result
 
-    def _parse_env_value(self, value: str, target_type: type) -> Any:
+    @staticmethod
+    def _parse_env_value(value: str, target_type: type) -> Any:
         """Parse environment variable string to target type.
 
         Args:
@@ -400,6 +490,10 @@ def initialize_config(config_file: Optional[Path] = None,
                      env_file: Optional[Path] = None) -> ConfigManager:
     """Initialize global configuration manager.
 
+    The loaded manager is memoized: repeated calls with the same config and
+    env files return the existing global instance instead of re-reading them.
+    Reset ``_config_manager`` to ``None`` to force a fresh load.
+
     Args:
         config_file: Path to TOML config file
         env_file: Path to .env file
@@ -408,7 +502,13 @@ def initialize_config(config_file: Optional[Path] = None,
         Initialized ConfigManager instance
     """
     global _config_manager
+    if (
+        _config_manager is not None
+        and _config_manager.config_file == (config_file or Path("config/default.toml"))
+        and _config_manager.env_file == (env_file or Path(".env"))
+    ):
+        return _config_manager
+
     _config_manager = ConfigManager(config_file, env_file)
-    _config_manager.load_static_config()
-    _config_manager.load_dynamic_config_defaults()
+    _config_manager.load_all()
     return _config_manager
@@ -10,7 +10,10 @@ Two-Tier System:
   Examples: thresholds, timeouts, retention periods, model settings
 """
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cache
+from types import MappingProxyType
 from typing import Any, Callable, Literal, Optional
 
 
@@ -360,6 +363,15 @@ REGISTRY: dict[str, ConfigKey] = {
 }
 
 
+# Tier partition of REGISTRY, fixed at import time
+STATIC_KEYS: frozenset[str] = frozenset(
+    key for key, config_key in REGISTRY.items() if config_key.tier == "static"
+)
+DYNAMIC_KEYS: frozenset[str] = frozenset(
+    key for key, config_key in REGISTRY.items() if config_key.tier == "dynamic"
+)
+
+
 def get_config_key(key: str) -> ConfigKey:
     """Get configuration key definition from registry.
 
@@ -377,6 +389,62 @@ def get_config_key(key: str) -> ConfigKey:
     return REGISTRY[key]
 
 
+ValueCheck = Callable[[Any], Optional[str]]
+
+# Per-key validation checks, built once from each ConfigKey
+_VALUE_CHECKS: dict[str, tuple[ValueCheck, ...]] = {}
+
+
+def _build_value_checks(config_key: ConfigKey) -> tuple[ValueCheck, ...]:
+    """Build the ordered checks that apply to a configuration key.
+
+    Bounds and custom-validator checks are only included when the key
+    defines them, so validation does no work for unused rules.
+
+    Args:
+        config_key: Configuration key definition
+
+    Returns:
+        Tuple of checks; each returns an error message or None if valid
+    """
+    value_type = config_key.value_type
+    min_value = config_key.min_value
+    max_value = config_key.max_value
+    validator = config_key.validator
+
+    def check_type(value: Any) -> Optional[str]:
+        if not isinstance(value, value_type):
+            return f"Expected type {value_type.__name__}, got {type(value).__name__}"
+        return None
+
+    def check_min(value: Any) -> Optional[str]:
+        if isinstance(value, (int, float)) and value < min_value:
+            return f"Value {value} below minimum {min_value}"
+        return None
+
+    def check_max(value: Any) -> Optional[str]:
+        if isinstance(value, (int, float)) and value > max_value:
+            return f"Value {value} above maximum {max_value}"
+        return None
+
+    def check_custom(value: Any) -> Optional[str]:
+        try:
+            if not validator(value):
+                return f"Custom validation failed for value: {value}"
+        except Exception as e:
+            return f"Validator error: {str(e)}"
+        return None
+
+    checks: list[ValueCheck] = [check_type]
+    if min_value is not None:
+        checks.append(check_min)
+    if max_value is not None:
+        checks.append(check_max)
+    if validator is not None:
+        checks.append(check_custom)
+    return tuple(checks)
+
+
 def validate_config_value(key: str, value: Any) -> tuple[bool, Optional[str]]:
     """Validate a configuration value against its registered definition.
 
@@ -388,40 +456,34 @@ def validate_config_value(key: str, value: Any) -> tuple[bool, Optional[str]]:
         Tuple of (is_valid, error_message)
         error_message is None if valid
     """
-    try:
-        config_key = get_config_key(key)
-    except KeyError as e:
-        return False, str(e)
-
-    # Type validation
-    if not isinstance(value, config_key.value_type):
-        return False, f"Expected type {config_key.value_type.__name__}, got {type(value).__name__}"
-
-    # Range validation for numeric types
-    if isinstance(value, (int, float)):
-        if config_key.min_value is not None and value < config_key.min_value:
-            return False, f"Value {value} below minimum {config_key.min_value}"
-        if config_key.max_value is not None and value > config_key.max_value:
-            return False, f"Value {value} above maximum {config_key.max_value}"
-
-    # Custom validator
-    if config_key.validator is not None:
+    checks = _VALUE_CHECKS.get(key)
+    if checks is None:
         try:
-            if not config_key.validator(value):
-                return False, f"Custom validation failed for value: {value}"
-        except Exception as e:
-            return False, f"Validator error: {str(e)}"
+            config_key = get_config_key(key)
+        except KeyError as e:
+            return False, str(e)
+        checks = _VALUE_CHECKS[key] = _build_value_checks(config_key)
+
+    # Type, range, then custom validation
+    for check in checks:
+        error_msg = check(value)
+        if error_msg is not None:
+            return False, error_msg
 
     return True, None
 
 
-def get_default_values() -> dict[str, Any]:
+@cache
+def get_default_values() -> Mapping[str, Any]:
     """Get default values for all configuration keys.
 
+    REGISTRY is fixed at import, so the mapping is built once and shared
+    as a read-only view.
+
     Returns:
-        Dictionary of key -> default_value
+        Read-only mapping of key -> default_value
     """
-    return {key: config_key.default for key, config_key in REGISTRY.items()}
+    return MappingProxyType({key: config_key.default for key, config_key in REGISTRY.items()})
 
 
 def get_static_keys() -> list[str]:
@@ -430,7 +492,7 @@ def get_static_keys() -> list[str]:
     Returns:
         List of static config key paths
     """
-    return [key for key, config_key in REGISTRY.items() if config_key.tier == "static"]
+    return list(STATIC_KEYS)
 
 
 def get_dynamic_keys() -> list[str]:
@@ -439,4 +501,4 @@ def get_dynamic_keys() -> list[str]:
     Returns:
         List of dynamic config key paths
     """
-    return [key for key, config_key in REGISTRY.items() if config_key.tier == "dynamic"]
+    return list(DYNAMIC_KEYS)
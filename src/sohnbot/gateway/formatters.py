@@ -29,35 +29,28 @@ def format_for_telegram(response: str, max_length: int = 4096) -> list[str]:
         return [response]
 
     messages = []
-    current = ""
-
-    # Split on newlines to preserve formatting
-    for line in response.split("\n"):
-        # If the line itself is too long, split it character-by-character
-        if len(line) > max_length:
-            # Save current chunk first
-            if current:
-                messages.append(current)
-                current = ""
-
-            # Split long line into chunks
-            for i in range(0, len(line), max_length):
-                messages.append(line[i:i + max_length])
-            continue
-
-        # If adding this line would exceed the limit
-        if len(current) + len(line) + 1 > max_length:
-            # Save current chunk if not empty
-            if current:
-                messages.append(current)
-            # Start new chunk with this line
-            current = line
-        else:
-            # Add line to current chunk
-            current += "\n" + line if current else line
-
-    # Don't forget the last chunk
-    if current:
-        messages.append(current)
+    total = len(response)
+    pos = 0
+
+    # Cut at the last newline inside each max_length window (str.rfind runs
+    # in C), so whole lines are packed per chunk; a window with no newline
+    # is hard-cut at max_length.
+    while True:
+        # Skip the separator newline(s) between chunks
+        while pos < total and response[pos] == "\n":
+            pos += 1
+        if pos == total:
+            break
+
+        limit = pos + max_length
+        if limit >= total:
+            messages.append(response[pos:])
+            break
+
+        cut = response.rfind("\n", pos, limit + 1)
+        if cut == -1:
+            cut = limit
+        messages.append(response[pos:cut])
+        pos = cut
 
     return messages
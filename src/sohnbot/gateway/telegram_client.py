@@ -4,9 +4,11 @@ Telegram Bot Client.
 Handles Telegram Bot API integration with chat ID authentication.
 """
 
+import httpx
 import structlog
 from telegram import Update
 from telegram.ext import Application, CommandHandler, MessageHandler, filters
+from telegram.request import HTTPXRequest
 
 from .commands import handle_notify_command
 from .formatters import format_for_telegram
@@ -14,6 +16,29 @@ from .notification_worker import NotificationWorker
 
 logger = structlog.get_logger(__name__)
 
+# Pool for outgoing Bot API calls (replies and notifications). httpx drops
+# idle connections after 5s by default, the same as the notification
+# worker's poll interval, so bursts would keep paying for new TLS
+# handshakes; keep them alive for a minute instead.
+BOT_CONNECTION_POOL_SIZE = 20
+BOT_POOL_TIMEOUT_SECONDS = 5.0
+BOT_KEEPALIVE_EXPIRY_SECONDS = 60.0
+
+
+def _build_bot_request() -> HTTPXRequest:
+    """Create the pooled, keep-alive HTTP transport for Bot API calls."""
+    return HTTPXRequest(
+        connection_pool_size=BOT_CONNECTION_POOL_SIZE,
+        pool_timeout=BOT_POOL_TIMEOUT_SECONDS,
+        httpx_kwargs={
+            "limits": httpx.Limits(
+                max_connections=BOT_CONNECTION_POOL_SIZE,
+                max_keepalive_connections=BOT_CONNECTION_POOL_SIZE,
+                keepalive_expiry=BOT_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+        },
+    )
+
 
 class TelegramClient:
     """Async Telegram Bot API integration with authentication."""
@@ -48,7 +73,12 @@ class TelegramClient:
         )
 
         # Build application
-        self.application = Application.builder().token(self.token).build()
+        self.application = (
+            Application.builder()
+            .token(self.token)
+            .request(_build_bot_request())
+            .build()
+        )
 
         # Register handlers
         self.application.add_handler(
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 
 from ..capabilities.observe import HealthCheckResult, NotifierState, ResourceUsage, SchedulerState
@@ -51,7 +52,8 @@ async def check_sqlite_writable() -> HealthCheckResult:
         await cursor.close()
         journal_mode = str(row[0]) if row else "unknown"
 
-        if journal_mode.lower() != "wal":
+        # In-memory databases (test-only) cannot use WAL and report "memory".
+        if journal_mode.lower() not in ("wal", "memory"):
             return HealthCheckResult(
                 name="sqlite_writable",
                 status="warn",
@@ -275,36 +277,32 @@ async def run_all_health_checks(
     notifier_state: NotifierState,
     resources: ResourceUsage,
 ) -> list[HealthCheckResult]:
-    """Run all health checks and return results in stable order."""
-    results: list[HealthCheckResult] = []
-    try:
-        results.append(await check_sqlite_writable())
-    except Exception as exc:
-        results.append(_failed_result("sqlite_writable", "SQLite health check failed", exc))
-
-    try:
-        results.append(check_scheduler_lag(scheduler_state))
-    except Exception as exc:
-        results.append(_failed_result("scheduler_lag", "Scheduler lag check failed", exc))
-
-    try:
-        results.append(check_job_timeouts())
-    except Exception as exc:
-        results.append(_failed_result("job_timeouts", "Job timeout check failed", exc))
-
-    try:
-        results.append(check_notifier_alive(notifier_state))
-    except Exception as exc:
-        results.append(_failed_result("notifier_alive", "Notifier check failed", exc))
-
-    try:
-        results.append(check_outbox_stuck(notifier_state))
-    except Exception as exc:
-        results.append(_failed_result("outbox_stuck", "Outbox check failed", exc))
+    """Run all health checks and return results in stable order.
+
+    The SQLite probe is started first so its I/O (on aiosqlite's worker
+    thread) overlaps with the synchronous checks.
+    """
+    sqlite_task = asyncio.create_task(check_sqlite_writable())
+    # Let the probe run up to its first database await before the sync checks.
+    await asyncio.sleep(0)
+
+    sync_checks = (
+        ("scheduler_lag", "Scheduler lag check failed", lambda: check_scheduler_lag(scheduler_state)),
+        ("job_timeouts", "Job timeout check failed", check_job_timeouts),
+        ("notifier_alive", "Notifier check failed", lambda: check_notifier_alive(notifier_state)),
+        ("outbox_stuck", "Outbox check failed", lambda: check_outbox_stuck(notifier_state)),
+        ("disk_usage", "Disk usage check failed", lambda: check_disk_usage(resources)),
+    )
+    sync_results: list[HealthCheckResult] = []
+    for name, message, check in sync_checks:
+        try:
+            sync_results.append(check())
+        except Exception as exc:
+            sync_results.append(_failed_result(name, message, exc))
 
     try:
-        results.append(check_disk_usage(resources))
+        sqlite_result = await sqlite_task
     except Exception as exc:
-        results.append(_failed_result("disk_usage", "Disk usage check failed", exc))
+        sqlite_result = _failed_result("sqlite_writable", "SQLite health check failed", exc)
 
-    return results
+    return [sqlite_result, *sync_results]
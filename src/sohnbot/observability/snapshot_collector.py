@@ -25,6 +25,7 @@ import structlog
 
 from ..capabilities.observe import (
     BrokerActivity,
+    HealthCheckResult,
     NotifierState,
     ProcessInfo,
     ResourceUsage,
@@ -49,6 +50,20 @@ def _get_process() -> psutil.Process:
     return _process
 
 
+# Health results reused by collect_snapshot calls within the TTL; the checks
+# are read-only, so a short window needs no invalidation.
+_HEALTH_CACHE_TTL_SECONDS = 1.0
+_health_cache_ts: float = 0.0
+_health_cache: Optional[list[HealthCheckResult]] = None
+
+
+def _reset_health_cache() -> None:
+    """Drop cached health results (used by tests)."""
+    global _health_cache, _health_cache_ts
+    _health_cache = None
+    _health_cache_ts = 0.0
+
+
 # ---------------------------------------------------------------------------
 # Main background loop
 # ---------------------------------------------------------------------------
@@ -66,36 +81,40 @@ async def snapshot_collector_loop(interval_seconds: int = 30) -> None:
     logger.info("snapshot_collector_started", interval_seconds=interval_seconds)
 
     while True:
-        try:
-            start_ns = time.perf_counter_ns()
-            snapshot = await collect_snapshot()
-            update_snapshot_cache(snapshot)
-
-            duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
-            if duration_ms > 100:
-                logger.warning(
-                    "snapshot_collection_slow",
-                    duration_ms=round(duration_ms, 1),
-                    threshold_ms=100,
-                )
-            else:
-                logger.debug(
-                    "snapshot_collected",
-                    duration_ms=round(duration_ms, 1),
-                    timestamp=snapshot.timestamp,
-                )
+        await _collect_iteration()
+        await asyncio.sleep(interval_seconds)
 
-            # Optional SQLite persistence (disabled by default)
-            await _maybe_persist_snapshot(snapshot)
 
-        except Exception as exc:  # noqa: BLE001
-            logger.error(
-                "snapshot_collection_failed",
-                error=str(exc),
-                exc_info=True,
+async def _collect_iteration() -> None:
+    """Collect, cache and optionally persist one snapshot; never raises."""
+    try:
+        start_ns = time.perf_counter_ns()
+        snapshot = await collect_snapshot()
+        update_snapshot_cache(snapshot)
+
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        if duration_ms > 100:
+            logger.warning(
+                "snapshot_collection_slow",
+                duration_ms=round(duration_ms, 1),
+                threshold_ms=100,
+            )
+        else:
+            logger.debug(
+                "snapshot_collected",
+                duration_ms=round(duration_ms, 1),
+                timestamp=snapshot.timestamp,
             )
 
-        await asyncio.sleep(interval_seconds)
+        # Optional SQLite persistence (disabled by default)
+        await _maybe_persist_snapshot(snapshot)
+
+    except Exception as exc:  # noqa: BLE001
+        logger.error(
+            "snapshot_collection_failed",
+            error=str(exc),
+            exc_info=True,
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -109,9 +128,12 @@ async def collect_snapshot() -> StatusSnapshot:
     All collection calls are read-only. Async calls that need DB access
     are awaited; blocking calls are wrapped in asyncio.to_thread.
 
+    Health check results are reused for up to _HEALTH_CACHE_TTL_SECONDS.
+
     Returns:
         Fresh StatusSnapshot with current system state.
     """
+    global _health_cache, _health_cache_ts
     timestamp = int(datetime.now(timezone.utc).timestamp())
 
     process_info = await asyncio.to_thread(collect_process_info)
@@ -120,11 +142,17 @@ async def collect_snapshot() -> StatusSnapshot:
     notifier_state = await collect_notifier_state()
     resources = await collect_resource_usage()
     recent_ops = await query_recent_operations(limit=100)
-    health = await run_all_health_checks(
-        scheduler_state=scheduler_state,
-        notifier_state=notifier_state,
-        resources=resources,
-    )
+    now = time.monotonic()
+    if _health_cache is not None and now - _health_cache_ts < _HEALTH_CACHE_TTL_SECONDS:
+        health = _health_cache
+    else:
+        health = await run_all_health_checks(
+            scheduler_state=scheduler_state,
+            notifier_state=notifier_state,
+            resources=resources,
+        )
+        _health_cache = health
+        _health_cache_ts = now
 
     return StatusSnapshot(
         timestamp=timestamp,
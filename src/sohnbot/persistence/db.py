@@ -11,16 +11,24 @@ logger = structlog.get_logger(__name__)
 class DatabaseManager:
     """Manages SQLite database connections with WAL mode and optimal pragmas."""
 
-    def __init__(self, db_path: str | Path):
+    def __init__(self, db_path: str | Path, in_memory: bool = False):
         """
         Initialize database manager.
 
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file (the database name if in_memory)
+            in_memory: Open a shared-cache in-memory database instead of a file.
+                Intended for tests; WAL is unavailable, so journal mode is "memory".
         """
         self.db_path = Path(db_path)
+        self.in_memory = in_memory
         self._connection: Optional[aiosqlite.Connection] = None
 
+    @property
+    def uri(self) -> str:
+        """SQLite URI of the in-memory database; other connections to it share its data."""
+        return f"file:{self.db_path.name}?mode=memory&cache=shared"
+
     async def get_connection(self) -> aiosqlite.Connection:
         """
         Get database connection with WAL mode and optimized pragmas.
@@ -35,17 +43,21 @@ class DatabaseManager:
         if self._connection is not None:
             return self._connection
 
-        # Ensure database directory exists
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Create connection
-        conn = await aiosqlite.connect(str(self.db_path))
+        if self.in_memory:
+            conn = await aiosqlite.connect(self.uri, uri=True)
+            expected_mode = "memory"
+        else:
+            # Ensure database directory exists
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = await aiosqlite.connect(str(self.db_path))
+            expected_mode = "wal"
 
         try:
             # Configure pragmas for optimal performance and safety
             await conn.execute("PRAGMA foreign_keys=ON")
-            await conn.execute("PRAGMA journal_mode=WAL")
-            await conn.execute("PRAGMA synchronous=NORMAL")
+            if not self.in_memory:
+                await conn.execute("PRAGMA journal_mode=WAL")
+                await conn.execute("PRAGMA synchronous=NORMAL")
             await conn.execute("PRAGMA busy_timeout=5000")
             await conn.execute("PRAGMA temp_store=MEMORY")
             await conn.execute("PRAGMA cache_size=-64000")
@@ -55,10 +67,10 @@ class DatabaseManager:
             mode = await cursor.fetchone()
             await cursor.close()
 
-            if mode[0].lower() != 'wal':
+            if mode[0].lower() != expected_mode:
                 await conn.close()
                 raise RuntimeError(
-                    f"Failed to enable WAL mode. Expected 'wal', got '{mode[0]}'. "
+                    f"Unexpected journal mode. Expected '{expected_mode}', got '{mode[0]}'. "
                     "WAL mode is required for safe concurrent access."
                 )
         except Exception:
@@ -1,7 +1,7 @@
 """
 Claude Agent SDK Hooks.
 
-PreToolUse hook enforces that only mcp__sohnbot__* tools can be invoked.
+PreToolUse hook enforces that only the registered mcp__sohnbot__* tools can be invoked.
 This is the architectural gatekeeper for the broker layer.
 """
 
@@ -9,10 +9,29 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Full names of the tools registered by runtime.mcp_tools; anything else,
+# including unknown mcp__sohnbot__* names, is denied.
+_ALLOWED_TOOLS: frozenset[str] = frozenset({
+    "mcp__sohnbot__fs__read",
+    "mcp__sohnbot__fs__list",
+    "mcp__sohnbot__fs__search",
+    "mcp__sohnbot__files__read",
+    "mcp__sohnbot__files__list",
+    "mcp__sohnbot__files__search",
+    "mcp__sohnbot__fs__apply_patch",
+    "mcp__sohnbot__git__status",
+    "mcp__sohnbot__git__diff",
+    "mcp__sohnbot__git__commit",
+    "mcp__sohnbot__git__list_snapshots",
+    "mcp__sohnbot__git__prune_snapshots",
+    "mcp__sohnbot__git__rollback",
+    "mcp__sohnbot__git__checkout",
+})
+
 
 async def validate_tool_use(input_data, tool_use_id, context):
     """
-    PreToolUse hook - blocks any tool NOT matching mcp__sohnbot__* pattern.
+    PreToolUse hook - blocks any tool that is not a registered sohnbot tool.
 
     This is the architectural gatekeeper that enforces broker routing.
     No tool can bypass the broker layer.
@@ -27,8 +46,8 @@ async def validate_tool_use(input_data, tool_use_id, context):
     """
     tool_name = input_data["tool_name"]
 
-    # Allow only mcp__sohnbot__* tools
-    if not tool_name.startswith("mcp__sohnbot__"):
+    # Allow only registered mcp__sohnbot__* tools
+    if tool_name not in _ALLOWED_TOOLS:
         logger.warning(
             "blocked_non_sohnbot_tool",
             tool_name=tool_name,
@@ -40,7 +59,7 @@ async def validate_tool_use(input_data, tool_use_id, context):
                 "hookEventName": "PreToolUse",
                 "permissionDecision": "deny",
                 "permissionDecisionReason": (
-                    f"Only mcp__sohnbot__* tools are permitted. "
+                    f"Only registered mcp__sohnbot__* tools are permitted. "
                     f"Attempted: {tool_name}"
                 )
             }
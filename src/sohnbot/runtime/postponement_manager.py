@@ -3,8 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from dataclasses import dataclass
-from datetime import datetime
 
 import structlog
 
@@ -60,7 +60,9 @@ class PostponementManager:
 
     @staticmethod
     def _now_ts() -> int:
-        return int(datetime.now().timestamp())
+        # Wall-clock seconds: retry/cancel deadlines are persisted and must
+        # survive restarts, so a monotonic clock would not do.
+        return int(time.time())
 
     async def add_pending(
         self,
@@ -0,0 +1,114 @@
+"""Shared pytest configuration."""
+
+import asyncio
+import os
+import shutil
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+
+from scripts.migrate import apply_migrations
+from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
+
+MIGRATIONS_DIR = (
+    Path(__file__).resolve().parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
+)
+
+# In-memory databases are private to each process; the xdist worker id only
+# makes their names (logged as db_path) traceable to a worker.
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+# Tables that tests write rows into, children before parents so the
+# foreign keys on execution_log stay satisfied while clearing.
+_DATA_TABLES = ("notification_outbox", "postponed_operation", "execution_log", "config")
+
+# Module-scoped database fixtures. Tests using them are kept on one xdist
+# worker per module (--dist=loadgroup) so the database is built only once;
+# every other test is distributed individually.
+_MODULE_DB_FIXTURES = ("module_memory_db", "shared_db")
+
+
+def pytest_collection_modifyitems(items):
+    """Group tests that share a module-scoped database by their module."""
+    for item in items:
+        if any(name in item.fixturenames for name in _MODULE_DB_FIXTURES):
+            item.add_marker(pytest.mark.xdist_group(item.module.__name__))
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop when it is installed (Linux/macOS only)."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def migrated_db_template(tmp_path_factory) -> Path:
+    """Fully migrated WAL-mode database, built once per session.
+
+    Copy it (e.g. with shutil.copyfile) rather than opening it directly.
+    """
+    template = tmp_path_factory.mktemp("db_template") / "template.db"
+    # Migrate without WAL or fsyncs, then switch to WAL like production.
+    apply_migrations(template, MIGRATIONS_DIR, {"journal_mode": "MEMORY", "synchronous": "OFF"})
+    conn = sqlite3.connect(template)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.close()
+    return template
+
+
+@pytest.fixture(scope="session")
+def migrated_db_conn(migrated_db_template):
+    """In-memory copy of the migrated template, kept open for the session.
+
+    Back it up into new databases (Connection.backup) to get the schema
+    without re-running any DDL.
+    """
+    conn = sqlite3.connect(":memory:")
+    with closing(sqlite3.connect(migrated_db_template)) as src:
+        src.backup(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def migrated_db_path(tmp_path, migrated_db_template) -> Path:
+    """Per-test copy of the migrated template at tmp_path / "test.db"."""
+    db_path = tmp_path / "test.db"
+    shutil.copyfile(migrated_db_template, db_path)
+    return db_path
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_memory_db(request, migrated_db_conn):
+    """Shared-cache in-memory copy of the migrated template for one test module."""
+    db_manager = DatabaseManager(
+        f"sohnbot_test_{_WORKER_ID}_{request.module.__name__}", in_memory=True
+    )
+    # The managed connection keeps the shared in-memory database alive.
+    await db_manager.get_connection()
+    with closing(sqlite3.connect(db_manager.uri, uri=True)) as dst:
+        migrated_db_conn.backup(dst)
+    yield db_manager
+    await db_manager.close()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def memory_db(module_memory_db):
+    """Install the module's in-memory database globally and clear its rows afterwards.
+
+    Tests using it must run on the module event loop.
+    """
+    set_db_manager(module_memory_db)
+    yield module_memory_db
+    db = await module_memory_db.get_connection()
+    await db.rollback()
+    for table in _DATA_TABLES:
+        await db.execute(f"DELETE FROM {table}")
+    await db.commit()
@@ -1,25 +1,16 @@
 """Integration tests for broker end-to-end flows."""
 
 import pytest
-from pathlib import Path
 from unittest.mock import patch, AsyncMock
 
 from src.sohnbot.broker import BrokerRouter, ScopeValidator
 from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
-from scripts.migrate import apply_migrations
 
 
 @pytest.fixture
-async def setup_database(tmp_path):
+async def setup_database(migrated_db_path):
     """Set up test database with migrations."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    # Apply migrations
-    apply_migrations(db_path, migrations_dir)
-
-    # Set up database manager
-    db_manager = DatabaseManager(db_path)
+    db_manager = DatabaseManager(migrated_db_path)
     set_db_manager(db_manager)
 
     yield db_manager
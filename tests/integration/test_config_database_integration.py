@@ -7,22 +7,15 @@ Phase 5 integration with Story 1.1.
 
 import pytest
 import json
-from pathlib import Path
 from datetime import datetime
 
 from src.sohnbot.persistence.db import DatabaseManager
-from scripts.migrate import apply_migrations
 
 
 @pytest.fixture
-async def setup_database(tmp_path):
+async def setup_database(migrated_db_path):
     """Set up test database with migrations."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    apply_migrations(db_path, migrations_dir)
-
-    db_manager = DatabaseManager(db_path)
+    db_manager = DatabaseManager(migrated_db_path)
 
     yield db_manager
 
@@ -80,8 +80,7 @@ max_concurrent_jobs = 5
     async def test_hot_reload_workflow_integration(self):
         """Test complete hot-reload workflow with subscribers."""
         manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
+        manager.load_all()
 
         # Track notifications
         notifications = []
@@ -124,8 +123,7 @@ tick_seconds = 5  # Below minimum of 10
     def test_static_vs_dynamic_tier_enforcement(self):
         """Test that static/dynamic tier enforcement works."""
         manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
+        manager.load_all()
 
         # Try to hot-update static config - should fail
         with pytest.raises(KeyError, match="Cannot hot-update static config"):
@@ -148,8 +146,7 @@ tick_seconds = 5  # Below minimum of 10
     async def test_multiple_subscribers_integration(self):
         """Test that multiple subscribers all receive notifications."""
         manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
+        manager.load_all()
 
         # Multiple subscribers
         notifications1 = []
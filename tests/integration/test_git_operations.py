@@ -5,18 +5,14 @@ from pathlib import Path
 
 import pytest
 
-from scripts.migrate import apply_migrations
 from src.sohnbot.broker import BrokerRouter, ScopeValidator
 from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
 from src.sohnbot.persistence.notification import get_pending_notifications
 
 
 @pytest.fixture
-async def setup_database(tmp_path):
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-    apply_migrations(db_path, migrations_dir)
-    db_manager = DatabaseManager(db_path)
+async def setup_database(migrated_db_path):
+    db_manager = DatabaseManager(migrated_db_path)
     set_db_manager(db_manager)
     yield db_manager
     await db_manager.close()
@@ -1,6 +1,5 @@
 """Integration tests for patch-based file edit with snapshot creation (Story 1.6)."""
 
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -9,7 +8,6 @@ from src.sohnbot.broker import BrokerRouter, ScopeValidator
 from src.sohnbot.capabilities.git.snapshot_manager import GitCapabilityError
 from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
 from src.sohnbot.persistence.notification import get_pending_notifications
-from scripts.migrate import apply_migrations
 
 
 # ---------------------------------------------------------------------------
@@ -18,19 +16,9 @@ from scripts.migrate import apply_migrations
 
 
 @pytest.fixture
-async def setup_database(tmp_path):
+async def setup_database(migrated_db_path):
     """Set up test database with migrations."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = (
-        Path(__file__).parent.parent.parent
-        / "src"
-        / "sohnbot"
-        / "persistence"
-        / "migrations"
-    )
-    apply_migrations(db_path, migrations_dir)
-
-    db_manager = DatabaseManager(db_path)
+    db_manager = DatabaseManager(migrated_db_path)
     set_db_manager(db_manager)
 
     yield db_manager
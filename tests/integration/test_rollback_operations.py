@@ -1,29 +1,21 @@
 """Integration tests for git rollback operations through broker."""
 
 import asyncio
-from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from sohnbot.broker.router import BrokerRouter
 from sohnbot.broker.scope_validator import ScopeValidator
+from sohnbot.capabilities.git.snapshot_manager import SnapshotManager
 from sohnbot.persistence.db import DatabaseManager, set_db_manager
 from sohnbot.persistence.notification import get_pending_notifications
-from scripts.migrate import apply_migrations
 
 
 @pytest.fixture
-async def setup_database(tmp_path):
+async def setup_database(migrated_db_path):
     """Set up test database with migrations."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    # Apply migrations
-    apply_migrations(db_path, migrations_dir)
-
-    # Set up database manager
-    db_manager = DatabaseManager(db_path)
+    db_manager = DatabaseManager(migrated_db_path)
     set_db_manager(db_manager)
 
     yield db_manager
@@ -39,6 +31,21 @@ def fake_repo(tmp_path):
     return tmp_path
 
 
+def _git_proc(stdout: bytes = b"") -> AsyncMock:
+    """Finished git process that exited 0 with the given stdout."""
+    process = AsyncMock()
+    process.returncode = 0
+    process.communicate = AsyncMock(return_value=(stdout, b""))
+    return process
+
+
+def _script_git(broker: BrokerRouter, *stdouts: bytes) -> AsyncMock:
+    """Make the broker's git calls return stdouts in order; returns the runner."""
+    runner = AsyncMock(side_effect=[_git_proc(stdout) for stdout in stdouts])
+    broker.snapshot_manager = SnapshotManager(runner=runner)
+    return runner
+
+
 @pytest.fixture
 def broker(fake_repo):
     """Create broker with scope validator allowing test repo."""
@@ -50,20 +57,17 @@ class TestListSnapshotsBrokerRoute:
     @pytest.mark.asyncio
     async def test_list_snapshots_through_broker(self, broker, fake_repo, setup_database):
         """Full broker route for list_snapshots operation."""
-        # Mock subprocess for git branch --list
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=b"  snapshot/edit-2026-02-27-1430\n",
-                stderr=b"",
-            )
+        # Snapshot branches are read straight from the loose refs
+        snapshot_refs = fake_repo / ".git" / "refs" / "heads" / "snapshot"
+        snapshot_refs.mkdir(parents=True)
+        (snapshot_refs / "edit-2026-02-27-1430").write_text("a" * 40 + "\n")
 
-            result = await broker.route_operation(
-                capability="git",
-                action="list_snapshots",
-                params={"repo_path": str(fake_repo)},
-                chat_id="test_chat",
-            )
+        result = await broker.route_operation(
+            capability="git",
+            action="list_snapshots",
+            params={"repo_path": str(fake_repo)},
+            chat_id="test_chat",
+        )
 
         assert result.allowed is True
         assert result.tier == 1
@@ -91,36 +95,24 @@ class TestRollbackBrokerRoute:
         """Full broker route for rollback operation."""
         snapshot_ref = "snapshot/edit-2026-02-27-1430"
 
-        # Mock git commands
-        call_count = 0
-
-        async def mock_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            process = AsyncMock()
-            process.returncode = 0
-
-            if call_count == 1:  # rev-parse --verify
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-            elif call_count == 2:  # checkout
-                process.communicate = AsyncMock(return_value=(b"", b""))
-            elif call_count == 3:  # commit
-                process.communicate = AsyncMock(return_value=(b"", b""))
-            elif call_count == 4:  # rev-parse --short HEAD
-                process.communicate = AsyncMock(return_value=(b"def456\n", b""))
-            elif call_count == 5:  # diff-tree
-                process.communicate = AsyncMock(return_value=(b"file1.py\nfile2.py\n", b""))
-
-            return process
+        runner = _script_git(
+            broker,
+            b"abc123\n",  # rev-parse --verify
+            b"",  # checkout
+            b"",  # commit
+            b"def456\n\nfile1.py\nfile2.py\n",  # log -1 --format=%h --name-only
+        )
 
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            result = await broker.route_operation(
-                capability="git",
-                action="rollback",
-                params={"repo_path": str(fake_repo), "snapshot_ref": snapshot_ref},
-                chat_id="test_chat",
-            )
+        result = await broker.route_operation(
+            capability="git",
+            action="rollback",
+            params={"repo_path": str(fake_repo), "snapshot_ref": snapshot_ref},
+            chat_id="test_chat",
+        )
 
+        assert [call.args[3] for call in runner.await_args_list] == [
+            "rev-parse", "checkout", "commit", "log",
+        ]
         assert result.allowed is True
         assert result.tier == 1
         assert result.result["snapshot_ref"] == snapshot_ref
@@ -148,35 +140,14 @@ class TestRollbackBrokerRoute:
         """Verify execution_log.snapshot_ref is populated with restored snapshot."""
         snapshot_ref = "snapshot/edit-2026-02-27-1430"
 
-        # Mock git commands
-        call_count = 0
-
-        async def mock_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            process = AsyncMock()
-            process.returncode = 0
-
-            if call_count == 1:  # rev-parse
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-            elif call_count == 2:  # checkout
-                process.communicate = AsyncMock(return_value=(b"", b""))
-            elif call_count == 3:  # commit
-                process.communicate = AsyncMock(return_value=(b"", b""))
-            elif call_count == 4:  # rev-parse --short
-                process.communicate = AsyncMock(return_value=(b"def456\n", b""))
-            elif call_count == 5:  # diff-tree
-                process.communicate = AsyncMock(return_value=(b"file1.py\n", b""))
+        _script_git(broker, b"abc123\n", b"", b"", b"def456\n\nfile1.py\n")
 
-            return process
-
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            result = await broker.route_operation(
-                capability="git",
-                action="rollback",
-                params={"repo_path": str(fake_repo), "snapshot_ref": snapshot_ref},
-                chat_id="test_chat",
-            )
+        result = await broker.route_operation(
+            capability="git",
+            action="rollback",
+            params={"repo_path": str(fake_repo), "snapshot_ref": snapshot_ref},
+            chat_id="test_chat",
+        )
 
         # Snapshot ref in result should match the restored snapshot
         assert result.snapshot_ref is None  # Rollback doesn't CREATE snapshot
@@ -239,31 +210,16 @@ class TestRollbackBrokerRoute:
         scope_validator = ScopeValidator(allowed_roots=[str(fake_repo)])
         broker_with_notifier = BrokerRouter(scope_validator=scope_validator)
 
-        # Mock git commands
-        call_count = 0
-
-        async def mock_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            process = AsyncMock()
-            process.returncode = 0
-
-            if call_count <= 3:
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-            elif call_count == 4:
-                process.communicate = AsyncMock(return_value=(b"def456\n", b""))
-            elif call_count == 5:
-                process.communicate = AsyncMock(return_value=(b"file1.py\n", b""))
-
-            return process
+        _script_git(
+            broker_with_notifier, b"abc123\n", b"abc123\n", b"abc123\n", b"def456\n\nfile1.py\n"
+        )
 
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            result = await broker_with_notifier.route_operation(
-                capability="git",
-                action="rollback",
-                params={"repo_path": str(fake_repo), "snapshot_ref": snapshot_ref},
-                chat_id="test_chat",
-            )
+        result = await broker_with_notifier.route_operation(
+            capability="git",
+            action="rollback",
+            params={"repo_path": str(fake_repo), "snapshot_ref": snapshot_ref},
+            chat_id="test_chat",
+        )
 
         assert result.allowed is True
         pending = await get_pending_notifications()
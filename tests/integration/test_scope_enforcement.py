@@ -13,26 +13,15 @@ from pathlib import Path
 from src.sohnbot.broker.router import BrokerRouter
 from src.sohnbot.broker.scope_validator import ScopeValidator
 from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
-from scripts.migrate import apply_migrations
 
 
 class TestBrokerScopeEnforcement:
     """Test broker rejects scope violations."""
 
     @pytest.fixture
-    async def setup_database(self, tmp_path):
+    async def setup_database(self, migrated_db_path):
         """Set up test database with required schema for broker audit logging."""
-        db_path = tmp_path / "test.db"
-        migrations_dir = (
-            Path(__file__).parent.parent.parent
-            / "src"
-            / "sohnbot"
-            / "persistence"
-            / "migrations"
-        )
-
-        apply_migrations(db_path, migrations_dir)
-        db_manager = DatabaseManager(db_path)
+        db_manager = DatabaseManager(migrated_db_path)
         set_db_manager(db_manager)
 
         yield db_manager
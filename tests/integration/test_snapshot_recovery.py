@@ -5,23 +5,16 @@ Actual git snapshot logic will be implemented in Story 1.6.
 """
 
 import pytest
-from pathlib import Path
 from unittest.mock import AsyncMock, patch
 
 from src.sohnbot.broker import BrokerRouter, ScopeValidator
 from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
-from scripts.migrate import apply_migrations
 
 
 @pytest.fixture
-async def setup_database(tmp_path):
+async def setup_database(migrated_db_path):
     """Set up test database with migrations."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    apply_migrations(db_path, migrations_dir)
-
-    db_manager = DatabaseManager(db_path)
+    db_manager = DatabaseManager(migrated_db_path)
     set_db_manager(db_manager)
 
     yield db_manager
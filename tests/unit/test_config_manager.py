@@ -2,13 +2,26 @@
 
 import pytest
 import asyncio
+import copy
 from pathlib import Path
 import tempfile
-import os
 
+from src.sohnbot.config import manager as config_manager_module
 from src.sohnbot.config.manager import ConfigManager, initialize_config
 
 
+@pytest.fixture(scope="session")
+def initialized_manager():
+    """Global config manager, loaded once per test session. Treat as read-only."""
+    return initialize_config()
+
+
+@pytest.fixture
+def loaded_manager(initialized_manager):
+    """Per-test copy of the session manager, safe to mutate and subscribe to."""
+    return copy.deepcopy(initialized_manager)
+
+
 class TestConfigManagerInitialization:
     """Test ConfigManager initialization."""
 
@@ -73,18 +86,13 @@ class TestStaticConfigLoading:
         finally:
             temp_file.unlink()
 
-    def test_env_variable_override(self):
+    def test_env_variable_override(self, monkeypatch):
         """Environment variables should override TOML values."""
-        # Set env var
-        os.environ["SOHNBOT_DATABASE_PATH"] = "custom/path.db"
+        monkeypatch.setenv("SOHNBOT_DATABASE_PATH", "custom/path.db")
 
-        try:
-            manager = ConfigManager()
-            config = manager.load_static_config()
-            assert config["database.path"] == "custom/path.db"
-        finally:
-            # Clean up
-            del os.environ["SOHNBOT_DATABASE_PATH"]
+        manager = ConfigManager()
+        config = manager.load_static_config()
+        assert config["database.path"] == "custom/path.db"
 
 
 class TestDynamicConfigLoading:
@@ -134,109 +142,107 @@ class TestDynamicConfigLoading:
             temp_file.unlink()
 
 
+class TestLoadAll:
+    """Test combined static + dynamic loading."""
+
+    def test_load_all_matches_separate_loaders(self):
+        """load_all() should produce the same configs as the two loaders."""
+        separate = ConfigManager()
+        static = separate.load_static_config()
+        dynamic = separate.load_dynamic_config_defaults()
+
+        manager = ConfigManager()
+        assert manager.load_all() == (static, dynamic)
+        assert manager.static_config == static
+        assert manager.dynamic_config == dynamic
+
+    def test_load_all_parses_toml_once(self, monkeypatch):
+        """load_all() should read the config file a single time."""
+        manager = ConfigManager()
+        calls = []
+        original = manager._read_toml
+
+        def counting_read():
+            calls.append(1)
+            return original()
+
+        monkeypatch.setattr(manager, "_read_toml", counting_read)
+        manager.load_all()
+        assert len(calls) == 1
+
+
 class TestConfigGet:
     """Test configuration value retrieval."""
 
-    def test_get_static_value(self):
+    def test_get_static_value(self, initialized_manager):
         """Should retrieve static config value."""
-        manager = ConfigManager()
-        manager.load_static_config()
-
-        value = manager.get("database.path")
+        value = initialized_manager.get("database.path")
         assert value == "data/sohnbot.db"
 
-    def test_get_dynamic_value(self):
+    def test_get_dynamic_value(self, initialized_manager):
         """Should retrieve dynamic config value."""
-        manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
-
-        value = manager.get("logging.level")
+        value = initialized_manager.get("logging.level")
         assert value == "INFO"
 
-    def test_get_nonexistent_key(self):
+    def test_get_nonexistent_key(self, initialized_manager):
         """Should raise KeyError for nonexistent key."""
-        manager = ConfigManager()
-        manager.load_static_config()
-
         with pytest.raises(KeyError):
-            manager.get("nonexistent.key")
+            initialized_manager.get("nonexistent.key")
 
 
 class TestHotReload:
     """Test hot-reload functionality."""
 
     @pytest.mark.asyncio
-    async def test_update_dynamic_config(self):
+    async def test_update_dynamic_config(self, loaded_manager):
         """Should update dynamic config value."""
-        manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
-
         # Update dynamic value
-        await manager.update_dynamic_config("logging.level", "DEBUG")
+        await loaded_manager.update_dynamic_config("logging.level", "DEBUG")
 
         # Verify updated
-        assert manager.dynamic_config["logging.level"] == "DEBUG"
-        assert manager.get("logging.level") == "DEBUG"
+        assert loaded_manager.dynamic_config["logging.level"] == "DEBUG"
+        assert loaded_manager.get("logging.level") == "DEBUG"
 
-    @pytest.mark.asyncio
-    async def test_update_static_config_fails(self):
+    def test_update_static_config_fails(self, loaded_manager):
         """Should reject updates to static config."""
-        manager = ConfigManager()
-        manager.load_static_config()
-
         with pytest.raises(KeyError, match="Cannot hot-update static config"):
-            await manager.update_dynamic_config("database.path", "new/path.db")
+            loaded_manager._validate_update("database.path", "new/path.db")
 
-    @pytest.mark.asyncio
-    async def test_update_with_validation_failure(self):
+    def test_update_with_validation_failure(self, loaded_manager):
         """Should reject invalid values in update."""
-        manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
-
         with pytest.raises(ValueError, match="below minimum"):
-            await manager.update_dynamic_config("scheduler.tick_seconds", 5)
+            loaded_manager._validate_update("scheduler.tick_seconds", 5)
 
     @pytest.mark.asyncio
-    async def test_subscriber_notification(self):
+    async def test_subscriber_notification(self, loaded_manager):
         """Should notify subscribers on config update."""
-        manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
-
         # Track notifications
         notifications = []
 
         def subscriber(key: str, value: any):
             notifications.append((key, value))
 
-        manager.subscribe(subscriber)
+        loaded_manager.subscribe(subscriber)
 
         # Update config
-        await manager.update_dynamic_config("logging.level", "WARNING")
+        await loaded_manager.update_dynamic_config("logging.level", "WARNING")
 
         # Verify subscriber notified
         assert len(notifications) == 1
         assert notifications[0] == ("logging.level", "WARNING")
 
     @pytest.mark.asyncio
-    async def test_multiple_subscribers(self):
+    async def test_multiple_subscribers(self, loaded_manager):
         """Should notify all subscribers."""
-        manager = ConfigManager()
-        manager.load_static_config()
-        manager.load_dynamic_config_defaults()
-
         # Track notifications from multiple subscribers
         notifications1 = []
         notifications2 = []
 
-        manager.subscribe(lambda k, v: notifications1.append((k, v)))
-        manager.subscribe(lambda k, v: notifications2.append((k, v)))
+        loaded_manager.subscribe(lambda k, v: notifications1.append((k, v)))
+        loaded_manager.subscribe(lambda k, v: notifications2.append((k, v)))
 
         # Update config
-        await manager.update_dynamic_config("logging.level", "ERROR")
+        await loaded_manager.update_dynamic_config("logging.level", "ERROR")
 
         # Verify all subscribers notified
         assert len(notifications1) == 1
@@ -245,15 +251,60 @@ class TestHotReload:
         assert notifications2[0] == ("logging.level", "ERROR")
 
 
+    @pytest.mark.asyncio
+    async def test_subscribers_run_concurrently(self, loaded_manager):
+        """Async subscribers should be awaited concurrently, not one by one."""
+        second_started = asyncio.Event()
+
+        async def first(key, value):
+            # Deadlocks if subscribers are awaited sequentially.
+            await second_started.wait()
+
+        async def second(key, value):
+            second_started.set()
+
+        loaded_manager.subscribe(first)
+        loaded_manager.subscribe(second)
+
+        await asyncio.wait_for(
+            loaded_manager.update_dynamic_config("logging.level", "DEBUG"), timeout=1
+        )
+
+    @pytest.mark.asyncio
+    async def test_failing_subscriber_does_not_block_others(self, loaded_manager):
+        """A subscriber error should be isolated from other subscribers."""
+        notifications = []
+
+        def failing(key, value):
+            raise RuntimeError("boom")
+
+        loaded_manager.subscribe(failing)
+        loaded_manager.subscribe(lambda k, v: notifications.append((k, v)))
+
+        await loaded_manager.update_dynamic_config("logging.level", "DEBUG")
+
+        assert notifications == [("logging.level", "DEBUG")]
+
+
 class TestGlobalInstance:
     """Test global config manager instance."""
 
-    def test_initialize_config(self):
+    def test_initialize_config(self, initialized_manager):
         """Should initialize global config manager."""
+        assert isinstance(initialized_manager, ConfigManager)
+        assert len(initialized_manager.static_config) > 0
+        assert len(initialized_manager.dynamic_config) > 0
+
+    def test_initialize_config_is_memoized(self, initialized_manager):
+        """Repeated calls with the same files should reuse the global instance."""
+        assert initialize_config() is initialized_manager
+
+    def test_initialize_config_reloads_after_reset(self, initialized_manager, monkeypatch):
+        """Resetting the global should force a fresh load."""
+        monkeypatch.setattr(config_manager_module, "_config_manager", None)
         manager = initialize_config()
-        assert isinstance(manager, ConfigManager)
-        assert len(manager.static_config) > 0
-        assert len(manager.dynamic_config) > 0
+        assert manager is not initialized_manager
+        assert manager.static_config == initialized_manager.static_config
 
 
 class TestTOMLFlattening:
@@ -279,6 +330,31 @@ class TestTOMLFlattening:
             "database.path": "data/test.db",
         }
 
+    def test_flattened_toml_reused_across_loaders(self, monkeypatch):
+        """Separate static and dynamic loads should flatten the file once."""
+        manager = ConfigManager()
+        calls = []
+        original = manager._flatten_toml
+
+        def counting_flatten(data):
+            calls.append(1)
+            return original(data)
+
+        monkeypatch.setattr(manager, "_flatten_toml", counting_flatten)
+        manager.load_static_config()
+        manager.load_dynamic_config_defaults()
+        assert len(calls) == 1
+
+    def test_flattened_toml_invalidated_on_file_change(self, tmp_path):
+        """A modified config file should be re-read."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('[scheduler]\ntick_seconds = 60\n')
+        manager = ConfigManager(config_file=config_file)
+        assert manager.load_dynamic_config_defaults()["scheduler.tick_seconds"] == 60
+
+        config_file.write_text('[scheduler]\ntick_seconds = 120\n')
+        assert manager.load_dynamic_config_defaults()["scheduler.tick_seconds"] == 120
+
     def test_flatten_deeply_nested(self):
         """Should handle deeply nested structures."""
         manager = ConfigManager()
@@ -298,43 +374,24 @@ class TestTOMLFlattening:
 class TestEnvParsing:
     """Test environment variable parsing."""
 
-    def test_parse_string(self):
-        """Should parse string values."""
-        manager = ConfigManager()
-        assert manager._parse_env_value("test", str) == "test"
-
-    def test_parse_int(self):
-        """Should parse integer values."""
-        manager = ConfigManager()
-        assert manager._parse_env_value("42", int) == 42
-
-    def test_parse_float(self):
-        """Should parse float values."""
-        manager = ConfigManager()
-        assert manager._parse_env_value("3.14", float) == 3.14
-
-    def test_parse_bool_true(self):
-        """Should parse boolean true values."""
-        manager = ConfigManager()
-        assert manager._parse_env_value("true", bool) is True
-        assert manager._parse_env_value("1", bool) is True
-        assert manager._parse_env_value("yes", bool) is True
-
-    def test_parse_bool_false(self):
-        """Should parse boolean false values."""
-        manager = ConfigManager()
-        assert manager._parse_env_value("false", bool) is False
-        assert manager._parse_env_value("0", bool) is False
-        assert manager._parse_env_value("no", bool) is False
-
-    def test_parse_list(self):
-        """Should parse comma-separated lists."""
-        manager = ConfigManager()
-        result = manager._parse_env_value("a,b,c", list)
-        assert result == ["a", "b", "c"]
-
-    def test_parse_list_with_spaces(self):
-        """Should trim whitespace in list parsing."""
-        manager = ConfigManager()
-        result = manager._parse_env_value("a, b , c", list)
-        assert result == ["a", "b", "c"]
+    @pytest.mark.parametrize(
+        "raw,target_type,expected",
+        [
+            ("test", str, "test"),
+            ("42", int, 42),
+            ("3.14", float, 3.14),
+            ("true", bool, True),
+            ("1", bool, True),
+            ("yes", bool, True),
+            ("false", bool, False),
+            ("0", bool, False),
+            ("no", bool, False),
+            ("a,b,c", list, ["a", "b", "c"]),
+            ("a, b , c", list, ["a", "b", "c"]),
+        ],
+    )
+    def test_parse_env_value(self, raw, target_type, expected):
+        """Should parse env strings into the target type (lists are trimmed)."""
+        result = ConfigManager._parse_env_value(raw, target_type)
+        assert result == expected
+        assert type(result) is type(expected)
@@ -1,10 +1,14 @@
 """Unit tests for configuration registry."""
 
+from collections.abc import Mapping
+
 import pytest
 
 from src.sohnbot.config.registry import (
     ConfigKey,
     REGISTRY,
+    STATIC_KEYS,
+    DYNAMIC_KEYS,
     get_config_key,
     validate_config_value,
     get_default_values,
@@ -16,40 +20,37 @@ from src.sohnbot.config.registry import (
 class TestConfigKey:
     """Test ConfigKey dataclass."""
 
-    def test_config_key_static_restart_required(self):
-        """Static config keys should have restart_required=True."""
-        key = ConfigKey(tier="static", value_type=str, default="test")
-        assert key.restart_required is True
-
-    def test_config_key_dynamic_no_restart(self):
-        """Dynamic config keys should have restart_required=False."""
-        key = ConfigKey(tier="dynamic", value_type=int, default=42)
-        assert key.restart_required is False
-
-    def test_config_key_with_bounds(self):
-        """Config keys can have min/max value bounds."""
-        key = ConfigKey(
-            tier="dynamic",
-            value_type=int,
-            default=60,
-            min_value=10,
-            max_value=300
-        )
-        assert key.min_value == 10
-        assert key.max_value == 300
-
-    def test_config_key_with_validator(self):
+    @pytest.mark.parametrize(
+        "kwargs,attr,expected",
+        [
+            ({"tier": "static", "value_type": str, "default": "test"}, "restart_required", True),
+            ({"tier": "dynamic", "value_type": int, "default": 42}, "restart_required", False),
+            (
+                {"tier": "dynamic", "value_type": int, "default": 60, "min_value": 10},
+                "min_value",
+                10,
+            ),
+            (
+                {"tier": "dynamic", "value_type": int, "default": 60, "max_value": 300},
+                "max_value",
+                300,
+            ),
+        ],
+    )
+    def test_config_key_attr(self, kwargs, attr, expected):
+        """restart_required is derived from tier; bounds are stored as given."""
+        assert getattr(ConfigKey(**kwargs), attr) == expected
+
+    @pytest.mark.parametrize("value,expected", [("DEBUG", True), ("INVALID", False)])
+    def test_config_key_with_validator(self, value, expected):
         """Config keys can have custom validator functions."""
-        validator = lambda v: v in ("DEBUG", "INFO", "ERROR")
         key = ConfigKey(
             tier="dynamic",
             value_type=str,
             default="INFO",
-            validator=validator
+            validator=lambda v: v in ("DEBUG", "INFO", "ERROR"),
         )
-        assert key.validator is not None
-        assert key.validator("DEBUG") is True
-        assert key.validator("INVALID") is False
+        assert key.validator(value) is expected
 
 
 class TestRegistry:
@@ -160,13 +161,20 @@ class TestHelperFunctions:
     """Test helper functions."""
 
     def test_get_default_values(self):
-        """Should return dict of all default values."""
+        """Should return a mapping of all default values."""
         defaults = get_default_values()
-        assert isinstance(defaults, dict)
+        assert isinstance(defaults, Mapping)
         assert len(defaults) == len(REGISTRY)
         assert "scope.allowed_roots" in defaults
         assert "scheduler.tick_seconds" in defaults
 
+    def test_get_default_values_is_cached_and_read_only(self):
+        """Defaults should be built once and protected from mutation."""
+        defaults = get_default_values()
+        assert get_default_values() is defaults
+        with pytest.raises(TypeError):
+            defaults["logging.level"] = "DEBUG"
+
     def test_get_static_keys(self):
         """Should return list of static config keys."""
         static = get_static_keys()
@@ -187,14 +195,15 @@ class TestHelperFunctions:
 
     def test_static_and_dynamic_partition(self):
         """Static and dynamic keys should partition the registry."""
-        static = set(get_static_keys())
-        dynamic = set(get_dynamic_keys())
-        all_keys = set(REGISTRY.keys())
-
         # No overlap
-        assert len(static & dynamic) == 0
+        assert STATIC_KEYS.isdisjoint(DYNAMIC_KEYS)
         # Complete coverage
-        assert static | dynamic == all_keys
+        assert STATIC_KEYS | DYNAMIC_KEYS == REGISTRY.keys()
+
+    def test_key_getters_match_frozensets(self):
+        """Getters should expose the precomputed tier partition."""
+        assert set(get_static_keys()) == STATIC_KEYS
+        assert set(get_dynamic_keys()) == DYNAMIC_KEYS
 
 
 class TestSecurityInvariants:
@@ -1,25 +1,54 @@
 """Unit tests for file operations capability."""
 
 import asyncio
+import os
 from pathlib import Path
 
 import pytest
 
-from src.sohnbot.capabilities.files.file_ops import FileCapabilityError, FileOps
+from src.sohnbot.capabilities.files.file_ops import (
+    EXCLUDED_DIRS,
+    FileCapabilityError,
+    FileOps,
+)
+
+
+@pytest.fixture(scope="module")
+def shared_tree(tmp_path_factory):
+    """Read-only file tree shared by the tests in this module.
+
+    ``root/`` holds one searchable file plus the excluded directories;
+    the single files next to it are used by the read_file tests.
+    """
+    base = tmp_path_factory.mktemp("file_ops")
+    root = base / "root"
+    excluded_dirs = ((".git", "hidden.txt"), (".venv", "venv.txt"), ("node_modules", "mod.js"))
+    for excluded, name in excluded_dirs:
+        # The first leaf also creates root/.
+        (root / excluded).mkdir(parents=True, exist_ok=True)
+        (root / excluded / name).write_text("hidden")
+    (root / "a.txt").write_text("alpha\nneedle\nomega\n")
+    (base / "note.txt").write_text("hello world")
+    (base / "big.txt").write_text("x" * 2048)
+    (base / "bin.dat").write_bytes(b"\x00\x01\x02")
+    return base
 
 
-def test_list_files_includes_metadata_and_excludes_dirs(tmp_path):
-    root = tmp_path / "root"
-    root.mkdir()
-    (root / "a.txt").write_text("a")
-    (root / ".git").mkdir()
-    (root / ".git" / "hidden.txt").write_text("hidden")
-    (root / ".venv").mkdir()
-    (root / ".venv" / "venv.txt").write_text("hidden")
-    (root / "node_modules").mkdir()
-    (root / "node_modules" / "mod.js").write_text("hidden")
+@pytest.fixture(scope="module")
+def file_ops():
+    return FileOps()
+
+
+def test_list_files_includes_metadata_and_excludes_dirs(shared_tree, file_ops):
+    root = shared_tree / "root"
+    # Excluded dirs must hold files, otherwise the count below proves nothing.
+    with os.scandir(root) as entries:
+        excluded = [entry.path for entry in entries if entry.name in EXCLUDED_DIRS]
+    assert len(excluded) == len(EXCLUDED_DIRS)
+    for path in excluded:
+        with os.scandir(path) as children:
+            assert any(child.is_file() for child in children)
 
-    file_ops = FileOps()
     result = file_ops.list_files(str(root))
 
     assert result["count"] == 1
@@ -30,10 +59,8 @@ def test_list_files_includes_metadata_and_excludes_dirs(tmp_path):
     assert isinstance(file_entry["modified_at"], int)
 
 
-def test_read_file_success(tmp_path):
-    file_path = tmp_path / "note.txt"
-    file_path.write_text("hello world")
-    file_ops = FileOps()
+def test_read_file_success(shared_tree, file_ops):
+    file_path = shared_tree / "note.txt"
 
     result = file_ops.read_file(str(file_path), max_size_mb=10)
 
@@ -42,10 +69,8 @@ def test_read_file_success(tmp_path):
     assert result["path"] == str(file_path)
 
 
-def test_read_file_rejects_oversize(tmp_path):
-    file_path = tmp_path / "big.txt"
-    file_path.write_text("x" * 2048)
-    file_ops = FileOps()
+def test_read_file_rejects_oversize(shared_tree, file_ops):
+    file_path = shared_tree / "big.txt"
 
     with pytest.raises(FileCapabilityError) as exc:
         file_ops.read_file(str(file_path), max_size_mb=0)
@@ -55,10 +80,8 @@ def test_read_file_rejects_oversize(tmp_path):
     assert "exceeds" in err["message"].lower()
 
 
-def test_read_file_rejects_binary(tmp_path):
-    file_path = tmp_path / "bin.dat"
-    file_path.write_bytes(b"\x00\x01\x02")
-    file_ops = FileOps()
+def test_read_file_rejects_binary(shared_tree, file_ops):
+    file_path = shared_tree / "bin.dat"
 
     with pytest.raises(FileCapabilityError) as exc:
         file_ops.read_file(str(file_path), max_size_mb=10)
@@ -69,11 +92,8 @@ def test_read_file_rejects_binary(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_search_files_returns_matches(tmp_path):
-    root = tmp_path / "project"
-    root.mkdir()
-    (root / "a.txt").write_text("alpha\nneedle\nomega\n")
-    file_ops = FileOps()
+async def test_search_files_returns_matches(shared_tree, file_ops):
+    root = shared_tree / "root"
 
     result = await file_ops.search_files(str(root), "needle", timeout_seconds=5)
 
@@ -82,33 +102,83 @@ async def test_search_files_returns_matches(tmp_path):
 
 
 @pytest.mark.asyncio
-async def test_search_files_timeout(tmp_path, monkeypatch):
-    root = tmp_path / "project"
-    root.mkdir()
-    (root / "a.txt").write_text("needle")
-    file_ops = FileOps()
+async def test_search_files_timeout(shared_tree, file_ops, monkeypatch):
+    root = shared_tree / "root"
 
     class DummyProcess:
         returncode = 0
+        killed = False
 
         async def communicate(self):
-            await asyncio.sleep(0.05)
-            return b"", b""
+            raise asyncio.TimeoutError()
 
         def kill(self):
-            return None
+            self.killed = True
 
         async def wait(self):
             return 0
 
+    process = DummyProcess()
+
     async def fake_subprocess_exec(*_args, **_kwargs):
-        return DummyProcess()
+        return process
 
     monkeypatch.setattr(asyncio, "create_subprocess_exec", fake_subprocess_exec)
 
     with pytest.raises(FileCapabilityError) as exc:
-        await file_ops.search_files(str(root), "needle", timeout_seconds=0)
+        await file_ops.search_files(str(root), "needle", timeout_seconds=5)
 
     err = exc.value.to_dict()
     assert err["code"] == "search_timeout"
+    assert err["retryable"] is True
+    assert process.killed is True
+
+
+
+def test_list_files_caches_until_mtime_changes(tmp_path, monkeypatch):
+    root = tmp_path / "root"
+    sub = root / "sub"
+    sub.mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (sub / "b.txt").write_text("b")
+    # Age the directories past the racy window so their listings get cached.
+    for directory in (root, sub):
+        os.utime(directory, ns=(0, 1_000_000_000))
+
+    scanned = []
+    real_scandir = os.scandir
+
+    def counting_scandir(path):
+        scanned.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", counting_scandir)
+    file_ops = FileOps()
+
+    assert file_ops.list_files(str(root))["count"] == 2
+    assert len(scanned) == 2
+
+    scanned.clear()
+    assert file_ops.list_files(str(root))["count"] == 2
+    assert scanned == []
+
+    # A new nested file bumps only the subdirectory's mtime.
+    (sub / "c.txt").write_text("c")
+    result = file_ops.list_files(str(root))
+    assert result["count"] == 3
+    assert scanned == [str(sub)]
+
+
+def test_list_files_reports_fresh_metadata_for_cached_dirs(tmp_path):
+    root = tmp_path / "root"
+    root.mkdir()
+    target = root / "a.txt"
+    target.write_text("a")
+    os.utime(root, ns=(0, 1_000_000_000))
+    file_ops = FileOps()
+    file_ops.list_files(str(root))
+
+    target.write_text("longer content")
+    result = file_ops.list_files(str(root))
 
+    assert result["files"][0]["size"] == len("longer content")
@@ -1,38 +1,115 @@
 """Unit tests for git status/diff capability operations."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.sohnbot.capabilities.git import git_ops
 from src.sohnbot.capabilities.git.git_ops import git_checkout, git_commit, git_diff, git_status
 from src.sohnbot.capabilities.git.snapshot_manager import GitCapabilityError
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
+
+@dataclass(slots=True)
 class _FakeProcess:
-    def __init__(self, returncode: int, stdout: bytes, stderr: bytes):
-        self.returncode = returncode
-        self._stdout = stdout
-        self._stderr = stderr
-        self.kill = MagicMock()
-        self.wait = AsyncMock()
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+    killed: bool = False
+
+    async def communicate(self):
+        return self.stdout, self.stderr
+
+    def kill(self):
+        self.killed = True
 
+    async def wait(self):
+        return self.returncode
+
+
+@dataclass(slots=True)
+class _HangingProcess(_FakeProcess):
     async def communicate(self):
-        return self._stdout, self._stderr
-
-
-@pytest.mark.asyncio
-async def test_git_status_success_parse():
-    out = (
-        "# branch.head main\n"
-        "# branch.ab +2 -1\n"
-        "1 M. N... 100644 100644 100644 a a src/a.py\n"
-        "1 .M N... 100644 100644 100644 a a src/b.py\n"
-        "? src/new.py\n"
-    ).encode()
-    proc = _FakeProcess(0, out, b"")
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        data = await git_status("/repo")
+        await asyncio.get_running_loop().create_future()
+
+
+_STATUS_BASIC_OUT = (
+    b"# branch.head main\n"
+    b"# branch.ab +2 -1\n"
+    b"1 M. N... 100644 100644 100644 a a src/a.py\n"
+    b"1 .M N... 100644 100644 100644 a a src/b.py\n"
+    b"? src/new.py\n"
+)
+_STATUS_RENAME_OUT = (
+    b"# branch.head main\n"
+    b"2 R. N... 100644 100644 100644 123 456 R100\told/name.txt\tnew/name.txt\n"
+)
+_DIFF_WT_OUT = b"diff --git a/a.py b/a.py\n@@ -1 +1 @@\n-a\n+b\n"
+_DIFF_HEADER_OUT = b"diff --git a/a.py b/a.py\n"
+_DIFF_BINARY_OUT = b"Binary files a/img.bin and b/img.bin differ\n"
+
+# Successful processes are never killed, so one instance per payload is
+# safe to hand out to every test that expects it.
+_FAKE_OK_STATUS = _FakeProcess(0, _STATUS_BASIC_OUT, b"")
+_FAKE_OK_STATUS_RENAME = _FakeProcess(0, _STATUS_RENAME_OUT, b"")
+_FAKE_OK_DIFF_WT = _FakeProcess(0, _DIFF_WT_OUT, b"")
+_FAKE_OK_DIFF_HEADER = _FakeProcess(0, _DIFF_HEADER_OUT, b"")
+_FAKE_OK_DIFF_BINARY = _FakeProcess(0, _DIFF_BINARY_OUT, b"")
+_FAKE_NOT_A_REPO = _FakeProcess(128, b"", b"fatal: not a git repository")
+
+
+@pytest.fixture
+def fake_subproc():
+    """Queue of zero-arg factories, one per expected subprocess spawn."""
+    return []
+
+
+@pytest.fixture(autouse=True)
+def _fake_subprocess_exec(monkeypatch, fake_subproc):
+    async def _exec(*_args, **_kwargs):
+        return fake_subproc.pop(0)()
+
+    monkeypatch.setattr(git_ops.asyncio, "create_subprocess_exec", _exec)
+    yield
+    assert fake_subproc == [], "queued fake processes were never spawned"
+
+
+@pytest.fixture
+def patch_run_git(monkeypatch):
+    """Install a plain async stub for ``_run_git_command``.
+
+    Accepts either a callable, installed as-is, or a dict keyed by git
+    subcommand (``"switch"``, ``"rev-parse"``, ...) whose values are
+    ``(stdout, stderr)`` tuples or exceptions to raise. Subcommands missing
+    from the dict succeed with empty output.
+    """
+
+    def _install(responses):
+        if callable(responses):
+            stub = responses
+        else:
+
+            async def stub(*, cmd, **_kwargs):
+                result = responses.get(cmd[3], ("", ""))
+                if isinstance(result, Exception):
+                    raise result
+                return result
+
+        monkeypatch.setattr(git_ops, "_run_git_command", stub)
+
+    return _install
+
+
+def _raise_file_not_found():
+    raise FileNotFoundError()
+
+
+async def test_git_status_success_parse(fake_subproc):
+    fake_subproc.append(lambda: _FAKE_OK_STATUS)
+    data = await git_status("/repo")
     assert data["branch"] == "main"
     assert data["ahead"] == 2
     assert data["behind"] == 1
@@ -41,89 +118,60 @@ async def test_git_status_success_parse():
     assert "src/new.py" in data["untracked"]
 
 
-@pytest.mark.asyncio
-async def test_git_status_non_git_directory_error():
-    proc = _FakeProcess(128, b"", b"fatal: not a git repository")
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_status("/not-repo")
+async def test_git_status_non_git_directory_error(fake_subproc):
+    fake_subproc.append(lambda: _FAKE_NOT_A_REPO)
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_status("/not-repo")
     assert exc_info.value.code == "not_a_git_repo"
 
 
-@pytest.mark.asyncio
-async def test_git_status_git_binary_not_found():
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec",
-        AsyncMock(side_effect=FileNotFoundError()),
-    ):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_status("/repo")
+async def test_git_status_git_binary_not_found(fake_subproc):
+    fake_subproc.append(_raise_file_not_found)
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_status("/repo")
     assert exc_info.value.code == "git_not_found"
 
 
-@pytest.mark.asyncio
-async def test_git_status_timeout_handling():
-    proc = _FakeProcess(0, b"", b"")
-
-    async def _slow_communicate():
-        await asyncio.sleep(0.05)
-        return b"", b""
-
-    proc.communicate = _slow_communicate
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_status("/repo", timeout_seconds=0.001)
+async def test_git_status_timeout_handling(fake_subproc):
+    proc = _HangingProcess(0, b"", b"")
+    fake_subproc.append(lambda: proc)
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_status("/repo", timeout_seconds=0.001)
     assert exc_info.value.code == "git_status_timeout"
-    proc.kill.assert_called_once()
+    assert proc.killed is True
 
 
-@pytest.mark.asyncio
-async def test_git_diff_working_tree_vs_staged():
-    diff_text = "diff --git a/a.py b/a.py\n@@ -1 +1 @@\n-a\n+b\n".encode()
-    proc = _FakeProcess(0, diff_text, b"")
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        data = await git_diff("/repo")
+async def test_git_diff_working_tree_vs_staged(fake_subproc):
+    fake_subproc.append(lambda: _FAKE_OK_DIFF_WT)
+    data = await git_diff("/repo")
     assert "diff --git" in data["diff"]
     assert data["diff_type"] == "working_tree"
 
 
-@pytest.mark.asyncio
-async def test_git_diff_staged_vs_head():
-    proc = _FakeProcess(0, b"diff --git a/a.py b/a.py\n", b"")
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        data = await git_diff("/repo", diff_type="staged")
+async def test_git_diff_staged_vs_head(fake_subproc):
+    fake_subproc.append(lambda: _FAKE_OK_DIFF_HEADER)
+    data = await git_diff("/repo", diff_type="staged")
     assert data["diff_type"] == "staged"
 
 
-@pytest.mark.asyncio
-async def test_git_diff_commit_to_commit():
-    proc = _FakeProcess(0, b"diff --git a/a.py b/a.py\n", b"")
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        data = await git_diff("/repo", diff_type="commit", commit_refs=["HEAD~1", "HEAD"])
+async def test_git_diff_commit_to_commit(fake_subproc):
+    fake_subproc.append(lambda: _FAKE_OK_DIFF_HEADER)
+    data = await git_diff("/repo", diff_type="commit", commit_refs=["HEAD~1", "HEAD"])
     assert data["commit_refs"] == ["HEAD~1", "HEAD"]
 
 
-@pytest.mark.asyncio
-async def test_git_diff_binary_file_handling():
-    proc = _FakeProcess(0, b"Binary files a/img.bin and b/img.bin differ\n", b"")
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        data = await git_diff("/repo")
+async def test_git_diff_binary_file_handling(fake_subproc):
+    fake_subproc.append(lambda: _FAKE_OK_DIFF_BINARY)
+    data = await git_diff("/repo")
     assert "Binary files" in data["diff"]
 
 
-@pytest.mark.asyncio
-async def test_git_status_porcelain_v2_rename_tab_paths():
-    out = (
-        "# branch.head main\n"
-        "2 R. N... 100644 100644 100644 123 456 R100\told/name.txt\tnew/name.txt\n"
-    ).encode()
-    proc = _FakeProcess(0, out, b"")
-    with patch("src.sohnbot.capabilities.git.git_ops.asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
-        data = await git_status("/repo")
+async def test_git_status_porcelain_v2_rename_tab_paths(fake_subproc):
+    fake_subproc.append(lambda: _FAKE_OK_STATUS_RENAME)
+    data = await git_status("/repo")
     assert "new/name.txt" in data["staged"]
 
 
-@pytest.mark.asyncio
 async def test_git_checkout_success_case():
     with patch(
         "src.sohnbot.capabilities.git.git_ops._run_git_command",
@@ -133,208 +181,175 @@ async def test_git_checkout_success_case():
     assert data["branch"] == "main"
     assert data["commit_hash"] == "abc123"
     first_cmd = mock_run.await_args_list[0].kwargs["cmd"]
-    assert first_cmd == ["git", "-C", "/repo", "switch", "--", "main"]
+    assert first_cmd == ("git", "-C", "/repo", "switch", "--", "main")
 
 
-@pytest.mark.asyncio
-async def test_git_checkout_local_branch_validation_valid_cases():
-    async def _mock_run(**kwargs):
-        cmd = kwargs.get("cmd", [])
-        if cmd and cmd[-2:] == ["--short", "HEAD"]:
-            return ("abc123\n", "")
-        return ("", "")
+@pytest.mark.parametrize(
+    "branch", ["main", "feature/new-feature", "snapshot/edit-2026-02-27-1430"]
+)
+async def test_git_checkout_local_branch_validation_valid_cases(branch, patch_run_git):
+    patch_run_git({"rev-parse": ("abc123\n", "")})
+    data = await git_checkout("/repo", branch)
+    assert data["branch"] == branch
 
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(side_effect=_mock_run),
-    ):
-        for branch in ("main", "feature/new-feature", "snapshot/edit-2026-02-27-1430"):
-            data = await git_checkout("/repo", branch)
-            assert data["branch"] == branch
 
-
-@pytest.mark.asyncio
-async def test_git_checkout_remote_branch_rejection_invalid_cases():
-    for branch in ("origin/main", "remotes/origin/feature", "refs/remotes/origin/main"):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_checkout("/repo", branch)
-        assert exc_info.value.code == "invalid_branch"
+@pytest.mark.parametrize(
+    "branch", ["origin/main", "remotes/origin/feature", "refs/remotes/origin/main"]
+)
+async def test_git_checkout_remote_branch_rejection_invalid_cases(branch):
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_checkout("/repo", branch)
+    assert exc_info.value.code == "invalid_branch"
 
 
-@pytest.mark.asyncio
-async def test_git_checkout_path_traversal_rejection():
-    for branch in ("../main", "..\\main"):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_checkout("/repo", branch)
-        assert exc_info.value.code == "invalid_branch"
+@pytest.mark.parametrize("branch", ["../main", "..\\main"])
+async def test_git_checkout_path_traversal_rejection(branch):
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_checkout("/repo", branch)
+    assert exc_info.value.code == "invalid_branch"
 
 
-@pytest.mark.asyncio
-async def test_git_checkout_rejects_branch_starting_with_slash_or_dash():
-    for branch in ("/main", "-main"):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_checkout("/repo", branch)
-        assert exc_info.value.code == "invalid_branch"
+@pytest.mark.parametrize("branch", ["/main", "-main"])
+async def test_git_checkout_rejects_branch_starting_with_slash_or_dash(branch):
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_checkout("/repo", branch)
+    assert exc_info.value.code == "invalid_branch"
 
 
-@pytest.mark.asyncio
-async def test_git_checkout_non_existent_branch_error():
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(
-            side_effect=GitCapabilityError(
+async def test_git_checkout_non_existent_branch_error(patch_run_git):
+    patch_run_git(
+        {
+            "switch": GitCapabilityError(
                 code="git_command_failed",
                 message="Git command failed",
                 details={"stderr": "error: pathspec 'nope' did not match any file(s) known to git"},
                 retryable=False,
             )
-        ),
-    ):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_checkout("/repo", "nope")
+        }
+    )
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_checkout("/repo", "nope")
     assert exc_info.value.code == "checkout_failed"
 
 
-@pytest.mark.asyncio
-async def test_git_checkout_timeout_handling():
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(
-            side_effect=GitCapabilityError(
+async def test_git_checkout_timeout_handling(patch_run_git):
+    patch_run_git(
+        {
+            "switch": GitCapabilityError(
                 code="checkout_timeout",
                 message="timed out",
                 details={"repo_path": "/repo"},
                 retryable=True,
             )
-        ),
-    ):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_checkout("/repo", "main", timeout_seconds=1)
+        }
+    )
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_checkout("/repo", "main", timeout_seconds=1)
     assert exc_info.value.code == "checkout_timeout"
 
 
-@pytest.mark.asyncio
-async def test_git_commit_success_case():
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(side_effect=[("", ""), ("[main] commit\n", ""), ("abc123\n", ""), ("a.py\nb.py\n", "")]),
-    ):
-        data = await git_commit("/repo", "Fix: Resolve lint issue")
+async def test_git_commit_success_case(patch_run_git):
+    patch_run_git({"commit": ("[main] commit\n", ""), "log": ("abc123\n\na.py\nb.py\n", "")})
+    data = await git_commit("/repo", "Fix: Resolve lint issue")
     assert data["commit_hash"] == "abc123"
     assert data["files_changed"] == 2
     assert data["message"] == "Fix: Resolve lint issue"
 
 
-@pytest.mark.asyncio
 async def test_git_commit_with_specific_file_paths():
     with patch(
         "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(side_effect=[("", ""), ("", ""), ("", ""), ("abc123\n", ""), ("a.py\n", "")]),
+        AsyncMock(side_effect=[("", ""), ("", ""), ("", ""), ("abc123\n\na.py\n", "")]),
     ) as mock_run:
         data = await git_commit("/repo", "Feat: Add feature", file_paths=["a.py", "b.py"])
     assert data["files_changed"] == 1
     add_calls = [call.kwargs["cmd"] for call in mock_run.await_args_list if call.kwargs["cmd"][3] == "add"]
-    assert add_calls[0] == ["git", "-C", "/repo", "add", "--", "a.py"]
-    assert add_calls[1] == ["git", "-C", "/repo", "add", "--", "b.py"]
+    assert add_calls[0] == ("git", "-C", "/repo", "add", "--", "a.py")
+    assert add_calls[1] == ("git", "-C", "/repo", "add", "--", "b.py")
 
 
-@pytest.mark.asyncio
 async def test_git_commit_with_all_changes_file_paths_none():
     with patch(
         "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(side_effect=[("", ""), ("", ""), ("abc123\n", ""), ("a.py\n", "")]),
+        AsyncMock(side_effect=[("", ""), ("", ""), ("abc123\n\na.py\n", "")]),
     ) as mock_run:
         await git_commit("/repo", "Chore: Update housekeeping", file_paths=None)
     first_cmd = mock_run.await_args_list[0].kwargs["cmd"]
-    assert first_cmd == ["git", "-C", "/repo", "add", "-u"]
+    assert first_cmd == ("git", "-C", "/repo", "add", "-u")
 
 
-@pytest.mark.asyncio
-async def test_git_commit_nothing_to_commit_graceful():
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(
-            side_effect=[
-                ("", ""),
-                GitCapabilityError(
-                    code="git_command_failed",
-                    message="Git command failed",
-                    details={"stderr": "nothing to commit, working tree clean"},
-                    retryable=False,
-                ),
-            ]
-        ),
-    ):
-        data = await git_commit("/repo", "Fix: No-op change")
+async def test_git_commit_nothing_to_commit_graceful(patch_run_git):
+    patch_run_git(
+        {
+            "commit": GitCapabilityError(
+                code="git_command_failed",
+                message="Git command failed",
+                details={"stderr": "nothing to commit, working tree clean"},
+                retryable=False,
+            )
+        }
+    )
+    data = await git_commit("/repo", "Fix: No-op change")
     assert data["commit_hash"] is None
     assert data["files_changed"] == 0
 
 
-@pytest.mark.asyncio
 async def test_git_commit_invalid_message_format():
     with pytest.raises(GitCapabilityError) as exc_info:
         await git_commit("/repo", "invalid message")
     assert exc_info.value.code == "invalid_commit_message"
 
 
-@pytest.mark.asyncio
 async def test_git_commit_empty_message_rejection():
     with pytest.raises(GitCapabilityError) as exc_info:
         await git_commit("/repo", " ")
     assert exc_info.value.code == "invalid_commit_message"
 
 
-@pytest.mark.asyncio
-async def test_git_commit_timeout_handling():
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(
-            side_effect=GitCapabilityError(
+async def test_git_commit_timeout_handling(patch_run_git):
+    patch_run_git(
+        {
+            "add": GitCapabilityError(
                 code="commit_timeout",
                 message="timed out",
                 details={"repo_path": "/repo"},
                 retryable=True,
             )
-        ),
-    ):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_commit("/repo", "Fix: Timeout", timeout_seconds=1)
+        }
+    )
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_commit("/repo", "Fix: Timeout", timeout_seconds=1)
     assert exc_info.value.code == "commit_timeout"
 
 
-@pytest.mark.asyncio
-async def test_git_commit_git_binary_not_found():
-    with patch(
-        "src.sohnbot.capabilities.git.git_ops._run_git_command",
-        AsyncMock(
-            side_effect=GitCapabilityError(
+async def test_git_commit_git_binary_not_found(patch_run_git):
+    patch_run_git(
+        {
+            "add": GitCapabilityError(
                 code="git_not_found",
                 message="git CLI is required",
                 details={},
                 retryable=False,
             )
-        ),
-    ):
-        with pytest.raises(GitCapabilityError) as exc_info:
-            await git_commit("/repo", "Fix: Missing git")
+        }
+    )
+    with pytest.raises(GitCapabilityError) as exc_info:
+        await git_commit("/repo", "Fix: Missing git")
     assert exc_info.value.code == "git_not_found"
 
 
-@pytest.mark.asyncio
 async def test_git_commit_rejects_outside_repo_file_path():
     with pytest.raises(GitCapabilityError) as exc_info:
         await git_commit("/repo", "Fix: Scoped commit", file_paths=["../outside.txt"])
     assert exc_info.value.code == "invalid_commit_file_path"
 
 
-@pytest.mark.asyncio
 async def test_git_commit_rejects_option_like_file_path():
     with pytest.raises(GitCapabilityError) as exc_info:
         await git_commit("/repo", "Fix: Scoped commit", file_paths=["-p"])
     assert exc_info.value.code == "invalid_commit_file_path"
 
 
-@pytest.mark.asyncio
 async def test_git_commit_rejects_too_long_total_message():
     long_summary = "a" * 4090
     with pytest.raises(GitCapabilityError) as exc_info:
@@ -1,14 +1,14 @@
 """Unit tests for observability health checks (Story 3.2)."""
 
-import time
-from pathlib import Path
+import shutil
 from unittest.mock import AsyncMock, patch
 
 import pytest
+import pytest_asyncio
 
-from scripts.migrate import apply_migrations
 from src.sohnbot.capabilities.observe import NotifierState, ResourceUsage, SchedulerState
 from src.sohnbot.config.manager import initialize_config
+from src.sohnbot.observability import health_checks
 from src.sohnbot.observability.health_checks import (
     check_disk_usage,
     check_job_timeouts,
@@ -18,30 +18,68 @@ from src.sohnbot.observability.health_checks import (
     check_sqlite_writable,
     run_all_health_checks,
 )
+from src.sohnbot.observability import snapshot_collector
 from src.sohnbot.observability.snapshot_collector import collect_snapshot
+from src.sohnbot.persistence import db as db_module
 from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
 
-MIGRATIONS_DIR = (
-    Path(__file__).parent.parent.parent
-    / "src"
-    / "sohnbot"
-    / "persistence"
-    / "migrations"
-)
+# Config values seen by the checks, keyed by registry key; unset keys fall
+# back to the default each check passes in.
+CFG_INT_OVERRIDES: dict[str, int] = {}
+CFG_BOOL_OVERRIDES: dict[str, bool] = {}
 
 
-@pytest.fixture
-async def db_with_tables(tmp_path):
-    db_path = tmp_path / "test.db"
-    apply_migrations(db_path, MIGRATIONS_DIR)
+def _fake_cfg_int(key: str, default: int | None = None) -> int | None:
+    return CFG_INT_OVERRIDES.get(key, default)
+
+
+def _fake_cfg_bool(key: str, default: bool | None = None) -> bool | None:
+    return CFG_BOOL_OVERRIDES.get(key, default)
+
+
+@pytest.fixture(autouse=True)
+def _cfg_overrides(monkeypatch):
+    monkeypatch.setattr(health_checks, "_cfg_int", _fake_cfg_int)
+    monkeypatch.setattr(health_checks, "_cfg_bool", _fake_cfg_bool)
+    yield
+    CFG_INT_OVERRIDES.clear()
+    CFG_BOOL_OVERRIDES.clear()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_db(tmp_path_factory, migrated_db_template):
+    """Migrated database shared by every test in this module."""
+    db_path = tmp_path_factory.mktemp("health_checks") / "test.db"
+    shutil.copyfile(migrated_db_template, db_path)
     db_manager = DatabaseManager(db_path)
-    set_db_manager(db_manager)
-    db = await db_manager.get_connection()
-    await db.execute("PRAGMA journal_mode=WAL")
-    initialize_config()
+    await db_manager.get_connection()
     yield db_manager
     await db_manager.close()
-    set_db_manager(None)  # type: ignore[arg-type]
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db_with_tables(module_db):
+    """Install the shared database globally and reset it to WAL for one test."""
+    previous_db_manager = db_module._db_manager
+    set_db_manager(module_db)
+    db = await module_db.get_connection()
+    # Health checks leave their probe writes uncommitted; end that transaction
+    # so the journal mode can be reset after tests that switch it.
+    await db.commit()
+    await (await db.execute("PRAGMA journal_mode=WAL")).close()
+    initialize_config()
+    yield module_db
+    set_db_manager(previous_db_manager)  # type: ignore[arg-type]
+
+
+FROZEN_NOW = 1_700_000_000
+
+
+@pytest.fixture
+def frozen_now(monkeypatch) -> int:
+    """Pin the checks' clock so lag arithmetic is deterministic."""
+    monkeypatch.setattr(health_checks, "_now", lambda: FROZEN_NOW)
+    return FROZEN_NOW
 
 
 def _scheduler(ts: int) -> SchedulerState:
@@ -73,7 +111,7 @@ def _resources(db_mb: float = 1.0, log_mb: float = 1.0) -> ResourceUsage:
     )
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_check_sqlite_writable_pass(db_with_tables):
     db = await db_with_tables.get_connection()
     await db.execute("PRAGMA journal_mode=WAL")
@@ -82,14 +120,14 @@ async def test_check_sqlite_writable_pass(db_with_tables):
     assert result.status == "pass"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_check_sqlite_writable_fail_on_db_error():
     with patch("src.sohnbot.observability.health_checks.get_db", AsyncMock(side_effect=RuntimeError("db down"))):
         result = await check_sqlite_writable()
     assert result.status == "fail"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_check_sqlite_writable_warns_if_not_wal(db_with_tables):
     db = await db_with_tables.get_connection()
     await db.execute("PRAGMA journal_mode=DELETE")
@@ -97,29 +135,39 @@ async def test_check_sqlite_writable_warns_if_not_wal(db_with_tables):
     assert result.status == "warn"
 
 
+@pytest.mark.asyncio(loop_scope="module")
+async def test_check_sqlite_writable_pass_for_in_memory_db():
+    previous_db_manager = db_module._db_manager
+    db_manager = DatabaseManager("health_checks_in_memory", in_memory=True)
+    set_db_manager(db_manager)
+    try:
+        result = await check_sqlite_writable()
+    finally:
+        await db_manager.close()
+        set_db_manager(previous_db_manager)  # type: ignore[arg-type]
+    assert result.status == "pass"
+
+
 def test_check_scheduler_lag_pass_when_not_implemented():
     result = check_scheduler_lag(_scheduler(0))
     assert result.status == "pass"
 
 
-def test_check_scheduler_lag_pass():
-    now = int(time.time())
-    with patch("src.sohnbot.observability.health_checks._cfg_int", return_value=300):
-        result = check_scheduler_lag(_scheduler(now - 30))
+def test_check_scheduler_lag_pass(frozen_now):
+    CFG_INT_OVERRIDES["observability.scheduler_lag_threshold"] = 300
+    result = check_scheduler_lag(_scheduler(frozen_now - 30))
     assert result.status == "pass"
 
 
-def test_check_scheduler_lag_warn():
-    now = int(time.time())
-    with patch("src.sohnbot.observability.health_checks._cfg_int", return_value=300):
-        result = check_scheduler_lag(_scheduler(now - 200))
+def test_check_scheduler_lag_warn(frozen_now):
+    CFG_INT_OVERRIDES["observability.scheduler_lag_threshold"] = 300
+    result = check_scheduler_lag(_scheduler(frozen_now - 200))
     assert result.status == "warn"
 
 
-def test_check_scheduler_lag_fail():
-    now = int(time.time())
-    with patch("src.sohnbot.observability.health_checks._cfg_int", return_value=300):
-        result = check_scheduler_lag(_scheduler(now - 301))
+def test_check_scheduler_lag_fail(frozen_now):
+    CFG_INT_OVERRIDES["observability.scheduler_lag_threshold"] = 300
+    result = check_scheduler_lag(_scheduler(frozen_now - 301))
     assert result.status == "fail"
 
 
@@ -133,17 +181,15 @@ def test_check_notifier_alive_pass_fresh_system():
     assert result.status == "pass"
 
 
-def test_check_notifier_alive_pass():
-    now = int(time.time())
-    with patch("src.sohnbot.observability.health_checks._cfg_int", return_value=120):
-        result = check_notifier_alive(_notifier(now - 30))
+def test_check_notifier_alive_pass(frozen_now):
+    CFG_INT_OVERRIDES["observability.notifier_lag_threshold"] = 120
+    result = check_notifier_alive(_notifier(frozen_now - 30))
     assert result.status == "pass"
 
 
-def test_check_notifier_alive_fail():
-    now = int(time.time())
-    with patch("src.sohnbot.observability.health_checks._cfg_int", return_value=120):
-        result = check_notifier_alive(_notifier(now - 121))
+def test_check_notifier_alive_fail(frozen_now):
+    CFG_INT_OVERRIDES["observability.notifier_lag_threshold"] = 120
+    result = check_notifier_alive(_notifier(frozen_now - 121))
     assert result.status == "fail"
 
 
@@ -153,54 +199,50 @@ def test_check_outbox_stuck_pass_empty_outbox():
 
 
 def test_check_outbox_stuck_pass_within_threshold():
-    with patch("src.sohnbot.observability.health_checks._cfg_int", return_value=3600):
-        result = check_outbox_stuck(_notifier(100, 120))
+    CFG_INT_OVERRIDES["observability.outbox_stuck_threshold"] = 3600
+    result = check_outbox_stuck(_notifier(100, 120))
     assert result.status == "pass"
 
 
 def test_check_outbox_stuck_warn_when_stuck():
-    with patch("src.sohnbot.observability.health_checks._cfg_int", return_value=3600):
-        result = check_outbox_stuck(_notifier(100, 3601))
+    CFG_INT_OVERRIDES["observability.outbox_stuck_threshold"] = 3600
+    result = check_outbox_stuck(_notifier(100, 3601))
     assert result.status == "warn"
 
 
 def test_check_disk_usage_pass_when_disabled():
-    with patch("src.sohnbot.observability.health_checks._cfg_bool", return_value=False):
-        result = check_disk_usage(_resources(10, 10))
+    CFG_BOOL_OVERRIDES["observability.disk_cap_enabled"] = False
+    result = check_disk_usage(_resources(10, 10))
     assert result.status == "pass"
 
 
 def test_check_disk_usage_pass_within_cap():
-    with patch("src.sohnbot.observability.health_checks._cfg_bool", return_value=True), patch(
-        "src.sohnbot.observability.health_checks._cfg_int",
-        return_value=1000,
-    ):
-        result = check_disk_usage(_resources(100, 100))
+    CFG_BOOL_OVERRIDES["observability.disk_cap_enabled"] = True
+    CFG_INT_OVERRIDES["observability.disk_cap_mb"] = 1000
+    result = check_disk_usage(_resources(100, 100))
     assert result.status == "pass"
 
 
 def test_check_disk_usage_warn_exceeds_cap():
-    with patch("src.sohnbot.observability.health_checks._cfg_bool", return_value=True), patch(
-        "src.sohnbot.observability.health_checks._cfg_int",
-        return_value=1000,
-    ):
-        result = check_disk_usage(_resources(900, 200))
+    CFG_BOOL_OVERRIDES["observability.disk_cap_enabled"] = True
+    CFG_INT_OVERRIDES["observability.disk_cap_mb"] = 1000
+    result = check_disk_usage(_resources(900, 200))
     assert result.status == "warn"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_run_all_health_checks_returns_six_results(db_with_tables):
     results = await run_all_health_checks(_scheduler(0), _notifier(0, None), _resources())
     assert len(results) == 6
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_run_all_health_checks_all_pass_fresh_system(db_with_tables):
     results = await run_all_health_checks(_scheduler(0), _notifier(0, None), _resources())
     assert all(r.status == "pass" for r in results)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_health_check_names_are_correct(db_with_tables):
     results = await run_all_health_checks(_scheduler(0), _notifier(0, None), _resources())
     assert [r.name for r in results] == [
@@ -213,13 +255,13 @@ async def test_health_check_names_are_correct(db_with_tables):
     ]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_health_check_status_values_valid(db_with_tables):
     results = await run_all_health_checks(_scheduler(0), _notifier(0, None), _resources())
     assert all(r.status in {"pass", "fail", "warn"} for r in results)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_health_check_exception_in_one_does_not_affect_others(db_with_tables):
     with patch(
         "src.sohnbot.observability.health_checks.check_scheduler_lag",
@@ -230,8 +272,9 @@ async def test_health_check_exception_in_one_does_not_affect_others(db_with_tabl
     assert any(r.name == "scheduler_lag" and r.status == "fail" for r in results)
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_snapshot_health_not_empty(db_with_tables):
+    snapshot_collector._reset_health_cache()
     snapshot = await collect_snapshot()
     assert snapshot.health
     assert len(snapshot.health) == 6
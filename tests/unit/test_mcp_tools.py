@@ -10,53 +10,69 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from src.sohnbot.runtime.hooks import validate_tool_use
 from src.sohnbot.runtime.mcp_tools import create_sohnbot_mcp_server
 
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# Tool names the PreToolUse hook must deny.
+_DENIED_TOOLS = (
+    "some_other_tool",
+    "Read",
+    "Bash",
+    "Write",
+    "Edit",
+    "WebFetch",
+    "mcp__sohnbot__shell__exec",
+)
+
+
+@pytest.fixture(scope="module")
+def mock_broker():
+    """Create mock BrokerRouter, shared across the module."""
+    return AsyncMock()
+
+
+@pytest.fixture(scope="module")
+def mock_config():
+    """Create mock ConfigManager, shared across the module."""
+    return MagicMock()
+
+
+@pytest.fixture(scope="module")
+def mcp_server(mock_broker, mock_config):
+    """Build the MCP server once; construction has no per-test state."""
+    return create_sohnbot_mcp_server(
+        broker=mock_broker,
+        config=mock_config
+    )
+
 
 class TestMCPTools:
     """Test MCP tool definitions and broker integration."""
 
-    @pytest.fixture
-    def mock_broker(self):
-        """Create mock BrokerRouter."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def mock_config(self):
-        """Create mock ConfigManager."""
-        return MagicMock()
+    @pytest.fixture(autouse=True)
+    def _reset_mock_broker(self, mock_broker):
+        """Clear call records left on the shared broker by earlier tests."""
+        mock_broker.reset_mock()
 
-    @pytest.mark.asyncio
-    async def test_mcp_server_creation(self, mock_broker, mock_config):
+    async def test_mcp_server_creation(self, mcp_server):
         """MCP server created with all tools."""
-        server = create_sohnbot_mcp_server(
-            broker=mock_broker,
-            config=mock_config
-        )
-
         # Server should be created
-        assert server is not None
+        assert mcp_server is not None
 
         # Should have expected attributes
-        assert hasattr(server, 'name') or server is not None
+        assert hasattr(mcp_server, 'name') or mcp_server is not None
 
-    @pytest.mark.asyncio
-    async def test_fs_read_stub_response(self, mock_broker, mock_config):
+    async def test_fs_read_stub_response(self, mcp_server):
         """fs__read returns stub message (capabilities not yet implemented)."""
         # For now, tools return stub responses
         # This test validates the tool structure
 
-        server = create_sohnbot_mcp_server(
-            broker=mock_broker,
-            config=mock_config
-        )
-
         # Server should exist (actual tool invocation would require SDK)
-        assert server is not None
+        assert mcp_server is not None
 
 
 class TestPreToolUseHook:
     """Test PreToolUse hook validation."""
 
-    @pytest.mark.asyncio
     async def test_validate_tool_use_allows_sohnbot_tools(self):
         """mcp__sohnbot__* tools allowed."""
         input_data = {"tool_name": "mcp__sohnbot__fs__read"}
@@ -65,37 +81,16 @@ class TestPreToolUseHook:
         # Should allow (empty dict)
         assert result == {}
 
-    @pytest.mark.asyncio
-    async def test_validate_tool_use_blocks_other_tools(self):
-        """Non-sohnbot tools blocked."""
-        input_data = {"tool_name": "some_other_tool"}
+    @pytest.mark.parametrize("tool_name", _DENIED_TOOLS)
+    async def test_validate_tool_use_blocks_denied_tools(self, tool_name):
+        """Built-in, foreign and unregistered sohnbot tools are blocked."""
+        input_data = {"tool_name": tool_name}
         result = await validate_tool_use(input_data, "test_id", {})
 
         # Should block
         assert "hookSpecificOutput" in result
         assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
 
-    @pytest.mark.asyncio
-    async def test_validate_tool_use_blocks_read_tool(self):
-        """Built-in Read tool blocked."""
-        input_data = {"tool_name": "Read"}
-        result = await validate_tool_use(input_data, "test_id", {})
-
-        # Should block
-        assert "hookSpecificOutput" in result
-        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
-
-    @pytest.mark.asyncio
-    async def test_validate_tool_use_blocks_bash_tool(self):
-        """Built-in Bash tool blocked."""
-        input_data = {"tool_name": "Bash"}
-        result = await validate_tool_use(input_data, "test_id", {})
-
-        # Should block
-        assert "hookSpecificOutput" in result
-        assert result["hookSpecificOutput"]["permissionDecision"] == "deny"
-
-    @pytest.mark.asyncio
     @patch('src.sohnbot.runtime.hooks.logger')
     async def test_validate_tool_use_logs_blocked(self, mock_logger):
         """Blocked tools logged with warning."""
@@ -105,10 +100,9 @@ class TestPreToolUseHook:
         # Should log warning
         mock_logger.warning.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_validate_all_sohnbot_tools_allowed(self):
-        """All defined sohnbot tools should be allowed."""
-        tool_names = [
+    @pytest.mark.parametrize(
+        "tool_name",
+        [
             "mcp__sohnbot__fs__read",
             "mcp__sohnbot__fs__list",
             "mcp__sohnbot__fs__search",
@@ -123,11 +117,11 @@ class TestPreToolUseHook:
             "mcp__sohnbot__git__prune_snapshots",
             "mcp__sohnbot__git__rollback",
             "mcp__sohnbot__git__checkout",
-        ]
-
-        for tool_name in tool_names:
-            input_data = {"tool_name": tool_name}
-            result = await validate_tool_use(input_data, "test_id", {})
+        ],
+    )
+    async def test_validate_all_sohnbot_tools_allowed(self, tool_name):
+        """All defined sohnbot tools should be allowed."""
+        input_data = {"tool_name": tool_name}
+        result = await validate_tool_use(input_data, "test_id", {})
 
-            # All should be allowed
-            assert result == {}, f"Tool {tool_name} should be allowed"
+        assert result == {}, f"Tool {tool_name} should be allowed"
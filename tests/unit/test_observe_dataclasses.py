@@ -1,9 +1,11 @@
 """Unit tests for observability dataclasses and in-memory snapshot cache."""
 
+import dataclasses
 import time
 
 import pytest
 
+from src.sohnbot.capabilities import observe as obs_module
 from src.sohnbot.capabilities.observe import (
     BrokerActivity,
     HealthCheckResult,
@@ -22,11 +24,9 @@ from src.sohnbot.capabilities.observe import (
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_snapshot_cache():
-    """Reset the module-level snapshot cache between tests."""
-    import src.sohnbot.capabilities.observe as obs_module
-
+    """Reset the module-level snapshot cache around the cache tests."""
     obs_module._snapshot_cache = None
     yield
     obs_module._snapshot_cache = None
@@ -87,145 +87,164 @@ def _make_snapshot(ts: int = 1000) -> StatusSnapshot:
 # ---------------------------------------------------------------------------
 
 
-def test_process_info_construction():
-    pi = ProcessInfo(
-        pid=1,
-        uptime_seconds=100,
-        version="1.0.0",
-        supervisor="pm2",
-        supervisor_status="online",
-        restart_count=2,
-    )
-    assert pi.pid == 1
-    assert pi.uptime_seconds == 100
-    assert pi.version == "1.0.0"
-    assert pi.supervisor == "pm2"
-    assert pi.restart_count == 2
-
-
-def test_process_info_optional_fields_none():
-    pi = ProcessInfo(
-        pid=99,
-        uptime_seconds=0,
-        version="unknown",
-        supervisor=None,
-        supervisor_status=None,
-        restart_count=None,
-    )
-    assert pi.supervisor is None
-    assert pi.supervisor_status is None
-    assert pi.restart_count is None
-
-
-def test_broker_activity_construction():
-    ba = BrokerActivity(
-        last_operation_timestamp=1234567890,
-        in_flight_operations=[{"operation_id": "abc", "tool": "fs__read", "tier": 0, "elapsed_s": 1}],
-        last_10_results={"completed": 8, "failed": 2},
-    )
-    assert ba.last_operation_timestamp == 1234567890
-    assert len(ba.in_flight_operations) == 1
-    assert ba.last_10_results["completed"] == 8
-
-
-def test_scheduler_state_placeholder_construction():
-    ss = SchedulerState(
-        last_tick_timestamp=0,
-        last_tick_local="N/A (scheduler not yet implemented)",
-        next_jobs=[],
-        active_jobs_count=0,
-    )
-    assert ss.last_tick_timestamp == 0
-    assert ss.next_jobs == []
-    assert ss.active_jobs_count == 0
-
-
-def test_notifier_state_construction():
-    ns = NotifierState(
-        last_attempt_timestamp=999,
-        pending_count=3,
-        oldest_pending_age_seconds=120,
-    )
-    assert ns.pending_count == 3
-    assert ns.oldest_pending_age_seconds == 120
-
-
-def test_notifier_state_no_pending():
-    ns = NotifierState(
-        last_attempt_timestamp=0,
-        pending_count=0,
-        oldest_pending_age_seconds=None,
-    )
-    assert ns.oldest_pending_age_seconds is None
-
-
-def test_resource_usage_construction():
-    ru = ResourceUsage(
-        cpu_percent=12.5,
-        cpu_1m_avg=None,
-        ram_mb=256,
-        db_size_mb=1.5,
-        log_size_mb=0.3,
-        snapshot_count=7,
-        event_loop_lag_ms=0.5,
-    )
-    assert ru.cpu_percent == 12.5
-    assert ru.ram_mb == 256
-    assert ru.snapshot_count == 7
-
-
-def test_health_check_result_construction():
-    hcr = HealthCheckResult(
-        name="sqlite_writable",
-        status="pass",
-        message="OK",
-        timestamp=int(time.time()),
-        details=None,
-    )
-    assert hcr.name == "sqlite_writable"
-    assert hcr.status == "pass"
-    assert hcr.details is None
-
-
-def test_health_check_result_with_details():
-    hcr = HealthCheckResult(
-        name="scheduler_lag",
-        status="fail",
-        message="Lag 400s exceeds threshold 300s",
-        timestamp=int(time.time()),
-        details={"lag_seconds": 400, "threshold": 300},
-    )
-    assert hcr.status == "fail"
-    assert hcr.details is not None
-    assert hcr.details["lag_seconds"] == 400
-
-
-def test_status_snapshot_construction():
-    snap = _make_snapshot(ts=2000)
-    assert snap.timestamp == 2000
-    assert snap.process.pid == 1234
-    assert snap.broker.last_10_results == {"completed": 5}
-    assert snap.scheduler.next_jobs == []
-    assert snap.notifier.pending_count == 0
-    assert snap.resources.ram_mb == 128
-    assert len(snap.health) == 1
-    assert snap.recent_operations == []
-
+_SNAPSHOT = _make_snapshot(ts=2000)
 
-def test_status_snapshot_empty_health():
-    """Story 3.1 should produce snapshots with health=[] (Story 3.2 adds checks)."""
-    snap = _make_snapshot()
-    snap_empty = StatusSnapshot(
-        timestamp=snap.timestamp,
-        process=snap.process,
-        broker=snap.broker,
-        scheduler=snap.scheduler,
-        notifier=snap.notifier,
-        resources=snap.resources,
-        health=[],
-        recent_operations=[],
-    )
-    assert snap_empty.health == []
+# (dataclass, constructor kwargs, attributes expected on the instance)
+CASES = [
+    pytest.param(
+        ProcessInfo,
+        dict(
+            pid=1,
+            uptime_seconds=100,
+            version="1.0.0",
+            supervisor="pm2",
+            supervisor_status="online",
+            restart_count=2,
+        ),
+        dict(pid=1, uptime_seconds=100, version="1.0.0", supervisor="pm2", restart_count=2),
+        id="process_info",
+    ),
+    pytest.param(
+        ProcessInfo,
+        dict(
+            pid=99,
+            uptime_seconds=0,
+            version="unknown",
+            supervisor=None,
+            supervisor_status=None,
+            restart_count=None,
+        ),
+        dict(supervisor=None, supervisor_status=None, restart_count=None),
+        id="process_info_optional_fields_none",
+    ),
+    pytest.param(
+        BrokerActivity,
+        dict(
+            last_operation_timestamp=1234567890,
+            in_flight_operations=[
+                {"operation_id": "abc", "tool": "fs__read", "tier": 0, "elapsed_s": 1}
+            ],
+            last_10_results={"completed": 8, "failed": 2},
+        ),
+        dict(
+            last_operation_timestamp=1234567890,
+            in_flight_operations=[
+                {"operation_id": "abc", "tool": "fs__read", "tier": 0, "elapsed_s": 1}
+            ],
+            last_10_results={"completed": 8, "failed": 2},
+        ),
+        id="broker_activity",
+    ),
+    pytest.param(
+        SchedulerState,
+        dict(
+            last_tick_timestamp=0,
+            last_tick_local="N/A (scheduler not yet implemented)",
+            next_jobs=[],
+            active_jobs_count=0,
+        ),
+        dict(last_tick_timestamp=0, next_jobs=[], active_jobs_count=0),
+        id="scheduler_state_placeholder",
+    ),
+    pytest.param(
+        NotifierState,
+        dict(last_attempt_timestamp=999, pending_count=3, oldest_pending_age_seconds=120),
+        dict(pending_count=3, oldest_pending_age_seconds=120),
+        id="notifier_state",
+    ),
+    pytest.param(
+        NotifierState,
+        dict(last_attempt_timestamp=0, pending_count=0, oldest_pending_age_seconds=None),
+        dict(oldest_pending_age_seconds=None),
+        id="notifier_state_no_pending",
+    ),
+    pytest.param(
+        ResourceUsage,
+        dict(
+            cpu_percent=12.5,
+            cpu_1m_avg=None,
+            ram_mb=256,
+            db_size_mb=1.5,
+            log_size_mb=0.3,
+            snapshot_count=7,
+            event_loop_lag_ms=0.5,
+        ),
+        dict(cpu_percent=12.5, ram_mb=256, snapshot_count=7),
+        id="resource_usage",
+    ),
+    pytest.param(
+        HealthCheckResult,
+        dict(
+            name="sqlite_writable",
+            status="pass",
+            message="OK",
+            timestamp=int(time.time()),
+            details=None,
+        ),
+        dict(name="sqlite_writable", status="pass", details=None),
+        id="health_check_result",
+    ),
+    pytest.param(
+        HealthCheckResult,
+        dict(
+            name="scheduler_lag",
+            status="fail",
+            message="Lag 400s exceeds threshold 300s",
+            timestamp=int(time.time()),
+            details={"lag_seconds": 400, "threshold": 300},
+        ),
+        dict(status="fail", details={"lag_seconds": 400, "threshold": 300}),
+        id="health_check_result_with_details",
+    ),
+    pytest.param(
+        StatusSnapshot,
+        {f.name: getattr(_SNAPSHOT, f.name) for f in dataclasses.fields(StatusSnapshot)},
+        dict(
+            timestamp=2000,
+            process=_SNAPSHOT.process,
+            broker=_SNAPSHOT.broker,
+            scheduler=_SNAPSHOT.scheduler,
+            notifier=_SNAPSHOT.notifier,
+            resources=_SNAPSHOT.resources,
+            health=_SNAPSHOT.health,
+            recent_operations=[],
+        ),
+        id="status_snapshot",
+    ),
+    # Story 3.1 should produce snapshots with health=[] (Story 3.2 adds checks).
+    pytest.param(
+        StatusSnapshot,
+        {
+            **{f.name: getattr(_SNAPSHOT, f.name) for f in dataclasses.fields(StatusSnapshot)},
+            "health": [],
+            "recent_operations": [],
+        },
+        dict(health=[]),
+        id="status_snapshot_empty_health",
+    ),
+]
+
+
+@pytest.mark.parametrize(("cls", "kwargs", "expected"), CASES)
+def test_dataclass_roundtrip(cls, kwargs, expected):
+    """Constructed dataclasses expose the values they were built with."""
+    obj = cls(**kwargs)
+    for name, value in expected.items():
+        assert getattr(obj, name) == value
+
+
+@pytest.mark.parametrize(
+    ("state", "field"),
+    [
+        (SchedulerState(0, "N/A", [], 0), "active_jobs_count"),
+        (NotifierState(0, 0, None), "pending_count"),
+        (ResourceUsage(0.0, None, 1, 0.0, 0.0, 0, None), "ram_mb"),
+    ],
+)
+def test_collected_states_are_frozen_and_slotted(state, field):
+    assert not hasattr(state, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        setattr(state, field, 1)
 
 
 # ---------------------------------------------------------------------------
@@ -233,11 +252,13 @@ def test_status_snapshot_empty_health():
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("reset_snapshot_cache")
 def test_get_current_snapshot_returns_none_initially():
     """Cache must be None before first collection cycle."""
     assert get_current_snapshot() is None
 
 
+@pytest.mark.usefixtures("reset_snapshot_cache")
 def test_update_snapshot_cache_then_get():
     """update_snapshot_cache sets the cache; get_current_snapshot retrieves it."""
     snap = _make_snapshot(ts=5000)
@@ -247,6 +268,7 @@ def test_update_snapshot_cache_then_get():
     assert result.timestamp == 5000
 
 
+@pytest.mark.usefixtures("reset_snapshot_cache")
 def test_update_snapshot_cache_replaces_old():
     """Second update replaces the first."""
     snap1 = _make_snapshot(ts=1)
@@ -256,6 +278,7 @@ def test_update_snapshot_cache_replaces_old():
     assert get_current_snapshot().timestamp == 2
 
 
+@pytest.mark.usefixtures("reset_snapshot_cache")
 def test_cache_stores_reference_not_copy():
     """Cache stores the exact object, not a copy."""
     snap = _make_snapshot()
@@ -1,7 +1,5 @@
 """Unit tests for PatchEditor capability."""
 
-import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -20,33 +18,41 @@ VALID_PATCH = """\
  line3
 """
 
+WRONG_CONTEXT_PATCH = """\
+--- original.txt
++++ original.txt
+@@ -1,3 +1,3 @@
+ WRONG_CONTEXT_LINE
+-line2
++line2_modified
+ line3
+"""
 
-@pytest.fixture
-def editor():
-    return PatchEditor()
+# Name of the file created by the temp_file fixture, and the patches
+# above retargeted at it.
+TEMP_FILE_NAME = "patch.txt"
+VALID_PATCH_FOR_TEMP_FILE = VALID_PATCH.replace("original.txt", TEMP_FILE_NAME)
+WRONG_CONTEXT_PATCH_FOR_TEMP_FILE = WRONG_CONTEXT_PATCH.replace("original.txt", TEMP_FILE_NAME)
+
+# PatchEditor holds no state, so every test shares one instance.
+EDITOR = PatchEditor()
 
 
 @pytest.fixture
-def temp_file():
+def temp_file(tmp_path):
     """Create a temp file with predictable content for patching."""
-    with tempfile.NamedTemporaryFile(
-        mode="w", suffix=".txt", delete=False, newline="\n"
-    ) as f:
-        f.write("line1\nline2\nline3\n")
-        path = f.name
-    yield path
-    if os.path.exists(path):
-        os.unlink(path)
+    path = tmp_path / TEMP_FILE_NAME
+    path.write_bytes(b"line1\nline2\nline3\n")
+    return str(path)
 
 
 
 class TestPatchEditorHappyPath:
-    def test_apply_patch_success(self, editor, temp_file):
+    def test_apply_patch_success(self, temp_file):
         """Valid unified diff applied successfully."""
-        patch_for_file = VALID_PATCH.replace("original.txt", Path(temp_file).name)
-        result = editor.apply_patch(
+        result = EDITOR.apply_patch(
             path=temp_file,
-            patch_content=patch_for_file,
+            patch_content=VALID_PATCH_FOR_TEMP_FILE,
         )
         assert result["path"] == temp_file
         assert result["lines_added"] >= 1
@@ -56,42 +62,41 @@ class TestPatchEditorHappyPath:
         assert "line2_modified" in content
         assert "line2\n" not in content
 
-    def test_returns_correct_line_counts(self, editor, temp_file):
+    def test_returns_correct_line_counts(self, temp_file):
         """lines_added and lines_removed are counted correctly from patch."""
-        patch_for_file = VALID_PATCH.replace("original.txt", Path(temp_file).name)
-        result = editor.apply_patch(path=temp_file, patch_content=patch_for_file)
+        result = EDITOR.apply_patch(path=temp_file, patch_content=VALID_PATCH_FOR_TEMP_FILE)
         assert result["lines_added"] == 1
         assert result["lines_removed"] == 1
 
-    def test_returns_path_in_result(self, editor, temp_file):
+    def test_returns_path_in_result(self, temp_file):
         """Result dict contains the target file path."""
-        patch_for_file = VALID_PATCH.replace("original.txt", Path(temp_file).name)
-        result = editor.apply_patch(path=temp_file, patch_content=patch_for_file)
+        result = EDITOR.apply_patch(path=temp_file, patch_content=VALID_PATCH_FOR_TEMP_FILE)
         assert result["path"] == temp_file
 
 
 class TestPatchTooLarge:
-    def test_patch_exceeds_size_limit(self, editor, temp_file):
+    def test_patch_exceeds_size_limit(self, temp_file):
         """Patch larger than patch_max_size_kb raises patch_too_large."""
         # 51KB patch content
         big_patch = "--- a\n+++ b\n@@ -1,1 +1,1 @@\n" + "+" * (51 * 1024)
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path=temp_file, patch_content=big_patch, patch_max_size_kb=50)
+            EDITOR.apply_patch(path=temp_file, patch_content=big_patch, patch_max_size_kb=50)
         assert exc_info.value.code == "patch_too_large"
         assert exc_info.value.retryable is False
         assert "50KB" in exc_info.value.message
 
-    def test_patch_at_limit_is_accepted(self, editor, temp_file):
+    def test_patch_at_limit_is_accepted(self, temp_file):
         """Patch exactly at limit should not raise patch_too_large."""
         # A valid patch that's small — just confirm size check boundary
-        patch_for_file = VALID_PATCH.replace("original.txt", Path(temp_file).name)
         # Small patch; set limit to 1MB — should pass
-        result = editor.apply_patch(path=temp_file, patch_content=patch_for_file, patch_max_size_kb=1024)
+        result = EDITOR.apply_patch(
+            path=temp_file, patch_content=VALID_PATCH_FOR_TEMP_FILE, patch_max_size_kb=1024
+        )
         assert result["path"] == temp_file
 
 
 class TestMultiFilePatch:
-    def test_multi_file_patch_raises_invalid_format(self, editor, temp_file):
+    def test_multi_file_patch_raises_invalid_format(self, temp_file):
         """Patch targeting two files raises invalid_patch_format (M1 fix)."""
         multi_file_patch = (
             "--- file1.txt\n+++ file1.txt\n"
@@ -100,12 +105,12 @@ class TestMultiFilePatch:
             "@@ -1,1 +1,1 @@\n-baz\n+qux\n"
         )
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path=temp_file, patch_content=multi_file_patch)
+            EDITOR.apply_patch(path=temp_file, patch_content=multi_file_patch)
         assert exc_info.value.code == "invalid_patch_format"
         assert "2" in exc_info.value.message  # mentions the count
         assert exc_info.value.retryable is False
 
-    def test_new_file_patch_not_counted_as_multi(self, editor, temp_file):
+    def test_new_file_patch_not_counted_as_multi(self, temp_file):
         """/dev/null in --- line (new file) does not trigger multi-file rejection."""
         # A patch adding a new file has "--- /dev/null" which should not count
         # as a distinct source file — single-file rule applies to source only
@@ -115,37 +120,37 @@ class TestMultiFilePatch:
         )
         # Should raise path_not_found (file doesn't exist), NOT invalid_patch_format
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path=temp_file, patch_content=new_file_patch)
+            EDITOR.apply_patch(path=temp_file, patch_content=new_file_patch)
         assert exc_info.value.code != "invalid_patch_format"
 
 
 class TestInvalidPatchFormat:
-    def test_missing_diff_markers(self, editor, temp_file):
+    def test_missing_diff_markers(self, temp_file):
         """Content without ---, +++, @@ markers raises invalid_patch_format."""
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path=temp_file, patch_content="this is not a patch")
+            EDITOR.apply_patch(path=temp_file, patch_content="this is not a patch")
         assert exc_info.value.code == "invalid_patch_format"
         assert exc_info.value.retryable is False
 
-    def test_missing_hunk_marker(self, editor, temp_file):
+    def test_missing_hunk_marker(self, temp_file):
         """Patch with --- and +++ but no @@ raises invalid_patch_format."""
         bad_patch = "--- a\n+++ b\n+some line\n"
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path=temp_file, patch_content=bad_patch)
+            EDITOR.apply_patch(path=temp_file, patch_content=bad_patch)
         assert exc_info.value.code == "invalid_patch_format"
 
-    def test_empty_patch(self, editor, temp_file):
+    def test_empty_patch(self, temp_file):
         """Empty patch string raises invalid_patch_format."""
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path=temp_file, patch_content="")
+            EDITOR.apply_patch(path=temp_file, patch_content="")
         assert exc_info.value.code == "invalid_patch_format"
 
 
 class TestPathNotFound:
-    def test_nonexistent_file_raises_path_not_found(self, editor):
+    def test_nonexistent_file_raises_path_not_found(self):
         """Non-existent target file raises path_not_found."""
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(
+            EDITOR.apply_patch(
                 path="/nonexistent/path/file.txt",
                 patch_content=VALID_PATCH,
             )
@@ -154,29 +159,19 @@ class TestPathNotFound:
 
 
 class TestPatchApplyFailed:
-    def test_hunk_mismatch_raises_patch_apply_failed(self, editor, temp_file):
+    def test_hunk_mismatch_raises_patch_apply_failed(self, temp_file):
         """Patch with wrong context lines raises patch_apply_failed."""
-        wrong_context = """\
---- original.txt
-+++ original.txt
-@@ -1,3 +1,3 @@
- WRONG_CONTEXT_LINE
--line2
-+line2_modified
- line3
-"""
-        patch_for_file = wrong_context.replace("original.txt", Path(temp_file).name)
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path=temp_file, patch_content=patch_for_file)
+            EDITOR.apply_patch(path=temp_file, patch_content=WRONG_CONTEXT_PATCH_FOR_TEMP_FILE)
         assert exc_info.value.code == "patch_apply_failed"
         assert exc_info.value.retryable is False
 
 
 class TestErrorShape:
-    def test_error_has_correct_dict_shape(self, editor):
+    def test_error_has_correct_dict_shape(self):
         """FileCapabilityError.to_dict() matches required shape."""
         with pytest.raises(FileCapabilityError) as exc_info:
-            editor.apply_patch(path="/nonexistent.txt", patch_content=VALID_PATCH)
+            EDITOR.apply_patch(path="/nonexistent.txt", patch_content=VALID_PATCH)
         error_dict = exc_info.value.to_dict()
         assert "code" in error_dict
         assert "message" in error_dict
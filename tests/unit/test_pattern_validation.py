@@ -1,33 +1,15 @@
 """Tests for pattern validation in broker router."""
 
 import pytest
-from pathlib import Path
 
 from src.sohnbot.broker.router import BrokerRouter
 from src.sohnbot.broker.scope_validator import ScopeValidator
-from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
-from scripts.migrate import apply_migrations
 
 
 @pytest.fixture
-async def setup_database(tmp_path):
-    """Set up test database with required schema."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = (
-        Path(__file__).parent.parent.parent
-        / "src"
-        / "sohnbot"
-        / "persistence"
-        / "migrations"
-    )
-
-    apply_migrations(db_path, migrations_dir)
-    db_manager = DatabaseManager(db_path)
-    set_db_manager(db_manager)
-
-    yield db_manager
-
-    await db_manager.close()
+def setup_database(memory_db):
+    """Module-shared in-memory database with required schema, emptied after each test."""
+    return memory_db
 
 
 @pytest.fixture
@@ -53,7 +35,7 @@ def broker(scope_validator):
 class TestPatternValidation:
     """Test broker validates search pattern parameter."""
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_missing_pattern_rejected(self, broker, temp_allowed_root, setup_database):
         """Search operation without pattern parameter is rejected."""
         result = await broker.route_operation(
@@ -68,7 +50,7 @@ class TestPatternValidation:
         assert result.error["code"] == "invalid_request"
         assert "pattern" in result.error["message"].lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_empty_pattern_rejected(self, broker, temp_allowed_root, setup_database):
         """Search operation with empty pattern is rejected."""
         result = await broker.route_operation(
@@ -83,7 +65,7 @@ class TestPatternValidation:
         assert result.error["code"] == "invalid_request"
         assert "pattern" in result.error["message"].lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_non_string_pattern_rejected(self, broker, temp_allowed_root, setup_database):
         """Search operation with non-string pattern is rejected."""
         result = await broker.route_operation(
@@ -98,7 +80,7 @@ class TestPatternValidation:
         assert result.error["code"] == "invalid_request"
         assert "pattern" in result.error["message"].lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_search_valid_pattern_passes_validation(self, broker, temp_allowed_root, setup_database):
         """Search operation with valid pattern passes broker validation."""
         result = await broker.route_operation(
@@ -1,69 +1,93 @@
 """Unit tests for persistence layer (database, migrations, schemas)."""
 
 import pytest
+import pytest_asyncio
 import aiosqlite
 import hashlib
+import sqlite3
 from pathlib import Path
 from datetime import datetime
+from operator import itemgetter
 
 from src.sohnbot.persistence.db import DatabaseManager
-from scripts.migrate import calculate_checksum, discover_migrations, apply_migrations
+from scripts.migrate import (
+    apply_migrations,
+    calculate_checksum,
+    discover_migrations,
+    migrations_fingerprint,
+)
+
+# Throwaway databases need no WAL sidecar files or fsyncs.
+FAST_PRAGMAS = {"journal_mode": "MEMORY", "synchronous": "OFF", "temp_store": "MEMORY"}
 
 
 # Database Connection Tests
 
-@pytest.mark.asyncio
-async def test_get_connection_wal_mode(tmp_path):
-    """Verify WAL mode is enabled on database connection."""
-    db_path = tmp_path / "test.db"
-    db_manager = DatabaseManager(db_path)
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_db(tmp_path_factory):
+    """One file-backed DatabaseManager (and aiosqlite thread) shared by the read-only tests."""
+    db_manager = DatabaseManager(tmp_path_factory.mktemp("db") / "test.db")
+    await db_manager.get_connection()
+    yield db_manager
+    await db_manager.close()
 
-    conn = await db_manager.get_connection()
+
+@pytest.mark.asyncio(loop_scope="module")
+async def test_get_connection_wal_mode(shared_db):
+    """Verify WAL mode is enabled on database connection."""
+    conn = await shared_db.get_connection()
 
     # Check WAL mode
-    cursor = await conn.execute("PRAGMA journal_mode")
-    mode = await cursor.fetchone()
-    await cursor.close()
+    async with conn.execute("SELECT * FROM pragma_journal_mode") as cursor:
+        mode = await cursor.fetchone()
 
     assert mode[0].lower() == "wal", "WAL mode should be enabled"
 
-    await db_manager.close()
-
 
-@pytest.mark.asyncio
-async def test_get_connection_pragmas(tmp_path):
+@pytest.mark.asyncio(loop_scope="module")
+async def test_get_connection_pragmas(shared_db):
     """Verify all required pragmas are set."""
-    db_path = tmp_path / "test.db"
-    db_manager = DatabaseManager(db_path)
+    conn = await shared_db.get_connection()
 
-    conn = await db_manager.get_connection()
+    # Check pragmas in one round trip via the pragma table-valued functions
+    async with conn.execute(
+        "SELECT (SELECT * FROM pragma_journal_mode), (SELECT * FROM pragma_foreign_keys),"
+        " (SELECT * FROM pragma_synchronous), (SELECT * FROM pragma_busy_timeout)"
+    ) as cursor:
+        journal_mode, foreign_keys, synchronous, busy_timeout = await cursor.fetchone()
 
-    # Check pragmas
-    cursor = await conn.execute("PRAGMA foreign_keys")
-    assert (await cursor.fetchone())[0] == 1
-    await cursor.close()
+    assert journal_mode.lower() == "wal"
+    assert foreign_keys == 1
+    assert synchronous == 1  # NORMAL = 1
+    assert busy_timeout == 5000
 
-    cursor = await conn.execute("PRAGMA synchronous")
-    assert (await cursor.fetchone())[0] == 1  # NORMAL = 1
-    await cursor.close()
 
-    cursor = await conn.execute("PRAGMA busy_timeout")
-    assert (await cursor.fetchone())[0] == 5000
-    await cursor.close()
+@pytest.mark.asyncio(loop_scope="module")
+async def test_connection_pooling(shared_db):
+    """Verify connection is reused (pooling)."""
+    conn1 = await shared_db.get_connection()
+    conn2 = await shared_db.get_connection()
 
-    await db_manager.close()
+    assert conn1 is conn2, "Connection should be reused"
 
 
 @pytest.mark.asyncio
-async def test_connection_pooling(tmp_path):
-    """Verify connection is reused (pooling)."""
-    db_path = tmp_path / "test.db"
-    db_manager = DatabaseManager(db_path)
+async def test_get_connection_in_memory():
+    """Verify in-memory databases skip WAL and share data via their URI."""
+    db_manager = DatabaseManager("test_get_connection_in_memory", in_memory=True)
 
-    conn1 = await db_manager.get_connection()
-    conn2 = await db_manager.get_connection()
+    conn = await db_manager.get_connection()
+    await conn.execute("CREATE TABLE t (id INTEGER)")
+    await conn.commit()
 
-    assert conn1 is conn2, "Connection should be reused"
+    cursor = await conn.execute("PRAGMA journal_mode")
+    assert (await cursor.fetchone())[0].lower() == "memory"
+    await cursor.close()
+
+    async with aiosqlite.connect(db_manager.uri, uri=True) as other:
+        cursor = await other.execute("SELECT name FROM sqlite_master WHERE name = 't'")
+        assert await cursor.fetchone() is not None
+        await cursor.close()
 
     await db_manager.close()
 
@@ -80,13 +104,33 @@ def test_calculate_checksum_sha256(tmp_path):
 
     # Verify it's SHA-256 (64 hex characters)
     assert len(checksum) == 64
-    assert all(c in "0123456789abcdef" for c in checksum)
+    assert checksum == checksum.lower()
+    int(checksum, 16)  # raises ValueError if not hex
 
     # Verify deterministic
     checksum2 = calculate_checksum(test_file)
     assert checksum == checksum2
 
 
+def test_calculate_checksum_known_vector(tmp_path):
+    """Checksum matches the published SHA-256 test vector for "abc"."""
+    test_file = tmp_path / "abc.sql"
+    test_file.write_bytes(b"abc")
+
+    assert calculate_checksum(test_file) == (
+        "ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad"
+    )
+
+
+def test_calculate_checksum_large_file_matches_sha256(tmp_path):
+    """Files above the one-shot size limit are streamed to the same digest."""
+    test_file = tmp_path / "large.sql"
+    content = b"-- padding\n" * 10_000  # ~110 KiB
+    test_file.write_bytes(content)
+
+    assert calculate_checksum(test_file) == hashlib.sha256(content).hexdigest()
+
+
 def test_discover_migrations_lexical_order(tmp_path):
     """Verify migrations are discovered in lexical order."""
     # Create migrations in non-lexical order
@@ -113,10 +157,9 @@ def test_apply_migrations_success(tmp_path):
     migration.write_text("CREATE TABLE test (id INTEGER PRIMARY KEY) STRICT;")
 
     # Apply migrations
-    apply_migrations(db_path, migrations_dir)
+    apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)
 
     # Verify table was created (use sync sqlite3)
-    import sqlite3
     conn = sqlite3.connect(str(db_path))
     cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='test'")
     result = cursor.fetchone()
@@ -135,11 +178,10 @@ def test_apply_migrations_skip_already_applied(tmp_path):
     migration.write_text("CREATE TABLE test (id INTEGER PRIMARY KEY) STRICT;")
 
     # Apply migrations twice
-    apply_migrations(db_path, migrations_dir)
-    apply_migrations(db_path, migrations_dir)  # Should skip
+    apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)
+    apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)  # Should skip
 
     # Verify only one record in schema_migrations (use sync sqlite3)
-    import sqlite3
     conn = sqlite3.connect(str(db_path))
     cursor = conn.execute("SELECT COUNT(*) FROM schema_migrations")
     count = cursor.fetchone()[0]
@@ -148,6 +190,26 @@ def test_apply_migrations_skip_already_applied(tmp_path):
     assert count == 1
 
 
+def test_apply_migrations_records_fingerprint(tmp_path, capsys):
+    """Verify the applied set is fingerprinted so unchanged re-runs return early."""
+    db_path = tmp_path / "test.db"
+    migrations_dir = tmp_path / "migrations"
+    migrations_dir.mkdir()
+    migration = migrations_dir / "0001_init.sql"
+    migration.write_text("CREATE TABLE test (id INTEGER PRIMARY KEY) STRICT;")
+
+    apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)
+
+    conn = sqlite3.connect(str(db_path))
+    user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+    conn.close()
+    assert user_version == migrations_fingerprint(discover_migrations(migrations_dir))
+
+    capsys.readouterr()
+    apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)
+    assert "All 1 migrations already applied" in capsys.readouterr().out
+
+
 def test_apply_migrations_tamper_detection(tmp_path):
     """Verify tampering detection for modified migrations."""
     db_path = tmp_path / "test.db"
@@ -158,14 +220,14 @@ def test_apply_migrations_tamper_detection(tmp_path):
     migration.write_text("CREATE TABLE test (id INTEGER PRIMARY KEY) STRICT;")
 
     # Apply migration
-    apply_migrations(db_path, migrations_dir)
+    apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)
 
     # Modify migration (tamper)
     migration.write_text("CREATE TABLE test (id INTEGER, name TEXT);")
 
     # Attempt to reapply - should raise RuntimeError
     with pytest.raises(RuntimeError, match="tampered"):
-        apply_migrations(db_path, migrations_dir)
+        apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)
 
 
 def test_schema_migrations_table_created(tmp_path):
@@ -174,10 +236,9 @@ def test_schema_migrations_table_created(tmp_path):
     migrations_dir = tmp_path / "migrations"
     migrations_dir.mkdir()
 
-    apply_migrations(db_path, migrations_dir)
+    apply_migrations(db_path, migrations_dir, FAST_PRAGMAS)
 
     # Verify schema_migrations table exists (use sync sqlite3)
-    import sqlite3
     conn = sqlite3.connect(str(db_path))
     cursor = conn.execute(
         "SELECT name FROM sqlite_master WHERE type='table' AND name='schema_migrations'"
@@ -190,23 +251,13 @@ def test_schema_migrations_table_created(tmp_path):
 
 # Schema Validation Tests (require actual migration)
 
-@pytest.mark.asyncio
-async def test_execution_log_table_structure(tmp_path):
+def test_execution_log_table_structure(migrated_db_path):
     """Verify execution_log table has correct STRICT schema."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    # Apply real migrations
-    apply_migrations(db_path, migrations_dir)
-
-    # Verify table structure
-    conn = await aiosqlite.connect(str(db_path))
-    cursor = await conn.execute("PRAGMA table_info(execution_log)")
-    columns = await cursor.fetchall()
-    await cursor.close()
-    await conn.close()
+    conn = sqlite3.connect(str(migrated_db_path))
+    columns = conn.execute("PRAGMA table_info(execution_log)").fetchall()
+    conn.close()
 
-    column_names = {col[1] for col in columns}
+    column_names = frozenset(map(itemgetter(1), columns))
     expected = {
         "operation_id", "timestamp", "capability", "action", "chat_id",
         "tier", "status", "file_paths", "snapshot_ref", "duration_ms",
@@ -215,73 +266,54 @@ async def test_execution_log_table_structure(tmp_path):
     assert column_names == expected
 
 
-@pytest.mark.asyncio
-async def test_execution_log_check_constraints(tmp_path):
+def test_execution_log_check_constraints(migrated_db_path):
     """Verify CHECK constraints on tier and status."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    apply_migrations(db_path, migrations_dir)
+    conn = sqlite3.connect(str(migrated_db_path))
 
-    conn = await aiosqlite.connect(str(db_path))
+    insert_sql = (
+        "INSERT INTO execution_log"
+        " (operation_id, timestamp, capability, action, chat_id, tier, status)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
 
-    # Test invalid tier
-    with pytest.raises(aiosqlite.IntegrityError):
-        await conn.execute(
-            "INSERT INTO execution_log (operation_id, timestamp, capability, action, chat_id, tier, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            ("test", 123, "fs", "read", "chat1", 5, "completed")  # Invalid tier
-        )
-
-    # Test invalid status
-    with pytest.raises(aiosqlite.IntegrityError):
-        await conn.execute(
-            "INSERT INTO execution_log (operation_id, timestamp, capability, action, chat_id, tier, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            ("test", 123, "fs", "read", "chat1", 0, "invalid")  # Invalid status
-        )
+    # Both rejected inserts are probed inside one savepoint
+    conn.execute("SAVEPOINT check_constraints")
+    for args in [
+        ("test", 123, "fs", "read", "chat1", 5, "completed"),  # Invalid tier
+        ("test", 123, "fs", "read", "chat1", 0, "invalid"),  # Invalid status
+    ]:
+        with pytest.raises(sqlite3.IntegrityError):
+            conn.execute(insert_sql, args)
+    conn.execute("RELEASE check_constraints")
 
     # Test extended valid status
-    await conn.execute(
-        "INSERT INTO execution_log (operation_id, timestamp, capability, action, chat_id, tier, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
-        ("test-postponed", 123, "runtime", "clarification", "chat1", 0, "postponed")
+    conn.execute(
+        insert_sql, ("test-postponed", 123, "runtime", "clarification", "chat1", 0, "postponed")
     )
 
-    await conn.close()
+    conn.close()
 
 
-@pytest.mark.asyncio
-async def test_config_table_structure(tmp_path):
+def test_config_table_structure(migrated_db_path):
     """Verify config table schema."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    apply_migrations(db_path, migrations_dir)
-
-    conn = await aiosqlite.connect(str(db_path))
-    cursor = await conn.execute("PRAGMA table_info(config)")
-    columns = await cursor.fetchall()
-    await cursor.close()
-    await conn.close()
+    conn = sqlite3.connect(str(migrated_db_path))
+    columns = conn.execute("PRAGMA table_info(config)").fetchall()
+    conn.close()
 
-    column_names = {col[1] for col in columns}
+    column_names = frozenset(map(itemgetter(1), columns))
     expected = {"key", "value", "updated_at", "updated_by", "tier"}
     assert column_names == expected
 
 
-@pytest.mark.asyncio
-async def test_strict_table_type_enforcement(tmp_path):
+def test_strict_table_type_enforcement(migrated_db_path):
     """Verify STRICT mode enforces type checking."""
-    db_path = tmp_path / "test.db"
-    migrations_dir = Path(__file__).parent.parent.parent / "src" / "sohnbot" / "persistence" / "migrations"
-
-    apply_migrations(db_path, migrations_dir)
-
-    conn = await aiosqlite.connect(str(db_path))
+    conn = sqlite3.connect(str(migrated_db_path))
 
     # Attempt to insert wrong type (string for INTEGER field)
-    with pytest.raises(aiosqlite.IntegrityError):
-        await conn.execute(
+    with pytest.raises(sqlite3.IntegrityError):
+        conn.execute(
             "INSERT INTO execution_log (operation_id, timestamp, capability, action, chat_id, tier, status) VALUES (?, ?, ?, ?, ?, ?, ?)",
             ("test", "not_an_integer", "fs", "read", "chat1", 0, "completed")
         )
 
-    await conn.close()
+    conn.close()
@@ -44,10 +44,11 @@ async def test_postpone_and_schedule_logs_postponed_and_retry():
     with (
         patch("src.sohnbot.runtime.postponement_manager.log_operation_end", AsyncMock()) as mock_log_end,
         patch("src.sohnbot.runtime.postponement_manager.enqueue_notification", AsyncMock()) as mock_enqueue,
+        patch("src.sohnbot.runtime.postponement_manager.mark_retry_enqueued", AsyncMock()),
     ):
         await manager.postpone_and_schedule(pending)
-        await asyncio.sleep(0)
-        await asyncio.sleep(0)
+        # Wait for the zero-delay retry itself rather than yielding a fixed number of times.
+        await asyncio.wait_for(manager._retry_tasks["op-1"], 1.0)
 
     mock_log_end.assert_called_once_with("op-1", status="postponed")
     assert mock_enqueue.call_count >= 1
@@ -68,6 +69,7 @@ async def test_consume_resolved_removes_pending():
 @pytest.mark.asyncio
 async def test_recover_pending_rebuilds_in_memory_and_schedules_tasks():
     manager = PostponementManager(retry_delay_seconds=10, cancellation_delay_seconds=20)
+    now = manager._now_ts()
     row = {
         "operation_id": "op-1",
         "chat_id": "123",
@@ -80,8 +82,8 @@ async def test_recover_pending_rebuilds_in_memory_and_schedules_tasks():
         "created_at": 1,
         "updated_at": 1,
         "clarification_deadline_at": 2,
-        "retry_at": manager._now_ts() + 1,
-        "cancel_at": manager._now_ts() + 2,
+        "retry_at": now + 1,
+        "cancel_at": now + 2,
     }
     with patch.object(manager, "_list_active_safely", AsyncMock(return_value=[row])):
         await manager.recover_pending()
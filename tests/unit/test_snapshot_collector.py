@@ -2,12 +2,14 @@
 
 import asyncio
 import time
-from pathlib import Path
+from itertools import pairwise
 from unittest.mock import AsyncMock, patch
 
+import aiosqlite
 import pytest
 
-from scripts.migrate import apply_migrations
+import src.sohnbot.capabilities.observe as obs_module
+import src.sohnbot.observability.snapshot_collector as sc_module
 from src.sohnbot.capabilities.observe import (
     BrokerActivity,
     NotifierState,
@@ -19,6 +21,7 @@ from src.sohnbot.capabilities.observe import (
     update_snapshot_cache,
 )
 from src.sohnbot.observability.snapshot_collector import (
+    _collect_iteration,
     collect_broker_activity,
     collect_notifier_state,
     collect_process_info,
@@ -28,98 +31,79 @@ from src.sohnbot.observability.snapshot_collector import (
     query_recent_operations,
     snapshot_collector_loop,
 )
-from src.sohnbot.persistence.db import DatabaseManager, set_db_manager
+from src.sohnbot.persistence.db import set_db_manager
 
 
 # ---------------------------------------------------------------------------
 # Fixtures
 # ---------------------------------------------------------------------------
 
-MIGRATIONS_DIR = (
-    Path(__file__).parent.parent.parent
-    / "src"
-    / "sohnbot"
-    / "persistence"
-    / "migrations"
-)
-
-
-@pytest.fixture(autouse=True)
+@pytest.fixture
 def reset_snapshot_cache():
-    """Reset module-level snapshot cache between tests."""
-    import src.sohnbot.capabilities.observe as obs_module
-    import src.sohnbot.observability.snapshot_collector as sc_module
-
+    """Reset module-level snapshot and health caches around tests that fill them."""
     obs_module._snapshot_cache = None
     sc_module._process = None  # Reset cached psutil handle
     sc_module._persist_warning_logged = False  # Reset warning flag
+    sc_module._reset_health_cache()
     yield
     obs_module._snapshot_cache = None
     sc_module._persist_warning_logged = False
+    sc_module._reset_health_cache()
 
 
 @pytest.fixture
-async def db_with_tables(tmp_path):
-    """Fixture: real SQLite DB with all migrations applied, set as global.
+def db_with_tables(memory_db):
+    """Fixture: module-shared in-memory SQLite DB with all migrations applied, set as global.
 
-    Resets the global DB manager to None on teardown to prevent cross-test
-    interference (other tests rely on RuntimeError when no DB is configured).
+    The schema is copied once per module from the session-wide migrated
+    template; conftest's memory_db clears the rows after each test. Resets the
+    global DB manager to None on teardown to prevent cross-test interference
+    (other tests rely on RuntimeError when no DB is configured).
     """
-    db_path = tmp_path / "test.db"
-    apply_migrations(db_path, MIGRATIONS_DIR)
-    db_manager = DatabaseManager(db_path)
-    set_db_manager(db_manager)
-    yield db_manager
-    await db_manager.close()
+    yield memory_db
     set_db_manager(None)  # type: ignore[arg-type]  # Reset global to prevent test pollution
 
 
-async def _seed_operation(db_manager: DatabaseManager, op_id: str, status: str = "completed") -> None:
-    """Seed a row in execution_log for testing."""
-    db = await db_manager.get_connection()
-    await db.execute(
-        """
-        INSERT INTO execution_log (
-            operation_id, timestamp, capability, action, chat_id, tier, status
-        ) VALUES (?, strftime('%s','now'), 'fs', 'read', 'chat1', 0, ?)
-        """,
-        (op_id, status),
-    )
-    await db.commit()
+_INSERT_OPERATION_SQL = """
+    INSERT INTO execution_log (
+        operation_id, timestamp, capability, action, chat_id, tier, status
+    ) VALUES (?, ?, 'fs', 'read', 'chat1', 0, ?)
+"""
 
+_INSERT_NOTIFICATION_SQL = """
+    INSERT INTO notification_outbox (
+        operation_id, chat_id, status, message_text, created_at, sent_at
+    ) VALUES (?, 'chat1', ?, 'test msg', ?, ?)
+"""
 
-async def _seed_notification(
-    db_manager: DatabaseManager,
-    op_id: str,
+
+async def _seed_operations(
+    db: aiosqlite.Connection, *op_ids: str, status: str = "completed"
+) -> None:
+    """Seed execution_log rows for the given ids; the caller commits."""
+    now = int(time.time())
+    await db.executemany(_INSERT_OPERATION_SQL, [(op_id, now, status) for op_id in op_ids])
+
+
+async def _seed_notifications(
+    db: aiosqlite.Connection,
+    *op_ids: str,
     status: str = "pending",
     sent_at: int | None = None,
 ) -> None:
-    """Seed a row in notification_outbox for testing.
+    """Seed notification_outbox rows (and their operations); the caller commits.
 
     Args:
-        db_manager: DatabaseManager for the test DB.
-        op_id: Unique operation ID for the seeded rows.
+        db: Connection to the test DB, acquired once by the test.
+        op_ids: Unique operation IDs for the seeded rows.
         status: Notification status ('pending', 'sent', 'failed').
         sent_at: Optional Unix epoch for sent_at column (simulates attempted send).
     """
-    db = await db_manager.get_connection()
-    await db.execute(
-        """
-        INSERT INTO execution_log (
-            operation_id, timestamp, capability, action, chat_id, tier, status
-        ) VALUES (?, strftime('%s','now'), 'fs', 'read', 'chat1', 0, 'completed')
-        """,
-        (op_id,),
-    )
-    await db.execute(
-        """
-        INSERT INTO notification_outbox (
-            operation_id, chat_id, status, message_text, created_at, sent_at
-        ) VALUES (?, 'chat1', ?, 'test msg', strftime('%s','now'), ?)
-        """,
-        (op_id, status, sent_at),
+    now = int(time.time())
+    await db.executemany(_INSERT_OPERATION_SQL, [(op_id, now, "completed") for op_id in op_ids])
+    await db.executemany(
+        _INSERT_NOTIFICATION_SQL, [(op_id, status, now, sent_at) for op_id in op_ids]
     )
-    await db.commit()
 
 
 # ---------------------------------------------------------------------------
@@ -177,7 +161,7 @@ def test_collect_scheduler_state_never_raises():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_broker_activity_empty_db(db_with_tables):
     """Empty execution_log must return zero-valued BrokerActivity."""
     activity = await collect_broker_activity()
@@ -187,26 +171,22 @@ async def test_collect_broker_activity_empty_db(db_with_tables):
     assert activity.last_10_results == {}
 
 
-@pytest.mark.asyncio
-async def test_collect_broker_activity_with_completed_operations(db_with_tables):
-    """Completed operations show up in last_10_results."""
-    await _seed_operation(db_with_tables, "op1", "completed")
-    await _seed_operation(db_with_tables, "op2", "completed")
+@pytest.mark.asyncio(loop_scope="module")
+async def test_collect_broker_activity_mixed(db_with_tables):
+    """Completed operations show up in last_10_results, in-progress ones as in-flight."""
+    db = await db_with_tables.get_connection()
+    await _seed_operations(db, "op1", "op2")
+    await _seed_operations(db, "op_running", status="in_progress")
+    await db.commit()
     activity = await collect_broker_activity()
     assert activity.last_operation_timestamp > 0
-    assert activity.last_10_results.get("completed", 0) == 2
-
-
-@pytest.mark.asyncio
-async def test_collect_broker_activity_in_flight(db_with_tables):
-    """In-progress operations appear in in_flight_operations."""
-    await _seed_operation(db_with_tables, "op_running", "in_progress")
-    activity = await collect_broker_activity()
+    assert activity.last_10_results == {"completed": 2}
     assert len(activity.in_flight_operations) == 1
+    assert activity.in_flight_operations[0]["operation_id"] == "op_running"
     assert activity.in_flight_operations[0]["tool"] == "fs__read"
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_broker_activity_no_db_returns_defaults():
     """When no DB is configured, returns safe zero-valued defaults."""
     with patch("src.sohnbot.observability.snapshot_collector.get_db", side_effect=RuntimeError("no db")):
@@ -220,7 +200,7 @@ async def test_collect_broker_activity_no_db_returns_defaults():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_notifier_state_empty_db(db_with_tables):
     """Empty notification_outbox must return zero-valued NotifierState."""
     state = await collect_notifier_state()
@@ -230,36 +210,42 @@ async def test_collect_notifier_state_empty_db(db_with_tables):
     assert state.last_attempt_timestamp == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_notifier_state_with_pending(db_with_tables):
     """Pending notification shows up in pending_count."""
-    await _seed_notification(db_with_tables, "notif1", "pending")
+    db = await db_with_tables.get_connection()
+    await _seed_notifications(db, "notif1")
+    await db.commit()
     state = await collect_notifier_state()
     assert state.pending_count == 1
     assert state.last_attempt_timestamp > 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_notifier_state_oldest_age_is_non_negative(db_with_tables):
     """oldest_pending_age_seconds must be >= 0 when there are pending items."""
-    await _seed_notification(db_with_tables, "notif2", "pending")
+    db = await db_with_tables.get_connection()
+    await _seed_notifications(db, "notif2")
+    await db.commit()
     state = await collect_notifier_state()
     if state.oldest_pending_age_seconds is not None:
         assert state.oldest_pending_age_seconds >= 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_notifier_state_last_attempt_uses_sent_at(db_with_tables):
     """last_attempt_timestamp reflects sent_at, not created_at, when available."""
     # Seed a sent notification with a known sent_at in the past
     known_sent_at = 1_700_000_000  # 2023-11-14 — clearly distinct from now
-    await _seed_notification(db_with_tables, "notif_sent", status="sent", sent_at=known_sent_at)
+    db = await db_with_tables.get_connection()
+    await _seed_notifications(db, "notif_sent", status="sent", sent_at=known_sent_at)
+    await db.commit()
     state = await collect_notifier_state()
     # last_attempt_timestamp must reflect the actual send time, not now
     assert state.last_attempt_timestamp == known_sent_at
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_notifier_state_no_db_returns_defaults():
     """When no DB is configured, returns safe zero-valued defaults."""
     with patch("src.sohnbot.observability.snapshot_collector.get_db", side_effect=RuntimeError("no db")):
@@ -273,41 +259,34 @@ async def test_collect_notifier_state_no_db_returns_defaults():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_collect_resource_usage_non_blocking():
-    """collect_resource_usage() must complete quickly (non-blocking design)."""
-    start = time.perf_counter()
-    usage = await collect_resource_usage()
-    elapsed = time.perf_counter() - start
-    assert elapsed < 3.0, f"collect_resource_usage took {elapsed:.2f}s — too slow"
-    assert isinstance(usage, ResourceUsage)
+@pytest.mark.asyncio(loop_scope="module")
+async def test_collect_resource_usage_invariants():
+    """One collection must not stall the event loop and must return sane values."""
+    loop = asyncio.get_running_loop()
+    ticks = [loop.time()]
 
+    async def heartbeat():
+        while True:
+            await asyncio.sleep(0.005)
+            ticks.append(loop.time())
 
-@pytest.mark.asyncio
-async def test_collect_resource_usage_ram_positive():
-    """Process RAM usage must be > 0."""
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0)  # Let the heartbeat start before collecting
     usage = await collect_resource_usage()
-    assert usage.ram_mb > 0
-
+    ticks.append(loop.time())
+    beat.cancel()
+    try:
+        await beat
+    except asyncio.CancelledError:
+        pass
 
-@pytest.mark.asyncio
-async def test_collect_resource_usage_cpu_percent_non_negative():
-    """CPU percent must be non-negative."""
-    usage = await collect_resource_usage()
+    # Non-blocking design: no single step may hold the loop
+    max_gap = max(later - earlier for earlier, later in pairwise(ticks))
+    assert max_gap < 0.05, f"event loop stalled for {max_gap * 1000:.0f}ms"
+    assert isinstance(usage, ResourceUsage)
+    assert usage.ram_mb > 0
     assert usage.cpu_percent >= 0.0
-
-
-@pytest.mark.asyncio
-async def test_collect_resource_usage_db_size_non_negative():
-    """DB size must be >= 0 (may be 0 if file not found)."""
-    usage = await collect_resource_usage()
-    assert usage.db_size_mb >= 0.0
-
-
-@pytest.mark.asyncio
-async def test_collect_resource_usage_snapshot_count_non_negative():
-    """Snapshot count must be non-negative."""
-    usage = await collect_resource_usage()
+    assert usage.db_size_mb >= 0.0  # May be 0 if file not found
     assert usage.snapshot_count >= 0
 
 
@@ -316,17 +295,19 @@ async def test_collect_resource_usage_snapshot_count_non_negative():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_query_recent_operations_empty_db(db_with_tables):
     """Empty execution_log must return an empty list."""
     ops = await query_recent_operations(limit=10)
     assert ops == []
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_query_recent_operations_returns_operations(db_with_tables):
     """Seeded operations are returned with expected keys."""
-    await _seed_operation(db_with_tables, "op_a", "completed")
+    db = await db_with_tables.get_connection()
+    await _seed_operations(db, "op_a")
+    await db.commit()
     ops = await query_recent_operations(limit=10)
     assert len(ops) == 1
     assert ops[0]["operation_id"] == "op_a"
@@ -334,11 +315,12 @@ async def test_query_recent_operations_returns_operations(db_with_tables):
     assert "capability" in ops[0]
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="module")
 async def test_query_recent_operations_respects_limit(db_with_tables):
     """Only up to `limit` operations are returned."""
-    for i in range(5):
-        await _seed_operation(db_with_tables, f"op_{i}", "completed")
+    db = await db_with_tables.get_connection()
+    await _seed_operations(db, *(f"op_{i}" for i in range(5)))
+    await db.commit()
     ops = await query_recent_operations(limit=3)
     assert len(ops) <= 3
 
@@ -348,7 +330,8 @@ async def test_query_recent_operations_respects_limit(db_with_tables):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("reset_snapshot_cache")
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_snapshot_completes_fast(db_with_tables):
     """collect_snapshot() must complete in a reasonable time."""
     start = time.perf_counter()
@@ -361,14 +344,30 @@ async def test_collect_snapshot_completes_fast(db_with_tables):
     assert elapsed_ms < 5000, f"collect_snapshot took {elapsed_ms:.0f}ms"
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("reset_snapshot_cache")
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_snapshot_health_populated(db_with_tables):
     """Story 3.2: health checks must be populated in snapshots."""
     snap = await collect_snapshot()
     assert len(snap.health) > 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.usefixtures("reset_snapshot_cache")
+@pytest.mark.asyncio(loop_scope="module")
+async def test_collect_snapshot_reuses_recent_health_results(db_with_tables):
+    """Health checks run once for snapshots collected within the cache TTL."""
+    with patch(
+        "src.sohnbot.observability.snapshot_collector.run_all_health_checks",
+        AsyncMock(return_value=[]),
+    ) as mock_checks:
+        first = await collect_snapshot()
+        second = await collect_snapshot()
+    assert mock_checks.await_count == 1
+    assert second.health is first.health
+
+
+@pytest.mark.usefixtures("reset_snapshot_cache")
+@pytest.mark.asyncio(loop_scope="module")
 async def test_collect_snapshot_all_fields_present(db_with_tables):
     """All StatusSnapshot fields must be populated."""
     snap = await collect_snapshot()
@@ -385,6 +384,7 @@ async def test_collect_snapshot_all_fields_present(db_with_tables):
 # ---------------------------------------------------------------------------
 
 
+@pytest.mark.usefixtures("reset_snapshot_cache")
 def test_snapshot_cache_update_and_get():
     """update_snapshot_cache → get_current_snapshot round-trip."""
     from src.sohnbot.capabilities.observe import (
@@ -417,52 +417,46 @@ def test_snapshot_cache_update_and_get():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_snapshot_collector_loop_catches_errors():
-    """Loop must survive errors without propagating exceptions."""
-    call_count = 0
+@pytest.mark.usefixtures("reset_snapshot_cache")
+@pytest.mark.asyncio(loop_scope="module")
+async def test_collect_iteration_catches_errors(monkeypatch):
+    """A failed collection is logged and swallowed so the loop keeps running."""
 
-    async def failing_collect(*args, **kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count < 3:
-            raise RuntimeError("simulated collection failure")
-        # Cancel the task on the 3rd call to end the test
-        raise asyncio.CancelledError
+    async def failing_collect():
+        raise RuntimeError("simulated collection failure")
 
-    with patch(
-        "src.sohnbot.observability.snapshot_collector.collect_snapshot",
-        side_effect=failing_collect,
-    ), patch(
-        "src.sohnbot.observability.snapshot_collector.asyncio.sleep",
-        new_callable=AsyncMock,
-    ):
-        with pytest.raises(asyncio.CancelledError):
-            await snapshot_collector_loop(interval_seconds=0)
+    monkeypatch.setattr(sc_module, "collect_snapshot", failing_collect)
+    await _collect_iteration()
 
-    # Must have been called at least twice (errors don't stop the loop)
-    assert call_count >= 2
+    assert get_current_snapshot() is None
 
 
-@pytest.mark.asyncio
-async def test_snapshot_collector_loop_updates_cache(db_with_tables):
+@pytest.mark.usefixtures("reset_snapshot_cache")
+@pytest.mark.asyncio(loop_scope="module")
+async def test_snapshot_collector_loop_updates_cache(db_with_tables, monkeypatch):
     """After one successful loop iteration, the cache is populated."""
+    cached = asyncio.Event()
+
+    def update_and_signal(snapshot):
+        update_snapshot_cache(snapshot)
+        cached.set()
+
+    monkeypatch.setattr(
+        "src.sohnbot.observability.snapshot_collector.update_snapshot_cache",
+        update_and_signal,
+    )
+
     # Launch the loop as a real background task with a long sleep interval
     # so it runs exactly once before we cancel it.
     task = asyncio.create_task(snapshot_collector_loop(interval_seconds=999))
-
-    # Poll the cache until populated (up to 10s for slow CI environments)
-    deadline = time.monotonic() + 10.0
-    while time.monotonic() < deadline:
-        if get_current_snapshot() is not None:
-            break
-        await asyncio.sleep(0.05)
-
-    task.cancel()
     try:
-        await task
-    except asyncio.CancelledError:
-        pass
+        await asyncio.wait_for(cached.wait(), timeout=10.0)
+    finally:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
 
     result = get_current_snapshot()
     assert result is not None
@@ -1,16 +1,42 @@
 """Unit tests for SnapshotManager git capability."""
 
 import asyncio
+import os
+from dataclasses import dataclass
 from pathlib import Path
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from sohnbot.capabilities.git.snapshot_manager import GitCapabilityError, SnapshotManager
 
 
-@pytest.fixture
+@dataclass
+class _FakeProc:
+    """Minimal stand-in for asyncio.subprocess.Process."""
+
+    returncode: int = 0
+    stdout: bytes = b""
+    stderr: bytes = b""
+    hang: bool = False
+    killed: bool = False
+
+    async def communicate(self):
+        if self.hang:
+            # Never finishes; the caller's wait_for must time out.
+            await asyncio.get_running_loop().create_future()
+        return self.stdout, self.stderr
+
+    async def wait(self):
+        return self.returncode
+
+    def kill(self):
+        self.killed = True
+
+
+@pytest.fixture(scope="module")
 def manager():
+    """Shared by the module; its list cache is keyed by each test's own tmp_path repo."""
     return SnapshotManager()
 
 
@@ -23,60 +49,82 @@ def fake_repo(tmp_path):
     return tmp_path
 
 
+@pytest.fixture
+def mock_exec():
+    """Fake subprocess runner; tests set return_value or side_effect."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def exec_manager(mock_exec):
+    """SnapshotManager that starts git through mock_exec instead of a real process."""
+    return SnapshotManager(runner=mock_exec)
+
+
 # ---------------------------------------------------------------------------
 # find_repo_root
 # ---------------------------------------------------------------------------
 
 class TestFindRepoRoot:
-    def test_finds_git_dir_in_parent(self, manager, fake_repo):
-        """Walks up from a file path and finds .git directory."""
-        file_path = str(fake_repo / "somefile.py")
-        root = manager.find_repo_root(file_path)
-        assert root == str(fake_repo)
-
-    def test_finds_git_dir_nested(self, manager, fake_repo):
-        """Handles nested subdirectory paths."""
-        sub = fake_repo / "src" / "pkg"
-        sub.mkdir(parents=True)
-        file_path = str(sub / "module.py")
-        root = manager.find_repo_root(file_path)
-        assert root == str(fake_repo)
-
-    def test_not_a_git_repo_raises(self, manager, tmp_path):
+    @pytest.fixture(scope="class")
+    def repo_tree(self, tmp_path_factory):
+        """A fake git repo and a sibling non-repo directory, built once for the class."""
+        base = tmp_path_factory.mktemp("find_repo_root")
+        repo = base / "repo"
+        (repo / ".git").mkdir(parents=True)
+        (repo / "somefile.py").write_text("hello\n")
+        (repo / "src" / "pkg").mkdir(parents=True)
+        (base / "no_git_here").mkdir()
+        return base
+
+    @pytest.mark.parametrize(
+        "relative_path",
+        [
+            # Walks up from a file path and finds .git directory
+            pytest.param("somefile.py", id="file_in_root"),
+            # Handles nested subdirectory paths
+            pytest.param("src/pkg/module.py", id="nested"),
+            # M2 fix: non-existent file path resolves repo root (not path/.git/)
+            pytest.param("new_file_not_yet_created.py", id="non_existent_file"),
+        ],
+    )
+    def test_finds_repo_root(self, manager, repo_tree, relative_path):
+        """Resolves the directory containing .git from any path inside the repo."""
+        repo = repo_tree / "repo"
+        root = manager.find_repo_root(str(repo / relative_path))
+        assert root == str(repo)
+
+    def test_repeat_lookup_is_cached(self, manager, repo_tree):
+        """A second lookup under the same directory does not probe for .git again."""
+        file_path = str(repo_tree / "repo" / "src" / "pkg" / "cached.py")
+        first = manager.find_repo_root(file_path)
+
+        with patch("pathlib.Path.exists") as mock_exists:
+            assert manager.find_repo_root(file_path) == first
+        mock_exists.assert_not_called()
+
+    def test_not_a_git_repo_raises(self, manager, repo_tree):
         """Raises not_a_git_repo when no .git found."""
-        no_git = tmp_path / "no_git_here"
-        no_git.mkdir()
         with pytest.raises(GitCapabilityError) as exc_info:
-            manager.find_repo_root(str(no_git / "file.txt"))
+            manager.find_repo_root(str(repo_tree / "no_git_here" / "file.txt"))
         assert exc_info.value.code == "not_a_git_repo"
         assert exc_info.value.retryable is False
 
-    def test_finds_repo_root_for_non_existent_file(self, manager, fake_repo):
-        """M2 fix: non-existent file path correctly resolves repo root (not path/.git/)."""
-        # The file doesn't exist on disk but its parent is inside a git repo
-        non_existent = str(fake_repo / "new_file_not_yet_created.py")
-        root = manager.find_repo_root(non_existent)
-        assert root == str(fake_repo)
-
 
 # ---------------------------------------------------------------------------
 # create_snapshot — happy path
 # ---------------------------------------------------------------------------
 
 class TestCreateSnapshotHappyPath:
-    @pytest.mark.asyncio
-    async def test_creates_snapshot_branch(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_creates_snapshot_branch(self, exec_manager, fake_repo, mock_exec):
         """Calls git branch with snapshot/edit-YYYY-MM-DD-HHMM naming."""
-        process_mock = AsyncMock()
-        process_mock.returncode = 0
-        process_mock.communicate = AsyncMock(return_value=(b"", b""))
-
-        with patch("asyncio.create_subprocess_exec", return_value=process_mock) as mock_exec:
-            result = await manager.create_snapshot(
-                repo_path=str(fake_repo),
-                operation_id="abc12345",
-                timeout_seconds=5,
-            )
+        mock_exec.return_value = _FakeProc()
+        result = await exec_manager.create_snapshot(
+            repo_path=str(fake_repo),
+            operation_id="abc12345",
+            timeout_seconds=5,
+        )
 
         # Branch name format: snapshot/edit-YYYY-MM-DD-HHMM
         assert result.startswith("snapshot/edit-")
@@ -91,34 +139,46 @@ class TestCreateSnapshotHappyPath:
         assert call_args[2] == str(fake_repo)
         assert call_args[3] == "branch"
 
-    @pytest.mark.asyncio
-    async def test_handles_name_collision_with_suffix(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_concurrent_snapshots_skip_collision_retry(
+        self, exec_manager, fake_repo, mock_exec
+    ):
+        """Concurrent calls for one repo get distinct branches with one git call each."""
+        mock_exec.return_value = _FakeProc()
+
+        first, second = await asyncio.gather(
+            exec_manager.create_snapshot(str(fake_repo), operation_id="aaaa1111"),
+            exec_manager.create_snapshot(str(fake_repo), operation_id="bbbb2222"),
+        )
+
+        assert first != second
+        assert mock_exec.await_count == 2
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_handles_name_collision_with_suffix(self, exec_manager, fake_repo, mock_exec):
         """On collision ('already exists'), retries with operation_id suffix."""
         # First call: already exists → returncode 128
-        process_collision = AsyncMock()
-        process_collision.returncode = 128
-        process_collision.communicate = AsyncMock(
-            return_value=(b"", b"fatal: A branch named 'snapshot/edit-2026-02-26-1200' already exists")
+        process_collision = _FakeProc(
+            returncode=128,
+            stderr=b"fatal: A branch named 'snapshot/edit-2026-02-26-1200' already exists",
         )
         # Second call: success
-        process_success = AsyncMock()
-        process_success.returncode = 0
-        process_success.communicate = AsyncMock(return_value=(b"", b""))
+        process_success = _FakeProc()
 
         call_count = 0
 
-        async def mock_exec(*args, **kwargs):
+        async def fake_exec(*args, **kwargs):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
                 return process_collision
             return process_success
 
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            result = await manager.create_snapshot(
-                repo_path=str(fake_repo),
-                operation_id="abc12345",
-            )
+        mock_exec.side_effect = fake_exec
+        result = await exec_manager.create_snapshot(
+            repo_path=str(fake_repo),
+            operation_id="abc12345",
+        )
 
         assert call_count == 2
         # Second attempt appends operation_id prefix
@@ -130,55 +190,43 @@ class TestCreateSnapshotHappyPath:
 # ---------------------------------------------------------------------------
 
 class TestCreateSnapshotErrors:
-    @pytest.mark.asyncio
-    async def test_git_not_found(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_git_not_found(self, exec_manager, fake_repo, mock_exec):
         """FileNotFoundError from subprocess → git_not_found error code."""
-        with patch(
-            "asyncio.create_subprocess_exec",
-            side_effect=FileNotFoundError("git not found"),
-        ):
-            with pytest.raises(GitCapabilityError) as exc_info:
-                await manager.create_snapshot(
-                    repo_path=str(fake_repo),
-                    operation_id="abc12345",
-                )
+        mock_exec.side_effect = FileNotFoundError("git not found")
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager.create_snapshot(
+                repo_path=str(fake_repo),
+                operation_id="abc12345",
+            )
         assert exc_info.value.code == "git_not_found"
         assert exc_info.value.retryable is False
 
-    @pytest.mark.asyncio
-    async def test_snapshot_timeout(self, manager, fake_repo):
-        """asyncio.TimeoutError → snapshot_timeout error code."""
-        process_mock = AsyncMock()
-        process_mock.kill = MagicMock()
-        process_mock.wait = AsyncMock()
-        process_mock.communicate = AsyncMock(side_effect=asyncio.TimeoutError())
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_snapshot_timeout(self, exec_manager, fake_repo, mock_exec):
+        """A git call outliving timeout_seconds → snapshot_timeout error code."""
+        process = _FakeProc(hang=True)
 
-        with patch("asyncio.create_subprocess_exec", return_value=process_mock):
-            with pytest.raises(GitCapabilityError) as exc_info:
-                await manager.create_snapshot(
-                    repo_path=str(fake_repo),
-                    operation_id="abc12345",
-                    timeout_seconds=1,
-                )
+        mock_exec.return_value = process
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager.create_snapshot(
+                repo_path=str(fake_repo),
+                operation_id="abc12345",
+                timeout_seconds=0,
+            )
         assert exc_info.value.code == "snapshot_timeout"
         assert exc_info.value.retryable is True
-        process_mock.kill.assert_called_once()
+        assert process.killed
 
-    @pytest.mark.asyncio
-    async def test_snapshot_creation_failed(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_snapshot_creation_failed(self, exec_manager, fake_repo, mock_exec):
         """Non-zero returncode without 'already exists' → snapshot_creation_failed."""
-        process_mock = AsyncMock()
-        process_mock.returncode = 1
-        process_mock.communicate = AsyncMock(
-            return_value=(b"", b"fatal: some other git error")
-        )
-
-        with patch("asyncio.create_subprocess_exec", return_value=process_mock):
-            with pytest.raises(GitCapabilityError) as exc_info:
-                await manager.create_snapshot(
-                    repo_path=str(fake_repo),
-                    operation_id="abc12345",
-                )
+        mock_exec.return_value = _FakeProc(returncode=1, stderr=b"fatal: some other git error")
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager.create_snapshot(
+                repo_path=str(fake_repo),
+                operation_id="abc12345",
+            )
         assert exc_info.value.code == "snapshot_creation_failed"
         assert exc_info.value.retryable is False
 
@@ -215,20 +263,21 @@ class TestGitCapabilityErrorShape:
 # ---------------------------------------------------------------------------
 
 class TestListSnapshots:
-    def test_lists_snapshots_with_timestamps(self, manager, fake_repo):
-        """Returns sorted list of snapshot branches with parsed timestamps."""
-        # Mock git branch --list output
-        git_output = b"  snapshot/edit-2026-02-27-1430\n  snapshot/edit-2026-02-26-0900\n"
-
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=git_output,
-                stderr=b"",
-            )
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_lists_snapshots_with_timestamps(self, exec_manager, fake_repo, mock_exec):
+        """Returns sorted loose and packed snapshot branches with parsed timestamps."""
+        loose_dir = fake_repo / ".git" / "refs" / "heads" / "snapshot"
+        loose_dir.mkdir(parents=True)
+        (loose_dir / "edit-2026-02-26-0900").write_text("a" * 40 + "\n")
+        (fake_repo / ".git" / "packed-refs").write_text(
+            "# pack-refs with: peeled fully-peeled sorted \n"
+            + "b" * 40 + " refs/heads/main\n"
+            + "b" * 40 + " refs/heads/snapshot/edit-2026-02-27-1430\n"
+        )
 
-            result = manager.list_snapshots(str(fake_repo))
+        result = await exec_manager.list_snapshots(str(fake_repo))
 
+        mock_exec.assert_not_called()
         assert len(result) == 2
         # Should be sorted newest first
         assert result[0]["ref"] == "snapshot/edit-2026-02-27-1430"
@@ -236,30 +285,112 @@ class TestListSnapshots:
         assert result[1]["ref"] == "snapshot/edit-2026-02-26-0900"
         assert "Feb 26, 2026 09:00 UTC" in result[1]["timestamp"]
 
-    def test_returns_empty_list_when_no_snapshots(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_returns_empty_list_when_no_snapshots(self, manager, fake_repo):
         """Returns empty list when no snapshot branches exist."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=0,
-                stdout=b"",
-                stderr=b"",
-            )
-
-            result = manager.list_snapshots(str(fake_repo))
+        result = await manager.list_snapshots(str(fake_repo))
 
         assert result == []
 
-    def test_raises_on_git_failure(self, manager, fake_repo):
-        """Raises list_snapshots_failed when git command fails."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(
-                returncode=1,
-                stdout=b"",
-                stderr=b"fatal: not a git repository",
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_reads_refs_through_worktree_gitfile(self, manager, fake_repo, tmp_path):
+        """A linked worktree's .git file is followed to the shared refs."""
+        worktree_git_dir = fake_repo / ".git" / "worktrees" / "wt"
+        worktree_git_dir.mkdir(parents=True)
+        (worktree_git_dir / "commondir").write_text("../..\n")
+        loose_dir = fake_repo / ".git" / "refs" / "heads" / "snapshot"
+        loose_dir.mkdir(parents=True)
+        (loose_dir / "edit-2026-02-27-1430").write_text("a" * 40 + "\n")
+        worktree = tmp_path / "wt"
+        worktree.mkdir()
+        (worktree / ".git").write_text(f"gitdir: {worktree_git_dir}\n")
+
+        result = await manager.list_snapshots(str(worktree))
+
+        assert [snap["ref"] for snap in result] == ["snapshot/edit-2026-02-27-1430"]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_reftable_repo_falls_back_to_git(self, exec_manager, fake_repo, mock_exec):
+        """Repositories using the reftable backend are listed via git."""
+        (fake_repo / ".git" / "reftable").mkdir()
+        mock_exec.return_value = _FakeProc(stdout=b"snapshot/edit-2026-02-27-1430\n")
+
+        result = await exec_manager.list_snapshots(str(fake_repo))
+
+        mock_exec.assert_awaited_once()
+        assert "for-each-ref" in mock_exec.await_args.args
+        assert [snap["ref"] for snap in result] == ["snapshot/edit-2026-02-27-1430"]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_reftable_git_timeout_kills_process(self, exec_manager, fake_repo, mock_exec):
+        """A hung git fallback is killed and reported as retryable."""
+        proc = _FakeProc(hang=True)
+        mock_exec.return_value = proc
+
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager._list_snapshot_refs_via_git(  # noqa: SLF001
+                str(fake_repo), timeout_seconds=0
             )
 
-            with pytest.raises(GitCapabilityError) as exc_info:
-                manager.list_snapshots(str(fake_repo))
+        assert exc_info.value.code == "list_snapshots_failed"
+        assert exc_info.value.retryable is True
+        assert proc.killed is True
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_repeat_listing_is_cached(self, exec_manager, fake_repo, mock_exec):
+        """A second listing with unchanged ref storage does not spawn git again."""
+        (fake_repo / ".git" / "reftable").mkdir()
+        (fake_repo / ".git" / "reftable" / "tables.list").write_text("")
+        mock_exec.return_value = _FakeProc(stdout=b"snapshot/edit-2026-02-27-1430\n")
+
+        first = await exec_manager.list_snapshots(str(fake_repo))
+        second = await exec_manager.list_snapshots(str(fake_repo))
+
+        mock_exec.assert_awaited_once()
+        assert second == first
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_cache_follows_ref_storage_changes(self, manager, fake_repo):
+        """A snapshot ref added behind the manager's back shows up once the refs dir changes."""
+        loose_dir = fake_repo / ".git" / "refs" / "heads" / "snapshot"
+        loose_dir.mkdir(parents=True)
+        (loose_dir / "edit-2026-02-26-0900").write_text("a" * 40 + "\n")
+        await manager.list_snapshots(str(fake_repo))
+
+        (loose_dir / "edit-2026-02-27-1430").write_text("a" * 40 + "\n")
+        # Bump the mtime explicitly; the filesystem clock may not have ticked.
+        stat = loose_dir.stat()
+        os.utime(loose_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        result = await manager.list_snapshots(str(fake_repo))
+
+        assert [snap["ref"] for snap in result] == [
+            "snapshot/edit-2026-02-27-1430",
+            "snapshot/edit-2026-02-26-0900",
+        ]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_create_snapshot_invalidates_cache(self, exec_manager, fake_repo, mock_exec):
+        """Creating a snapshot drops the cached listing for that repository."""
+        (fake_repo / ".git" / "reftable").mkdir()
+        (fake_repo / ".git" / "reftable" / "tables.list").write_text("")
+        mock_exec.side_effect = [
+            _FakeProc(stdout=b"snapshot/edit-2026-02-26-0900\n"),  # first listing
+            _FakeProc(),  # git branch
+            _FakeProc(stdout=b"snapshot/edit-2026-02-26-0900\nsnapshot/edit-2026-02-27-1430\n"),
+        ]
+
+        await exec_manager.list_snapshots(str(fake_repo))
+        await exec_manager.create_snapshot(str(fake_repo), operation_id="abcd1234")
+        result = await exec_manager.list_snapshots(str(fake_repo))
+
+        assert mock_exec.await_count == 3
+        assert len(result) == 2
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_raises_when_not_a_git_repo(self, manager, tmp_path):
+        """Raises list_snapshots_failed when the path has no .git."""
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await manager.list_snapshots(str(tmp_path))
 
         assert exc_info.value.code == "list_snapshots_failed"
 
@@ -269,176 +400,119 @@ class TestListSnapshots:
 # ---------------------------------------------------------------------------
 
 class TestRollbackToSnapshot:
-    @pytest.mark.asyncio
-    async def test_rollback_restores_files_and_commits(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_rollback_restores_files_and_commits(self, exec_manager, fake_repo, mock_exec):
         """Happy path: verifies snapshot, restores files, creates commit."""
         snapshot_ref = "snapshot/edit-2026-02-27-1430"
         operation_id = "abc12345"
 
-        # Mock git commands in sequence:
-        # 1. rev-parse --verify (verify snapshot exists) - success
-        # 2. checkout <ref> -- . (restore files) - success
-        # 3. commit (create rollback commit) - success
-        # 4. rev-parse --short HEAD (get commit hash) - returns hash
-        # 5. diff-tree (count files) - returns file list
-
-        call_count = 0
-
-        async def mock_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            process = AsyncMock()
-            process.returncode = 0
-
-            if call_count == 1:  # rev-parse --verify
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-            elif call_count == 2:  # checkout
-                process.communicate = AsyncMock(return_value=(b"", b""))
-            elif call_count == 3:  # commit
-                process.communicate = AsyncMock(return_value=(b"", b""))
-            elif call_count == 4:  # rev-parse --short HEAD
-                process.communicate = AsyncMock(return_value=(b"def456\n", b""))
-            elif call_count == 5:  # diff-tree
-                process.communicate = AsyncMock(return_value=(b"file1.py\nfile2.py\n", b""))
-
-            return process
-
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            result = await manager.rollback_to_snapshot(
-                repo_path=str(fake_repo),
-                snapshot_ref=snapshot_ref,
-                operation_id=operation_id,
-                timeout_seconds=30,
-            )
+        # Git commands in sequence:
+        mock_exec.side_effect = [
+            _FakeProc(stdout=b"abc123\n"),  # rev-parse --verify (snapshot exists)
+            _FakeProc(),  # checkout <ref> -- . (restore files)
+            _FakeProc(),  # commit (create rollback commit)
+            # log -1 --format=%h --name-only (commit hash + changed files)
+            _FakeProc(stdout=b"def456\n\nfile1.py\nfile2.py\n"),
+        ]
+
+        result = await exec_manager.rollback_to_snapshot(
+            repo_path=str(fake_repo),
+            snapshot_ref=snapshot_ref,
+            operation_id=operation_id,
+            timeout_seconds=30,
+        )
 
         assert result["snapshot_ref"] == snapshot_ref
         assert result["commit_hash"] == "def456"
         assert result["files_restored"] == 2
-        assert call_count == 5
+        assert mock_exec.await_count == 4
 
-    @pytest.mark.asyncio
-    async def test_snapshot_not_found(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_snapshot_not_found(self, exec_manager, fake_repo, mock_exec):
         """Raises snapshot_not_found when snapshot doesn't exist."""
-        process = AsyncMock()
-        process.returncode = 128
-        process.communicate = AsyncMock(return_value=(b"", b"fatal: Needed a single revision"))
+        mock_exec.return_value = _FakeProc(
+            returncode=128, stderr=b"fatal: Needed a single revision"
+        )
 
-        with patch("asyncio.create_subprocess_exec", return_value=process):
-            with pytest.raises(GitCapabilityError) as exc_info:
-                await manager.rollback_to_snapshot(
-                    repo_path=str(fake_repo),
-                    snapshot_ref="snapshot/edit-2026-01-01-0000",
-                    operation_id="abc123",
-                )
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager.rollback_to_snapshot(
+                repo_path=str(fake_repo),
+                snapshot_ref="snapshot/edit-2026-01-01-0000",
+                operation_id="abc123",
+            )
 
         assert exc_info.value.code == "snapshot_not_found"
 
-    @pytest.mark.asyncio
-    async def test_rollback_failed_on_checkout_error(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_rollback_failed_on_checkout_error(self, exec_manager, fake_repo, mock_exec):
         """Raises rollback_failed when checkout command fails."""
-        call_count = 0
-
-        async def mock_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            process = AsyncMock()
-
-            if call_count == 1:  # rev-parse --verify succeeds
-                process.returncode = 0
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-            else:  # checkout fails
-                process.returncode = 1
-                process.communicate = AsyncMock(return_value=(b"", b"error: pathspec '.' did not match"))
-
-            return process
+        mock_exec.side_effect = [
+            _FakeProc(stdout=b"abc123\n"),  # rev-parse --verify succeeds
+            _FakeProc(returncode=1, stderr=b"error: pathspec '.' did not match"),  # checkout
+        ]
 
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            with pytest.raises(GitCapabilityError) as exc_info:
-                await manager.rollback_to_snapshot(
-                    repo_path=str(fake_repo),
-                    snapshot_ref="snapshot/edit-2026-02-27-1430",
-                    operation_id="abc123",
-                )
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager.rollback_to_snapshot(
+                repo_path=str(fake_repo),
+                snapshot_ref="snapshot/edit-2026-02-27-1430",
+                operation_id="abc123",
+            )
 
         assert exc_info.value.code == "rollback_failed"
 
-    @pytest.mark.asyncio
-    async def test_commit_failed(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_commit_failed(self, exec_manager, fake_repo, mock_exec):
         """Raises commit_failed when commit command fails (not 'nothing to commit')."""
-        call_count = 0
-
-        async def mock_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            process = AsyncMock()
+        mock_exec.side_effect = [
+            _FakeProc(stdout=b"abc123\n"),  # rev-parse succeeds
+            _FakeProc(),  # checkout succeeds
+            # commit fails with real error
+            _FakeProc(returncode=1, stderr=b"fatal: unable to write new commit"),
+        ]
 
-            if call_count in (1, 2):  # rev-parse and checkout succeed
-                process.returncode = 0
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-            else:  # commit fails with real error
-                process.returncode = 1
-                process.communicate = AsyncMock(return_value=(b"", b"fatal: unable to write new commit"))
-
-            return process
-
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            with pytest.raises(GitCapabilityError) as exc_info:
-                await manager.rollback_to_snapshot(
-                    repo_path=str(fake_repo),
-                    snapshot_ref="snapshot/edit-2026-02-27-1430",
-                    operation_id="abc123",
-                )
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager.rollback_to_snapshot(
+                repo_path=str(fake_repo),
+                snapshot_ref="snapshot/edit-2026-02-27-1430",
+                operation_id="abc123",
+            )
 
         assert exc_info.value.code == "commit_failed"
 
-    @pytest.mark.asyncio
-    async def test_timeout_during_rollback(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_timeout_during_rollback(self, exec_manager, fake_repo, mock_exec):
         """Raises snapshot_timeout when rollback exceeds timeout."""
-        process = AsyncMock()
-        process.kill = MagicMock()
-        process.wait = AsyncMock()
-        process.communicate = AsyncMock(side_effect=asyncio.TimeoutError())
+        process = _FakeProc(hang=True)
+        mock_exec.return_value = process
 
-        with patch("asyncio.create_subprocess_exec", return_value=process):
-            with pytest.raises(GitCapabilityError) as exc_info:
-                await manager.rollback_to_snapshot(
-                    repo_path=str(fake_repo),
-                    snapshot_ref="snapshot/edit-2026-02-27-1430",
-                    operation_id="abc123",
-                    timeout_seconds=1,
-                )
+        with pytest.raises(GitCapabilityError) as exc_info:
+            await exec_manager.rollback_to_snapshot(
+                repo_path=str(fake_repo),
+                snapshot_ref="snapshot/edit-2026-02-27-1430",
+                operation_id="abc123",
+                timeout_seconds=0,
+            )
 
         assert exc_info.value.code == "snapshot_timeout"
         assert exc_info.value.retryable is True
+        assert process.killed
 
-    @pytest.mark.asyncio
-    async def test_no_changes_returns_current_head(self, manager, fake_repo):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_no_changes_returns_current_head(self, exec_manager, fake_repo, mock_exec):
         """When checkout produces no changes, returns current HEAD without error."""
-        call_count = 0
-
-        async def mock_exec(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            process = AsyncMock()
-
-            if call_count in (1, 2):  # rev-parse and checkout succeed
-                process.returncode = 0
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-            elif call_count == 3:  # commit fails with "nothing to commit"
-                process.returncode = 1
-                process.communicate = AsyncMock(return_value=(b"", b"nothing to commit, working tree clean"))
-            elif call_count == 4:  # rev-parse --short HEAD
-                process.returncode = 0
-                process.communicate = AsyncMock(return_value=(b"abc123\n", b""))
-
-            return process
-
-        with patch("asyncio.create_subprocess_exec", side_effect=mock_exec):
-            result = await manager.rollback_to_snapshot(
-                repo_path=str(fake_repo),
-                snapshot_ref="snapshot/edit-2026-02-27-1430",
-                operation_id="abc123",
-            )
+        mock_exec.side_effect = [
+            _FakeProc(stdout=b"abc123\n"),  # rev-parse succeeds
+            _FakeProc(),  # checkout succeeds
+            # commit fails with "nothing to commit"
+            _FakeProc(returncode=1, stderr=b"nothing to commit, working tree clean"),
+            _FakeProc(stdout=b"abc123\n"),  # rev-parse --short HEAD
+        ]
+
+        result = await exec_manager.rollback_to_snapshot(
+            repo_path=str(fake_repo),
+            snapshot_ref="snapshot/edit-2026-02-27-1430",
+            operation_id="abc123",
+        )
 
         assert result["snapshot_ref"] == "snapshot/edit-2026-02-27-1430"
         assert result["commit_hash"] == "abc123"
@@ -450,7 +524,7 @@ class TestRollbackToSnapshot:
 # ---------------------------------------------------------------------------
 
 class TestPruneSnapshots:
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_old_snapshots_success(self, manager, fake_repo):
         old_ref = "snapshot/edit-2020-01-01-0000"
         recent_ref = "snapshot/edit-2099-01-01-0000"
@@ -471,7 +545,7 @@ class TestPruneSnapshots:
         assert old_ref in result["pruned_refs"]
         assert result["retained_count"] == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_snapshots_with_retention_days_parameter(self, manager, fake_repo):
         old_ref = "snapshot/edit-2024-01-01-0000"
         with patch.object(
@@ -490,13 +564,13 @@ class TestPruneSnapshots:
         assert result["pruned_count"] == 1
         assert old_ref in result["pruned_refs"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_snapshots_with_no_snapshots(self, manager, fake_repo):
         with patch.object(manager, "_run_git_async", AsyncMock(return_value=(0, "", ""))):
             result = await manager.prune_snapshots(str(fake_repo))
         assert result == {"pruned_count": 0, "pruned_refs": [], "retained_count": 0}
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_snapshots_with_all_recent_snapshots(self, manager, fake_repo):
         recent_ref = "snapshot/edit-2099-12-31-2359"
         with patch.object(
@@ -513,7 +587,7 @@ class TestPruneSnapshots:
         assert result["pruned_count"] == 0
         assert result["retained_count"] == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_snapshots_skips_current_branch(self, manager, fake_repo):
         current_ref = "snapshot/edit-2020-01-01-0000"
         mock_run = AsyncMock(
@@ -528,7 +602,7 @@ class TestPruneSnapshots:
         assert result["retained_count"] == 1
         assert mock_run.await_count == 2
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_snapshots_handles_unparseable_branch_names(self, manager, fake_repo):
         bad_ref = "snapshot/edit-not-a-timestamp"
         with patch.object(
@@ -545,7 +619,7 @@ class TestPruneSnapshots:
         assert result["pruned_count"] == 0
         assert result["retained_count"] == 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_snapshots_timeout_handling(self, manager, fake_repo):
         with patch.object(
             manager,
@@ -563,7 +637,7 @@ class TestPruneSnapshots:
                 await manager.prune_snapshots(str(fake_repo), retention_days=30, timeout_seconds=1)
         assert exc_info.value.code == "prune_timeout"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_prune_snapshots_git_binary_not_found(self, manager, fake_repo):
         with patch.object(
             manager,
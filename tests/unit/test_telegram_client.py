@@ -7,7 +7,7 @@ Tests authentication, message handling, and response formatting.
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from src.sohnbot.gateway.telegram_client import TelegramClient
+from src.sohnbot.gateway.telegram_client import TelegramClient, _build_bot_request
 from src.sohnbot.gateway.formatters import format_for_telegram
 
 
@@ -22,7 +22,7 @@ class TestTelegramClient:
         return router
 
     @pytest.fixture
-    async def telegram_client(self, message_router):
+    def telegram_client(self, message_router):
         """Create TelegramClient with mocked dependencies."""
         client = TelegramClient(
             token="test_token",
@@ -42,7 +42,7 @@ class TestTelegramClient:
 
     # Authentication Tests
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_authorized_chat_id_accepted(self, telegram_client, mock_update, message_router):
         """Allowlisted chat ID processes message."""
         await telegram_client.handle_message(mock_update, None)
@@ -57,7 +57,7 @@ class TestTelegramClient:
         # Should send response
         mock_update.message.reply_text.assert_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_unauthorized_chat_id_blocked(self, telegram_client, mock_update, message_router):
         """Non-allowlisted chat ID silently ignored."""
         mock_update.effective_chat.id = 999999999  # Not in allowlist
@@ -70,7 +70,7 @@ class TestTelegramClient:
         # Should NOT send response
         mock_update.message.reply_text.assert_not_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_empty_allowlist_allows_all(self, message_router, mock_update):
         """Empty allowlist allows any chat ID."""
         client = TelegramClient(
@@ -84,7 +84,7 @@ class TestTelegramClient:
         # Should route to runtime
         message_router.route_to_runtime.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_unauthorized_logged_not_responded(self, telegram_client, mock_update, message_router):
         """Unauthorized attempts logged but no Telegram response."""
         mock_update.effective_chat.id = 999999999  # Not in allowlist
@@ -100,7 +100,7 @@ class TestTelegramClient:
 
     # Message Handling Tests
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_handle_message_routes_to_runtime(self, telegram_client, mock_update, message_router):
         """Message routed to agent session."""
         await telegram_client.handle_message(mock_update, None)
@@ -111,7 +111,7 @@ class TestTelegramClient:
             send_message=telegram_client.send_message,
         )
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_handle_message_formats_response(self, telegram_client, mock_update, message_router):
         """Response formatted for Telegram limits."""
         # Return long response
@@ -123,7 +123,7 @@ class TestTelegramClient:
         # Should split and send multiple messages
         assert mock_update.message.reply_text.call_count > 1
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_handle_message_error_handling(self, telegram_client, mock_update, message_router):
         """Exceptions return error message to user."""
         message_router.route_to_runtime.side_effect = Exception("Test error")
@@ -135,7 +135,7 @@ class TestTelegramClient:
         args = mock_update.message.reply_text.call_args[0]
         assert "error" in args[0].lower()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_handle_message_suppresses_empty_response(self, telegram_client, mock_update, message_router):
         """Empty runtime response should not produce a Telegram reply."""
         message_router.route_to_runtime.return_value = ""
@@ -144,7 +144,7 @@ class TestTelegramClient:
 
         mock_update.message.reply_text.assert_not_called()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_message_success(self, telegram_client):
         """Notification successfully sent."""
         telegram_client.application = AsyncMock()
@@ -155,7 +155,7 @@ class TestTelegramClient:
         assert result is True
         telegram_client.application.bot.send_message.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_send_message_failure_logged(self, telegram_client):
         """Failed sends logged with error."""
         telegram_client.application = AsyncMock()
@@ -169,7 +169,7 @@ class TestTelegramClient:
             assert result is False
             mock_logger.error.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_start_starts_notification_worker(self, message_router):
         """Client startup initializes polling and starts notification worker."""
         worker = AsyncMock()
@@ -190,17 +190,19 @@ class TestTelegramClient:
         app.add_handler = MagicMock()
         builder = MagicMock()
         builder.token.return_value = builder
+        builder.request.return_value = builder
         builder.build.return_value = app
 
         with patch("src.sohnbot.gateway.telegram_client.Application.builder", return_value=builder):
             await client.start()
 
+        builder.request.assert_called_once()
         worker.start.assert_called_once()
         app.initialize.assert_called_once()
         app.start.assert_called_once()
         app.updater.start_polling.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_stop_stops_notification_worker(self, message_router):
         """Client shutdown stops notification worker before app shutdown."""
         worker = AsyncMock()
@@ -221,6 +223,21 @@ class TestTelegramClient:
         client.application.shutdown.assert_called_once()
 
 
+class TestBotRequest:
+    """Test the pooled HTTP transport used for Bot API calls."""
+
+    def test_bot_request_pools_and_keeps_connections_alive(self):
+        """Connections outlive the notification poll interval and are pooled."""
+        with patch("src.sohnbot.gateway.telegram_client.HTTPXRequest") as request_cls:
+            _build_bot_request()
+
+        kwargs = request_cls.call_args.kwargs
+        assert kwargs["connection_pool_size"] >= 20
+        limits = kwargs["httpx_kwargs"]["limits"]
+        assert limits.max_keepalive_connections == kwargs["connection_pool_size"]
+        assert limits.keepalive_expiry > 5
+
+
 class TestFormatters:
     """Test message formatting functions."""
 
@@ -247,6 +264,20 @@ class TestFormatters:
         for msg in result:
             assert len(msg) <= 4096
 
+    def test_format_long_message_round_trips_lines(self):
+        """Chunks break only at newlines, so rejoining them restores the message."""
+        long_msg = "\n".join(f"Line {i}" * 100 for i in range(100))
+        result = format_for_telegram(long_msg)
+
+        assert "\n".join(result) == long_msg
+
+    def test_format_hard_cuts_overlong_line(self):
+        """A line longer than the limit is cut at exactly max_length."""
+        msg = "x" * 25 + "\nend"
+        result = format_for_telegram(msg, max_length=10)
+
+        assert result == ["x" * 10, "x" * 10, "xxxxx\nend"]
+
     def test_format_preserves_markdown(self):
         """Markdown formatting preserved."""
         msg = "**Bold** *italic* `code`"